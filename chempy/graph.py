@@ -129,7 +129,7 @@ class Edge(object):
 
 ################################################################################
 
-class Graph:
+class Graph(object):
     """
     A graph data type. The vertices of the graph are stored in a list
     `vertices`; this provides a consistent traversal order. The edges of the
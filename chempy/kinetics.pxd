@@ -49,7 +49,7 @@ cdef class KineticsModel:
     
     cpdef bint isPressureValid(self, double P) except -2
 
-    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist)
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
 
 ################################################################################
 
@@ -62,12 +62,30 @@ cdef class ArrheniusModel(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?)
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef changeT0(self, double T0)
 
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray klist, double T0=?)
 
 ################################################################################
 
+cdef class KineticsTable:
+
+    cdef public list models
+    cdef public numpy.ndarray A
+    cdef public numpy.ndarray n
+    cdef public numpy.ndarray Ea
+    cdef public numpy.ndarray T0
+
+    cpdef update(self, int index=?)
+
+    cpdef double getRateCoefficient(self, double T, int index)
+
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist)
+
+################################################################################
+
 cdef class ArrheniusEPModel(KineticsModel):
     
     cdef public double A
@@ -79,16 +97,47 @@ cdef class ArrheniusEPModel(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double dHrxn)
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray dHrxn=?)
+
+    cpdef ArrheniusModel toArrhenius(self, double dHrxn)
+
+################################################################################
+
+cdef class ArrheniusEPTable:
+
+    cdef public list models
+    cdef public numpy.ndarray A
+    cdef public numpy.ndarray n
+    cdef public numpy.ndarray E0
+    cdef public numpy.ndarray alpha
+
+    cpdef update(self, int index=?)
+
+    cpdef numpy.ndarray getActivationEnergies(self, dHrxn, indices=?)
+
+    cpdef numpy.ndarray getRateCoefficients(self, Tlist, dHrxn, indices=?)
+
+    cpdef KineticsTable toArrhenius(self, dHrxn, indices=?)
+
 ################################################################################
 
 cdef class PDepArrheniusModel(KineticsModel):
     
     cdef public list pressures
     cdef public list arrhenius
+    cdef list _sortedPressures
+    cdef numpy.ndarray _logPressures
+    cdef KineticsTable _table
+    cdef list _cachedPressures
+    cdef list _cachedArrhenius
+    
+    cpdef update(self)
     
-    cpdef tuple __getAdjacentExpressions(self, double P)
+    cpdef tuple __getAdjacentIndices(self, double P)
     
     cpdef double getRateCoefficient(self, double T, double P)
+    
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
 
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, double T0=?)
 
@@ -100,13 +149,91 @@ cdef class ChebyshevModel(KineticsModel):
     cdef public int degreeT
     cdef public int degreeP
     
-    cpdef double __chebyshev(self, double n, double x)
-    
     cpdef double __getReducedTemperature(self, double T)
     
     cpdef double __getReducedPressure(self, double P)
+
+    cpdef tuple __getBasisMatrices(self, Tlist, Plist, int degreeT, int degreeP)
+
+    cpdef numpy.ndarray getDesignMatrix(self, Tlist, Plist, int degreeT, int degreeP)
     
     cpdef double getRateCoefficient(self, double T, double P)
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K,
         int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax)
+
+################################################################################
+
+cdef class ThirdBodyModel(KineticsModel):
+
+    cdef public ArrheniusModel arrheniusLow
+    cdef public dict efficiencies
+
+    cpdef numpy.ndarray getEfficiencies(self, list speciesList)
+
+    cpdef double getColliderConcentration(self, dict conc, double totalConc=?)
+
+    cpdef double getRateCoefficient(self, double T, double P=?, double M=?)
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?, numpy.ndarray Mlist=?)
+
+################################################################################
+
+cdef class LindemannModel(ThirdBodyModel):
+
+    cdef public ArrheniusModel arrheniusHigh
+
+    cpdef getBroadeningFactor(self, T, Pr)
+
+    cpdef double getRateCoefficient(self, double T, double P=?, double M=?)
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?, numpy.ndarray Mlist=?)
+
+################################################################################
+
+cdef class TroeModel(LindemannModel):
+
+    cdef public double alpha
+    cdef public double T3
+    cdef public double T1
+    cdef public double T2
+
+    cpdef getBroadeningFactor(self, T, Pr)
+
+################################################################################
+
+cdef class TabulatedKineticsModel(KineticsModel):
+
+    cdef public KineticsModel model
+    cdef public int Tcount
+    cdef public int Pcount
+    cdef public str interpolation
+    cdef public numpy.ndarray logK
+    cdef public double errorEstimate
+    cdef public bint exact
+    cdef bint _cubic
+    cdef double _invTmin
+    cdef double _dInvT
+    cdef double _logPmin
+    cdef double _dlogP
+
+    cpdef update(self)
+
+    cpdef tuple __getInterpolationWeights(self, numpy.ndarray x, int count)
+
+    cpdef numpy.ndarray __interpolate(self, numpy.ndarray Tlist, Plist)
+
+    cpdef double getRateCoefficient(self, double T, double P=?)
+
+    cpdef double __interpolateRow(self, int i, int j, double w0, double w1, double w2, double w3)
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
+################################################################################
+
+cpdef list fitChebyshevModels(Tlist, Plist, Klist, int degreeT, int degreeP,
+    double Tmin, double Tmax, double Pmin, double Pmax, list models=?)
+
+cpdef tuple fitArrheniusModels(Tlist, K, double T0=?, list models=?)
@@ -35,8 +35,10 @@ All such models derive from the :class:`KineticsModel` base class.
 ################################################################################
 
 import math
+import bisect
 import numpy
 import numpy.linalg
+import numpy.polynomial.chebyshev
 import cython
 
 import constants
@@ -84,12 +86,21 @@ class KineticsModel:
         """
         return (self.Pmin <= P and P <= self.Pmax)
 
-    def getRateCoefficients(self, Tlist):
+    def getRateCoefficients(self, Tlist, Plist=None):
         """
         Return the rate coefficient k(T) in SI units at temperatures
-        `Tlist` in K.
+        `Tlist` in K. If pressures `Plist` in Pa are also given, the rate
+        coefficients k(T, P) are returned as a matrix with one row per
+        temperature and one column per pressure.
         """
-        return numpy.array([self.getRateCoefficient(T) for T in Tlist], numpy.float64)
+        cython.declare(K=numpy.ndarray, i=cython.int, j=cython.int)
+        if Plist is None:
+            return numpy.array([self.getRateCoefficient(T) for T in Tlist], numpy.float64)
+        K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
+        for i in range(len(Tlist)):
+            for j in range(len(Plist)):
+                K[i,j] = self.getRateCoefficient(Tlist[i], Plist[j])
+        return K
 
 ################################################################################
 
@@ -135,6 +146,26 @@ class ArrheniusModel(KineticsModel):
         """
         return self.A * (T / self.T0)** self.n * math.exp(-self.Ea / constants.R / T)
 
+    def getRateCoefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients k(T) in SI units at temperatures `Tlist`
+        in K, evaluated as a single array expression. `Tlist` must be a numpy
+        array with at least one dimension, but can otherwise have any shape
+        (e.g. a grid of temperatures); the result has the same shape. Use
+        :meth:`getRateCoefficient()` for a single temperature. If pressures
+        `Plist` in Pa are also given, a trailing axis is added with one entry
+        per pressure; since the Arrhenius expression is independent of
+        pressure, these entries are all identical.
+        """
+        cython.declare(klist=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if Tlist.ndim == 0:
+            raise InvalidKineticsModelError('An array of temperatures is required to evaluate the rate coefficients of an ArrheniusModel.')
+        klist = self.A * numpy.exp(self.n * numpy.log(Tlist / self.T0) - self.Ea / constants.R / Tlist)
+        if Plist is not None:
+            klist = klist[...,numpy.newaxis] * numpy.ones(len(Plist), numpy.float64)
+        return klist
+
     def changeT0(self, T0):
         """
         Changes the reference temperature used in the exponent to `T0`, and
@@ -150,22 +181,76 @@ class ArrheniusModel(KineticsModel):
         squares fit is used, which guarantees that the resulting parameters
         provide the best possible approximation to the data.
         """
-        import numpy.linalg
-        A = numpy.zeros((len(Tlist),3), numpy.float64)
-        A[:,0] = numpy.ones_like(Tlist)
-        A[:,1] = numpy.log(Tlist / T0)
-        A[:,2] = -1.0 / constants.R / Tlist
-        b = numpy.log(klist)
-        x = numpy.linalg.lstsq(A,b)[0]
-        
-        self.A = math.exp(x[0])
-        self.n = x[1]
-        self.Ea = x[2]
-        self.T0 = T0
+        fitArrheniusModels(Tlist, klist, T0, [self])
         return self
     
 ################################################################################
 
+class KineticsTable:
+    """
+    A table of many modified Arrhenius kinetics models, stored as contiguous
+    arrays of their parameters so that all of the rate coefficients can be
+    evaluated at once. The attributes are:
+
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `models`        :class:`list`           The :class:`ArrheniusModel` objects in the table
+    `A`             :class:`numpy.ndarray`  The preexponential factors in s^-1, m^3/mol*s, etc.
+    `n`             :class:`numpy.ndarray`  The temperature exponents
+    `Ea`            :class:`numpy.ndarray`  The activation energies in J/mol
+    `T0`            :class:`numpy.ndarray`  The reference temperatures in K
+    =============== ======================= ====================================
+
+    The parameter arrays are copies of the parameters of the models, so
+    :meth:`update()` must be called after any of the models is changed.
+    """
+
+    def __init__(self, models=None):
+        self.models = models or []
+        self.update()
+
+    def update(self, index=-1):
+        """
+        Refresh the parameter arrays from the kinetics models. If `index` is
+        given, only the model at that position in `models` is refreshed;
+        otherwise the arrays are rebuilt from all of the models.
+        """
+        cython.declare(model=ArrheniusModel)
+        if index < 0:
+            self.A = numpy.array([model.A for model in self.models], numpy.float64)
+            self.n = numpy.array([model.n for model in self.models], numpy.float64)
+            self.Ea = numpy.array([model.Ea for model in self.models], numpy.float64)
+            self.T0 = numpy.array([model.T0 for model in self.models], numpy.float64)
+        else:
+            model = self.models[index]
+            self.A[index] = model.A
+            self.n[index] = model.n
+            self.Ea[index] = model.Ea
+            self.T0[index] = model.T0
+
+    def getRateCoefficient(self, T, index):
+        """
+        Return the rate coefficient in SI units at temperature `T` in K of the
+        kinetics model at position `index` in the table, using the parameter
+        arrays.
+        """
+        return self.A[index] * (T / self.T0[index])**self.n[index] * math.exp(-self.Ea[index] / constants.R / T)
+
+    def getRateCoefficients(self, Tlist):
+        """
+        Return the rate coefficients in SI units of all of the kinetics models
+        in the table. If `Tlist` is a single temperature in K, an array with
+        one entry per model is returned; if it is an array of temperatures,
+        the result is a matrix with one row per temperature and one column
+        per model.
+        """
+        cython.declare(T=numpy.ndarray)
+        T = numpy.asarray(Tlist, numpy.float64)[...,numpy.newaxis]
+        return self.A * numpy.exp(self.n * numpy.log(T / self.T0) - self.Ea / constants.R / T)
+
+################################################################################
+
 class ArrheniusEPModel(KineticsModel):
     """
     Represent a set of modified Arrhenius kinetics with Evans-Polanyi data. The
@@ -214,7 +299,24 @@ class ArrheniusEPModel(KineticsModel):
         """
         Ea = cython.declare(cython.double)
         Ea = self.getActivationEnergy(dHrxn)
-        return self.A * (T ** self.n) * math.exp(-self.Ea / constants.R / T)
+        return self.A * (T ** self.n) * math.exp(-Ea / constants.R / T)
+
+    def getRateCoefficients(self, Tlist, dHrxn=None):
+        """
+        Return the rate coefficients k(T) in SI units at temperatures `Tlist`
+        in K for reactions having enthalpies of reaction `dHrxn` in J/mol,
+        both of which are arrays. The result is a matrix with one row per
+        temperature and one column per enthalpy of reaction (a single
+        enthalpy of reaction gives a single column). Use
+        :meth:`getRateCoefficient()` for a single temperature and enthalpy of
+        reaction.
+        """
+        cython.declare(T=numpy.ndarray, Ea=numpy.ndarray)
+        if dHrxn is None:
+            raise InvalidKineticsModelError('Enthalpies of reaction are required to evaluate an ArrheniusEPModel.')
+        Ea = self.E0 + self.alpha * numpy.atleast_1d(numpy.asarray(dHrxn, numpy.float64))
+        T = numpy.asarray(Tlist, numpy.float64)[...,numpy.newaxis]
+        return self.A * numpy.exp(self.n * numpy.log(T) - Ea / constants.R / T)
 
     def toArrhenius(self, dHrxn):
         """
@@ -226,6 +328,94 @@ class ArrheniusEPModel(KineticsModel):
 
 ################################################################################
 
+class ArrheniusEPTable:
+    """
+    A table of many Evans-Polanyi kinetics models, such as the rate rules of a
+    reaction family, stored as contiguous arrays of their parameters so that
+    the rate coefficients of many reactions estimated from them can be
+    evaluated at once. The attributes are:
+
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `models`        :class:`list`           The :class:`ArrheniusEPModel` objects in the table
+    `A`             :class:`numpy.ndarray`  The preexponential factors in s^-1, m^3/mol*s, etc.
+    `n`             :class:`numpy.ndarray`  The temperature exponents
+    `E0`            :class:`numpy.ndarray`  The activation energies at zero enthalpy of reaction in J/mol
+    `alpha`         :class:`numpy.ndarray`  The linear dependences of activation energy on enthalpy of reaction
+    =============== ======================= ====================================
+
+    Each reaction is described by its enthalpy of reaction and the index of
+    the model in the table to use for it; if no indices are given, the
+    reactions correspond one-to-one with the models. As with
+    :class:`KineticsTable`, :meth:`update()` must be called after any of the
+    models is changed.
+    """
+
+    def __init__(self, models=None):
+        self.models = models or []
+        self.update()
+
+    def update(self, index=-1):
+        """
+        Refresh the parameter arrays from the kinetics models. If `index` is
+        given, only the model at that position in `models` is refreshed;
+        otherwise the arrays are rebuilt from all of the models.
+        """
+        cython.declare(model=ArrheniusEPModel)
+        if index < 0:
+            self.A = numpy.array([model.A for model in self.models], numpy.float64)
+            self.n = numpy.array([model.n for model in self.models], numpy.float64)
+            self.E0 = numpy.array([model.E0 for model in self.models], numpy.float64)
+            self.alpha = numpy.array([model.alpha for model in self.models], numpy.float64)
+        else:
+            model = self.models[index]
+            self.A[index] = model.A
+            self.n[index] = model.n
+            self.E0[index] = model.E0
+            self.alpha[index] = model.alpha
+
+    def getActivationEnergies(self, dHrxn, indices=None):
+        """
+        Return the activation energies in J/mol of reactions having enthalpies
+        of reaction `dHrxn` in J/mol, using the models at positions `indices`
+        in the table.
+        """
+        if indices is None:
+            return self.E0 + self.alpha * numpy.asarray(dHrxn, numpy.float64)
+        return self.E0[indices] + self.alpha[indices] * numpy.asarray(dHrxn, numpy.float64)
+
+    def getRateCoefficients(self, Tlist, dHrxn, indices=None):
+        """
+        Return the rate coefficients in SI units of reactions having
+        enthalpies of reaction `dHrxn` in J/mol, using the models at positions
+        `indices` in the table. If `Tlist` is a single temperature in K, an
+        array with one entry per reaction is returned; if it is an array of
+        temperatures, the result is a matrix with one row per temperature and
+        one column per reaction.
+        """
+        cython.declare(T=numpy.ndarray, Ea=numpy.ndarray)
+        Ea = self.getActivationEnergies(dHrxn, indices)
+        T = numpy.asarray(Tlist, numpy.float64)[...,numpy.newaxis]
+        if indices is None:
+            return self.A * numpy.exp(self.n * numpy.log(T) - Ea / constants.R / T)
+        return self.A[indices] * numpy.exp(self.n[indices] * numpy.log(T) - Ea / constants.R / T)
+
+    def toArrhenius(self, dHrxn, indices=None):
+        """
+        Return a :class:`KineticsTable` of :class:`ArrheniusModel` objects,
+        one per reaction, obtained by using the enthalpies of reaction `dHrxn`
+        in J/mol to calculate the activation energies from the models at
+        positions `indices` in the table.
+        """
+        cython.declare(Ea=numpy.ndarray, A=numpy.ndarray, n=numpy.ndarray, i=cython.int)
+        Ea = self.getActivationEnergies(dHrxn, indices)
+        A = self.A if indices is None else self.A[indices]
+        n = self.n if indices is None else self.n[indices]
+        return KineticsTable([ArrheniusModel(A=A[i], n=n[i], Ea=Ea[i], T0=1.0) for i in range(len(Ea))])
+
+################################################################################
+
 class PDepArrheniusModel(KineticsModel):
     """
     A kinetic model of a phenomenological rate coefficient k(T, P) using the
@@ -243,34 +433,57 @@ class PDepArrheniusModel(KineticsModel):
     `arrhenius`     :class:`list`   The list of :class:`ArrheniusModel` objects at each pressure
     =============== =============== ============================================
     
+    The pressures need not be given in sorted order. Outside the range of
+    pressures, the expression at the nearest pressure is used. The pressures
+    and Arrhenius parameters are cached in sorted order, so :meth:`update()`
+    must be called after either list or any of the Arrhenius expressions is
+    modified in place; assigning new lists is detected automatically.
     """
 
     def __init__(self, pressures=None, arrhenius=None):
         KineticsModel.__init__(self)
         self.pressures = pressures or []
         self.arrhenius = arrhenius or []
+        self.update()
+
+    def update(self):
+        """
+        Refresh the cached pressure lookup data, which stores the pressures in
+        sorted order along with their logarithms and a :class:`KineticsTable`
+        of the corresponding Arrhenius expressions. This must be called after
+        the `pressures` or `arrhenius` lists or any of the Arrhenius
+        expressions are modified in place.
+        """
+        cython.declare(order=list, i=cython.int)
+        order = list(numpy.argsort(numpy.array(self.pressures, numpy.float64), kind='mergesort'))
+        self._sortedPressures = [float(self.pressures[i]) for i in order]
+        self._logPressures = numpy.log(numpy.array(self._sortedPressures, numpy.float64))
+        self._table = KineticsTable([self.arrhenius[i] for i in order])
+        self._cachedPressures = self.pressures
+        self._cachedArrhenius = self.arrhenius
 
-    def __getAdjacentExpressions(self, P):
+    def __getAdjacentIndices(self, P):
         """
-        Returns the pressures and ArrheniusModel expressions for the pressures that
-        most closely bound the specified pressure `P` in Pa.
+        Returns the indices into the sorted pressure data of the two pressures
+        that most closely bound the specified pressure `P` in Pa. The two
+        indices are equal if `P` matches one of the pressures exactly or lies
+        outside the range of pressures, in which case the nearest expression
+        is used.
         """
-        cython.declare(Plow=cython.double, Phigh=cython.double)
-        cython.declare(arrh=ArrheniusModel)
-        cython.declare(i=cython.int, ilow=cython.int, ihigh=cython.int)
+        cython.declare(i=cython.int, N=cython.int)
         
-        if P in self.pressures:
-            arrh = self.arrhenius[self.pressures.index(P)]
-            return P, P, arrh, arrh
+        if self._logPressures is None or self.pressures is not self._cachedPressures or self.arrhenius is not self._cachedArrhenius:
+            self.update()
+        N = len(self._sortedPressures)
+        if N == 0:
+            raise InvalidKineticsModelError('No Arrhenius expressions have been specified for this PDepArrheniusModel.')
+        i = bisect.bisect_right(self._sortedPressures, P)
+        if i == 0:
+            return 0, 0
+        elif i == N or self._sortedPressures[i-1] == P:
+            return i-1, i-1
         else:
-            ilow = 0; ihigh = -1; Plow = self.pressures[0]; Phigh = 0.0
-            for i in range(1, len(self.pressures)):
-                if self.pressures[i] <= P:
-                    ilow = i; Plow = P
-                if self.pressures[i] > P and ihigh is None:
-                    ihigh = i; Phigh = P
-            
-            return Plow, Phigh, self.arrhenius[ilow], self.arrhenius[ihigh]
+            return i-1, i
     
     def getRateCoefficient(self, T, P):
         """
@@ -278,34 +491,57 @@ class PDepArrheniusModel(KineticsModel):
         `Tlist` in K and pressure `P` in Pa by evaluating the pressure-
         dependent Arrhenius expression.
         """
-        cython.declare(Plow=cython.double, Phigh=cython.double)
-        cython.declare(alow=ArrheniusModel, ahigh=ArrheniusModel)
-        cython.declare(j=cython.int, klist=cython.double, klow=cython.double, khigh=cython.double)
+        cython.declare(ilow=cython.int, ihigh=cython.int)
+        cython.declare(klow=cython.double, khigh=cython.double, logPlow=cython.double, logPhigh=cython.double)
         
-        k = 0.0
-        Plow, Phigh, alow, ahigh = self.__getAdjacentExpressions(P)
-        if Plow == Phigh:
-            k = alow.getRateCoefficient(T)
-        else:
-            klow = alow.getRateCoefficient(T)
-            khigh = ahigh.getRateCoefficient(T)
-            k = 10**(math.log10(P/Plow)/math.log10(Phigh/Plow)*math.log10(khigh/klow))
-        return k
+        ilow, ihigh = self.__getAdjacentIndices(P)
+        klow = self._table.getRateCoefficient(T, ilow)
+        if ilow == ihigh:
+            return klow
+        khigh = self._table.getRateCoefficient(T, ihigh)
+        logPlow = self._logPressures[ilow]; logPhigh = self._logPressures[ihigh]
+        return klow * (khigh / klow)**((math.log(P) - logPlow) / (logPhigh - logPlow))
+
+    def getRateCoefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients k(T, P) in SI units at each combination
+        of the temperatures `Tlist` in K and pressures `Plist` in Pa as a
+        matrix with one row per temperature and one column per pressure (a
+        single pressure gives a single column). All
+        of the Arrhenius expressions are evaluated at once, and the
+        interpolation in log pressure is applied across the whole grid.
+        """
+        cython.declare(logK=numpy.ndarray, logP=numpy.ndarray, ilow=numpy.ndarray, ihigh=numpy.ndarray)
+        cython.declare(dlogP=numpy.ndarray, frac=numpy.ndarray, N=cython.int)
+        
+        if Plist is None:
+            raise InvalidKineticsModelError('A list of pressures is required to evaluate a PDepArrheniusModel.')
+        if self._logPressures is None or self.pressures is not self._cachedPressures or self.arrhenius is not self._cachedArrhenius:
+            self.update()
+        N = len(self._sortedPressures)
+        if N == 0:
+            raise InvalidKineticsModelError('No Arrhenius expressions have been specified for this PDepArrheniusModel.')
+        
+        logK = numpy.log(self._table.getRateCoefficients(numpy.asarray(Tlist, numpy.float64)))
+        logP = numpy.log(numpy.atleast_1d(numpy.asarray(Plist, numpy.float64)))
+        ilow = numpy.clip(numpy.searchsorted(self._logPressures, logP, side='right') - 1, 0, N - 1)
+        ihigh = numpy.minimum(ilow + 1, N - 1)
+        dlogP = self._logPressures[ihigh] - self._logPressures[ilow]
+        dlogP[dlogP == 0] = 1.0
+        frac = numpy.clip((logP - self._logPressures[ilow]) / dlogP, 0.0, 1.0)
+        return numpy.exp(logK[:,ilow] * (1.0 - frac) + logK[:,ihigh] * frac)
 
     def fitToData(self, Tlist, Plist, K, T0=298.0):
         """
         Fit the pressure-dependent Arrhenius model to a matrix of rate
         coefficient data `K` corresponding to a set of temperatures `Tlist` in
         K and pressures `Plist` in Pa. An Arrhenius model is fit at each
-        pressure.
+        pressure; all of these fits are done at once using
+        :func:`fitArrheniusModels()`.
         """
-        cython.declare(i=cython.int)
         self.pressures = list(Plist)
-        self.arrhenius = []
-        for i in range(len(Plist)):
-            arrhenius = ArrheniusModel()
-            arrhenius.fitToData(Tlist, K[:,i], T0)
-            self.arrhenius.append(arrhenius)
+        self.arrhenius = fitArrheniusModels(Tlist, K, T0)[0]
+        self.update()
 
 ################################################################################
 
@@ -348,32 +584,6 @@ class ChebyshevModel(KineticsModel):
             self.degreeT = 0
             self.degreeP = 0
 
-    def __chebyshev(self, n, x):
-        if n == 0:
-            return 1
-        elif n == 1:
-            return x
-        elif n == 2:
-            return -1 + 2*x*x
-        elif n == 3:
-            return x * (-3 + 4*x*x)
-        elif n == 4:
-            return 1 + x*x*(-8 + 8*x*x)
-        elif n == 5:
-            return x * (5 + x*x*(-20 + 16*x*x))
-        elif n == 6:
-            return -1 + x*x*(18 + x*x*(-48 + 32*x*x))
-        elif n == 7:
-            return x * (-7 + x*x*(56 + x*x*(-112 + 64*x*x)))
-        elif n == 8:
-            return 1 + x*x*(-32 + x*x*(160 + x*x*(-256 + 128*x*x)))
-        elif n == 9:
-            return x * (9 + x*x*(-120 + x*x*(432 + x*x*(-576 + 256*x*x))))
-        elif cython.compiled:
-            return cos(n * acos(x))
-        else:
-            return math.cos(n * math.acos(x))
-
     def __getReducedTemperature(self, T):
         return (2.0/T - 1.0/self.Tmin - 1.0/self.Tmax) / (1.0/self.Tmax - 1.0/self.Tmin)
     
@@ -383,24 +593,69 @@ class ChebyshevModel(KineticsModel):
         else:
             return (2.0*math.log(P) - math.log(self.Pmin) - math.log(self.Pmax)) / (math.log(self.Pmax) - math.log(self.Pmin))
     
+    def __getBasisMatrices(self, Tlist, Plist, degreeT, degreeP):
+        """
+        Return the Chebyshev Vandermonde matrices for the reduced temperatures
+        corresponding to `Tlist` in K and the reduced pressures corresponding
+        to `Plist` in Pa, with `degreeT` and `degreeP` columns, respectively.
+        Element (i, t) of the first is the Chebyshev polynomial of degree `t`
+        evaluated at the `i`-th reduced temperature, and likewise for the
+        second.
+        """
+        cython.declare(Tred=numpy.ndarray, Pred=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Plist = numpy.asarray(Plist, numpy.float64)
+        Tred = (2.0/Tlist - 1.0/self.Tmin - 1.0/self.Tmax) / (1.0/self.Tmax - 1.0/self.Tmin)
+        Pred = (2.0*numpy.log(Plist) - math.log(self.Pmin) - math.log(self.Pmax)) / (math.log(self.Pmax) - math.log(self.Pmin))
+        return (numpy.polynomial.chebyshev.chebvander(Tred, degreeT - 1),
+            numpy.polynomial.chebyshev.chebvander(Pred, degreeP - 1))
+
+    def getDesignMatrix(self, Tlist, Plist, degreeT, degreeP):
+        """
+        Return the matrix used to fit a Chebyshev kinetic model with `degreeT`
+        and `degreeP` terms to rate coefficients at temperatures `Tlist` in K
+        and pressures `Plist` in Pa. The rows correspond to the (T, P) pairs,
+        with the temperature index varying fastest, and the columns to the
+        coefficients, with the temperature degree varying fastest; the matrix
+        is therefore the Kronecker product of the pressure and temperature
+        Chebyshev Vandermonde matrices.
+        """
+        cython.declare(phiT=numpy.ndarray, phiP=numpy.ndarray)
+        phiT, phiP = self.__getBasisMatrices(Tlist, Plist, degreeT, degreeP)
+        return numpy.kron(phiP, phiT)
+
     def getRateCoefficient(self, T, P):
         """
         Return the rate constant k(T, P) in SI units at a temperature 
         `Tlist` in K and pressure `P` in Pa by evaluating the Chebyshev 
-        expression.
+        expression. The double sum is evaluated using Clenshaw's recurrence
+        in each direction, so no Chebyshev polynomial is computed more than
+        once.
         """
         
         cython.declare(Tred=cython.double, Pred=cython.double, k=cython.double)
-        cython.declare(i=cython.int, j=cython.int, t=cython.int, p=cython.int)
         
-        k = 0.0
         Tred = self.__getReducedTemperature(T)
         Pred = self.__getReducedPressure(P)
-        for t in range(self.degreeT):
-            for p in range(self.degreeP):
-                k += self.coeffs[t,p] * self.__chebyshev(t, Tred) * self.__chebyshev(p, Pred)
+        k = numpy.polynomial.chebyshev.chebval2d(Tred, Pred, self.coeffs)
         return 10.0**k
 
+    def getRateCoefficients(self, Tlist, Plist=None):
+        """
+        Return the rate constants k(T, P) in SI units at temperatures `Tlist`
+        in K and pressures `Plist` in Pa, as a matrix with one row per
+        temperature and one column per pressure. The Chebyshev polynomials
+        are evaluated once for each reduced temperature and pressure, and
+        the full grid is then obtained from a single matrix product.
+        """
+        
+        cython.declare(phiT=numpy.ndarray, phiP=numpy.ndarray)
+        
+        if Plist is None:
+            raise InvalidKineticsModelError('A list of pressures is required to evaluate a ChebyshevModel.')
+        phiT, phiP = self.__getBasisMatrices(Tlist, Plist, self.degreeT, self.degreeP)
+        return 10.0**numpy.dot(numpy.dot(phiT, self.coeffs), phiP.T)
+
     def fitToData(self, Tlist, Plist, K, degreeT, degreeP, Tmin, Tmax, Pmin, Pmax):
         """
         Fit a Chebyshev kinetic model to a set of rate coefficients `K`, which
@@ -410,40 +665,512 @@ class ChebyshevModel(KineticsModel):
         set the edges of the valid temperature and pressure ranges in K and Pa,
         respectively.
         """
+        fitChebyshevModels(Tlist, Plist, [K], degreeT, degreeP, Tmin, Tmax, Pmin, Pmax, [self])
+        return self
+
+################################################################################
+
+class ThirdBodyModel(KineticsModel):
+    """
+    A kinetic model of a phenomenological rate coefficient k(T, P) for a
+    reaction involving a third body, using the expression
 
-        cython.declare(nT=cython.int, nP=cython.int, Tred=list, Pred=list)
-        cython.declare(A=numpy.ndarray, b=numpy.ndarray)
-        cython.declare(t1=cython.int, p1=cython.int, t2=cython.int, p2=cython.int)
-        cython.declare(T=cython.double, P=cython.double)
+    .. math:: k(T,P) = k_0(T) [\\mathrm{M}]
 
-        nT = len(Tlist); nP = len(Plist)
+    where :math:`k_0(T)` is a modified Arrhenius expression and
+    :math:`[\\mathrm{M}] = \\sum_i \\epsilon_i C_i` is the effective
+    concentration of the third body, in which each species :math:`i` is
+    weighted by its collision efficiency :math:`\\epsilon_i`. If no species
+    concentrations are available, the total concentration :math:`P/RT` of an
+    ideal gas is used. The attributes are:
 
-        self.degreeT = degreeT; self.degreeP = degreeP
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `arrheniusLow`  :class:`ArrheniusModel` The Arrhenius kinetics in the low-pressure limit
+    `efficiencies`  :class:`dict`           The collision efficiencies of species that differ from unity
+    =============== ======================= ====================================
+    
+    """
+
+    def __init__(self, arrheniusLow=None, efficiencies=None, Tmin=0.0, Tmax=1.0e10, Pmin=0.0, Pmax=1.0e100, comment=''):
+        KineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, comment=comment)
+        self.arrheniusLow = arrheniusLow
+        self.efficiencies = efficiencies or {}
 
-        # Set temperature and pressure ranges
-        self.Tmin = Tmin; self.Tmax = Tmax
-        self.Pmin = Pmin; self.Pmax = Pmax
+    def getEfficiencies(self, speciesList):
+        """
+        Return an array of the collision efficiencies of each species in
+        `speciesList`. Species without an explicit efficiency have an
+        efficiency of one.
+        """
+        return numpy.array([self.efficiencies.get(spec, 1.0) for spec in speciesList], numpy.float64)
 
-        # Calculate reduced temperatures and pressures
-        Tred = [self.__getReducedTemperature(T) for T in Tlist]
-        Pred = [self.__getReducedPressure(P) for P in Plist]
+    def getColliderConcentration(self, conc, totalConc=-1.0):
+        """
+        Return the effective concentration of the third body in mol/m^3. The
+        parameter `conc` is a map with species as keys and concentrations as
+        values. If passed a `totalConc`, it won't bother recalculating it.
+        """
+        cython.declare(M=cython.double, efficiency=cython.double)
+        M = totalConc if totalConc >= 0.0 else sum(conc.values())
+        for spec, efficiency in self.efficiencies.iteritems():
+            if spec in conc:
+                M += (efficiency - 1.0) * conc[spec]
+        return M
+
+    def getRateCoefficient(self, T, P=1e5, M=-1.0):
+        """
+        Return the rate coefficient k(T, P) in SI units at temperature `T` in K
+        and pressure `P` in Pa. The effective concentration of the third body
+        `M` in mol/m^3 is used if given; otherwise it is computed from `P`.
+        """
+        if M < 0.0: M = P / constants.R / T
+        return self.arrheniusLow.getRateCoefficient(T) * M
+
+    def getRateCoefficients(self, Tlist, Plist=None, Mlist=None):
+        """
+        Return the rate coefficients k(T, P) in SI units at temperatures
+        `Tlist` in K. If the effective third-body concentrations `Mlist` in
+        mol/m^3 are given, they are broadcast against `Tlist` (so that arrays
+        of the same shape give one rate coefficient per state); otherwise the
+        rate coefficients are returned as a matrix with one row per
+        temperature and one column per pressure in `Plist`.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if Mlist is None:
+            if Plist is None:
+                raise InvalidKineticsModelError('Either pressures or third-body concentrations are required to evaluate a %s.' % (self.__class__.__name__))
+            Tlist = Tlist[:,numpy.newaxis]
+            Mlist = numpy.asarray(Plist, numpy.float64) / constants.R / Tlist
+        return self.arrheniusLow.getRateCoefficients(Tlist) * Mlist
+
+################################################################################
+
+class LindemannModel(ThirdBodyModel):
+    """
+    A kinetic model of a phenomenological rate coefficient k(T, P) in the
+    falloff region between the low- and high-pressure limits, using the
+    Lindemann expression
 
-        # Create matrix and vector for coefficient fit (linear least-squares)
-        A = numpy.zeros((nT*nP, degreeT*degreeP), numpy.float64)
-        b = numpy.zeros((nT*nP), numpy.float64)
-        for t1, T in enumerate(Tred):
-            for p1, P in enumerate(Pred):
-                for t2 in range(degreeT):
-                    for p2 in range(degreeP):
-                        A[p1*nT+t1, p2*degreeT+t2] = self.__chebyshev(t2, T) * self.__chebyshev(p2, P)
-                b[p1*nT+t1] = math.log10(K[t1,p1])
+    .. math:: k(T,P) = k_\\infty(T) \\left( \\frac{P_\\mathrm{r}}{1 + P_\\mathrm{r}} \\right) F
 
-        # Do linear least-squares fit to get coefficients
-        x, residues, rank, s = numpy.linalg.lstsq(A, b)
+    where :math:`P_\\mathrm{r} = k_0(T) [\\mathrm{M}] / k_\\infty(T)` is the
+    reduced pressure, :math:`k_0(T)` and :math:`k_\\infty(T)` are modified
+    Arrhenius expressions for the low- and high-pressure limits, and the
+    broadening factor :math:`F` is unity. The effective concentration of the
+    third body :math:`[\\mathrm{M}]` is determined as in
+    :class:`ThirdBodyModel`. The attributes are:
 
-        # Extract coefficients
-        self.coeffs = numpy.zeros((degreeT,degreeP), numpy.float64)
-        for t2 in range(degreeT):
-            for p2 in range(degreeP):
-                self.coeffs[t2,p2] = x[p2*degreeT+t2]
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `arrheniusHigh` :class:`ArrheniusModel` The Arrhenius kinetics in the high-pressure limit
+    `arrheniusLow`  :class:`ArrheniusModel` The Arrhenius kinetics in the low-pressure limit
+    `efficiencies`  :class:`dict`           The collision efficiencies of species that differ from unity
+    =============== ======================= ====================================
     
+    """
+
+    def __init__(self, arrheniusHigh=None, arrheniusLow=None, efficiencies=None, Tmin=0.0, Tmax=1.0e10, Pmin=0.0, Pmax=1.0e100, comment=''):
+        ThirdBodyModel.__init__(self, arrheniusLow=arrheniusLow, efficiencies=efficiencies, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, comment=comment)
+        self.arrheniusHigh = arrheniusHigh
+
+    def getBroadeningFactor(self, T, Pr):
+        """
+        Return the broadening factor F at temperature `T` in K and reduced
+        pressure `Pr`, which may be scalars or arrays that broadcast against
+        one another. For the Lindemann expression this is always unity.
+        """
+        return numpy.ones_like(numpy.asarray(T, numpy.float64) * numpy.asarray(Pr, numpy.float64))
+
+    def getRateCoefficient(self, T, P=1e5, M=-1.0):
+        """
+        Return the rate coefficient k(T, P) in SI units at temperature `T` in K
+        and pressure `P` in Pa. The effective concentration of the third body
+        `M` in mol/m^3 is used if given; otherwise it is computed from `P`.
+        """
+        cython.declare(k0=cython.double, kinf=cython.double, Pr=cython.double)
+        if M < 0.0: M = P / constants.R / T
+        k0 = self.arrheniusLow.getRateCoefficient(T)
+        kinf = self.arrheniusHigh.getRateCoefficient(T)
+        Pr = k0 * M / kinf
+        return kinf * (Pr / (1.0 + Pr)) * float(self.getBroadeningFactor(T, Pr))
+
+    def getRateCoefficients(self, Tlist, Plist=None, Mlist=None):
+        """
+        Return the rate coefficients k(T, P) in SI units at temperatures
+        `Tlist` in K. If the effective third-body concentrations `Mlist` in
+        mol/m^3 are given, they are broadcast against `Tlist` (so that arrays
+        of the same shape give one rate coefficient per state); otherwise the
+        rate coefficients are returned as a matrix with one row per
+        temperature and one column per pressure in `Plist`.
+        """
+        cython.declare(T=numpy.ndarray, kinf=numpy.ndarray, Pr=numpy.ndarray)
+        T = numpy.asarray(Tlist, numpy.float64)
+        if Mlist is None: T = T[:,numpy.newaxis]
+        kinf = self.arrheniusHigh.getRateCoefficients(T)
+        Pr = ThirdBodyModel.getRateCoefficients(self, Tlist, Plist, Mlist) / kinf
+        return kinf * (Pr / (1.0 + Pr)) * self.getBroadeningFactor(T, Pr)
+
+################################################################################
+
+class TroeModel(LindemannModel):
+    """
+    A kinetic model of a phenomenological rate coefficient k(T, P) in the
+    falloff region between the low- and high-pressure limits, using the
+    Lindemann expression of :class:`LindemannModel` with the Troe broadening
+    factor
+
+    .. math:: \\log F = \\left\\{1 + \\left[ \\frac{\\log P_\\mathrm{r} + c}{n - d (\\log P_\\mathrm{r} + c)} \\right]^2 \\right\\}^{-1} \\log F_\\mathrm{cent}
+
+    .. math:: F_\\mathrm{cent} = (1 - \\alpha) \\exp \\left( -T/T_3 \\right) + \\alpha \\exp \\left( -T/T_1 \\right) + \\exp \\left( -T_2/T \\right)
+
+    where :math:`c = -0.4 - 0.67 \\log F_\\mathrm{cent}`,
+    :math:`n = 0.75 - 1.27 \\log F_\\mathrm{cent}`, :math:`d = 0.14`, and
+    all logarithms are base ten. The attributes are:
+
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `arrheniusHigh` :class:`ArrheniusModel` The Arrhenius kinetics in the high-pressure limit
+    `arrheniusLow`  :class:`ArrheniusModel` The Arrhenius kinetics in the low-pressure limit
+    `efficiencies`  :class:`dict`           The collision efficiencies of species that differ from unity
+    `alpha`         :class:`float`          The Troe parameter :math:`\\alpha`
+    `T3`            :class:`float`          The Troe parameter :math:`T_3` in K, or zero to omit the first term of :math:`F_\\mathrm{cent}`
+    `T1`            :class:`float`          The Troe parameter :math:`T_1` in K, or zero to omit the second term of :math:`F_\\mathrm{cent}`
+    `T2`            :class:`float`          The Troe parameter :math:`T_2` in K, or zero to omit the last term of :math:`F_\\mathrm{cent}`
+    =============== ======================= ====================================
+    
+    """
+
+    def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=0.0, T1=0.0, T2=0.0, efficiencies=None, Tmin=0.0, Tmax=1.0e10, Pmin=0.0, Pmax=1.0e100, comment=''):
+        LindemannModel.__init__(self, arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, efficiencies=efficiencies, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, comment=comment)
+        self.alpha = alpha
+        self.T3 = T3
+        self.T1 = T1
+        self.T2 = T2
+
+    def getBroadeningFactor(self, T, Pr):
+        """
+        Return the Troe broadening factor F at temperature `T` in K and reduced
+        pressure `Pr`, which may be scalars or arrays that broadcast against
+        one another.
+        """
+        cython.declare(logFcent=numpy.ndarray, logPr=numpy.ndarray, c=numpy.ndarray, n=numpy.ndarray)
+        T = numpy.asarray(T, numpy.float64)
+        Fcent = numpy.zeros_like(T)
+        if self.T3 != 0.0:
+            Fcent = Fcent + (1.0 - self.alpha) * numpy.exp(-T / self.T3)
+        if self.T1 != 0.0:
+            Fcent = Fcent + self.alpha * numpy.exp(-T / self.T1)
+        if self.T2 != 0.0:
+            Fcent = Fcent + numpy.exp(-self.T2 / T)
+        logFcent = numpy.log10(Fcent)
+        logPr = numpy.log10(numpy.maximum(Pr, 1.0e-300))
+        c = -0.4 - 0.67 * logFcent
+        n = 0.75 - 1.27 * logFcent
+        return 10.0**(logFcent / (1.0 + ((logPr + c) / (n - 0.14 * (logPr + c)))**2))
+
+################################################################################
+
+class TabulatedKineticsModel(KineticsModel):
+    """
+    A kinetic model that approximates another kinetic model by tabulating
+    :math:`\\ln k` on a uniform grid in inverse temperature (and, for
+    pressure-dependent models, in log pressure) and interpolating in the
+    table. This makes the cost of evaluating k(T, P) independent of the form
+    of the underlying model, which is useful for expensive models such as
+    :class:`ChebyshevModel` or :class:`PDepArrheniusModel` in inner loops.
+    The attributes are:
+
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `model`         :class:`KineticsModel`  The kinetics model being tabulated
+    `Tcount`        :class:`int`            The number of temperatures in the table
+    `Pcount`        :class:`int`            The number of pressures in the table
+    `interpolation` :class:`str`            The interpolation scheme, ``'linear'`` or ``'cubic'``
+    `logK`          :class:`numpy.ndarray`  The tabulated values of :math:`\\ln k`
+    `errorEstimate` :class:`float`          The estimated maximum interpolation error in :math:`\\ln k`
+    `exact`         :class:`bool`           :data:`True` to bypass the table and evaluate `model` directly
+    =============== ======================= ====================================
+
+    The model is tabulated between `Tmin` and `Tmax`, and between `Pmin` and
+    `Pmax` if `Pcount` is greater than one; otherwise it is treated as
+    independent of pressure. Linear interpolation uses the two nearest grid
+    points in each direction, and has an error of about :math:`h^2 |f''| / 8`
+    for grid spacing :math:`h`. Cubic interpolation uses the Lagrange
+    polynomial through the four nearest grid points in each direction, and
+    has an error that decreases as :math:`h^4`, so a much coarser table gives
+    the same accuracy, at about twice the cost per evaluation. Cubic
+    interpolation is only worthwhile for smooth models; it overshoots near
+    the kinks in :math:`\ln k` of a :class:`PDepArrheniusModel`, which is
+    linear between its pressures.
+
+    The interpolation error is estimated by comparing the table to the model
+    on a grid twice as fine as the table, which includes the midpoints between
+    the grid points, where the error of linear interpolation is largest. This
+    is an estimate rather than a strict bound; the error elsewhere may be
+    slightly larger, particularly for cubic interpolation.
+    Outside the tabulated range, or if `exact` is set, the underlying model is
+    evaluated instead. The table must be rebuilt using :meth:`update()` if
+    the underlying model is changed.
+    """
+
+    def __init__(self, model=None, Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, Tcount=200, Pcount=0, interpolation='linear', exact=False):
+        KineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax)
+        self.model = model
+        self.Tcount = Tcount
+        self.Pcount = Pcount
+        self.interpolation = interpolation
+        self.exact = exact
+        self.logK = None
+        self.errorEstimate = 0.0
+        if model is not None:
+            self.update()
+
+    def update(self):
+        """
+        Evaluate the underlying kinetics model on the grid of inverse
+        temperatures and log pressures and store the values of
+        :math:`\\ln k`, along with an estimate of the interpolation error.
+        """
+        cython.declare(Tlist=numpy.ndarray, Plist=numpy.ndarray, logKfine=numpy.ndarray, count=cython.int)
+        
+        if self.interpolation.lower() == 'linear':
+            self._cubic = False
+            count = 2
+        elif self.interpolation.lower() == 'cubic':
+            self._cubic = True
+            count = 4
+        else:
+            raise InvalidKineticsModelError('Invalid interpolation scheme "%s"; should be "linear" or "cubic".' % self.interpolation)
+        if self.Tcount < count or (self.Pcount > 1 and self.Pcount < count):
+            raise InvalidKineticsModelError('At least %i temperatures and pressures are required for %s interpolation.' % (count, self.interpolation.lower()))
+        
+        self._invTmin = 1.0 / self.Tmax
+        self._dInvT = (1.0 / self.Tmin - 1.0 / self.Tmax) / (self.Tcount - 1)
+        Tlist = 1.0 / (self._invTmin + self._dInvT * numpy.arange(self.Tcount))
+        if self.Pcount > 1:
+            self._logPmin = math.log(self.Pmin)
+            self._dlogP = (math.log(self.Pmax) - math.log(self.Pmin)) / (self.Pcount - 1)
+            Plist = numpy.exp(self._logPmin + self._dlogP * numpy.arange(self.Pcount))
+            self.logK = numpy.log(self.model.getRateCoefficients(Tlist, Plist))
+        else:
+            self._logPmin = 0.0
+            self._dlogP = 0.0
+            self.logK = numpy.log(self.model.getRateCoefficients(Tlist)).reshape((self.Tcount, 1))
+        
+        # Estimate the maximum interpolation error by comparing the model to
+        # the interpolated values on a grid twice as fine as the table
+        Tlist = 1.0 / (self._invTmin + 0.5 * self._dInvT * numpy.arange(2 * self.Tcount - 1))
+        if self.Pcount > 1:
+            Plist = numpy.exp(self._logPmin + 0.5 * self._dlogP * numpy.arange(2 * self.Pcount - 1))
+            logKfine = numpy.log(self.model.getRateCoefficients(Tlist, Plist))
+        else:
+            Plist = None
+            logKfine = numpy.log(self.model.getRateCoefficients(Tlist)).reshape((-1, 1))
+        self.errorEstimate = numpy.max(numpy.abs(logKfine - self.__interpolate(Tlist, Plist)))
+
+    def __getInterpolationWeights(self, x, count):
+        """
+        Return the index of the first grid point used to interpolate at each
+        of the (fractional) grid coordinates `x`, in a grid of `count` points,
+        and a matrix of the corresponding interpolation weights, with one row
+        per coordinate and one column per grid point used.
+        """
+        cython.declare(start=numpy.ndarray, weights=numpy.ndarray)
+        if self._cubic:
+            start = numpy.clip(x.astype(numpy.int64) - 1, 0, count - 4)
+            x = x - start - 1
+            weights = numpy.array([-x * (x - 1) * (x - 2) / 6, (x + 1) * (x - 1) * (x - 2) / 2,
+                -(x + 1) * x * (x - 2) / 2, (x + 1) * x * (x - 1) / 6]).T
+        else:
+            start = numpy.minimum(x.astype(numpy.int64), count - 2)
+            x = x - start
+            weights = numpy.array([1.0 - x, x]).T
+        return start, weights
+
+    def __interpolate(self, Tlist, Plist):
+        """
+        Return the interpolated values of :math:`\\ln k` at temperatures
+        `Tlist` in K and pressures `Plist` in Pa as a matrix with one row per
+        temperature and one column per pressure, or with a single column if
+        the table is independent of pressure.
+        """
+        cython.declare(i=numpy.ndarray, j=numpy.ndarray, wT=numpy.ndarray, wP=numpy.ndarray, logK=numpy.ndarray)
+        cython.declare(a=cython.int, b=cython.int)
+        
+        i, wT = self.__getInterpolationWeights((1.0 / Tlist - self._invTmin) / self._dInvT, self.Tcount)
+        if self.Pcount > 1:
+            j, wP = self.__getInterpolationWeights((numpy.log(Plist) - self._logPmin) / self._dlogP, self.Pcount)
+        else:
+            j = numpy.zeros(1, numpy.int64); wP = numpy.ones((1, 1), numpy.float64)
+        logK = numpy.zeros((len(Tlist), len(j)), numpy.float64)
+        for a in range(wT.shape[1]):
+            for b in range(wP.shape[1]):
+                logK += wT[:,a:a+1] * wP[:,b] * self.logK[(i+a)[:,numpy.newaxis],j+b]
+        return logK
+
+    def getRateCoefficient(self, T, P=1e5):
+        """
+        Return the rate coefficient k(T, P) in SI units at temperature `T` in K
+        and pressure `P` in Pa by interpolating in the table.
+        """
+        cython.declare(x=cython.double, y=cython.double, i=cython.int, j=cython.int, logk=cython.double)
+        cython.declare(wT0=cython.double, wT1=cython.double, wT2=cython.double, wT3=cython.double)
+        cython.declare(wP0=cython.double, wP1=cython.double, wP2=cython.double, wP3=cython.double)
+        
+        if self.exact or T < self.Tmin or T > self.Tmax or (self.Pcount > 1 and (P < self.Pmin or P > self.Pmax)):
+            return self.model.getRateCoefficient(T, P)
+        
+        x = (1.0 / T - self._invTmin) / self._dInvT
+        if self._cubic:
+            i = min(max(int(x) - 1, 0), self.Tcount - 4)
+            x -= i + 1
+            wT0 = -x * (x - 1) * (x - 2) / 6; wT1 = (x + 1) * (x - 1) * (x - 2) / 2
+            wT2 = -(x + 1) * x * (x - 2) / 2; wT3 = (x + 1) * x * (x - 1) / 6
+            if self.Pcount > 1:
+                y = (math.log(P) - self._logPmin) / self._dlogP
+                j = min(max(int(y) - 1, 0), self.Pcount - 4)
+                y -= j + 1
+                wP0 = -y * (y - 1) * (y - 2) / 6; wP1 = (y + 1) * (y - 1) * (y - 2) / 2
+                wP2 = -(y + 1) * y * (y - 2) / 2; wP3 = (y + 1) * y * (y - 1) / 6
+                logk = (wT0 * self.__interpolateRow(i, j, wP0, wP1, wP2, wP3) + wT1 * self.__interpolateRow(i+1, j, wP0, wP1, wP2, wP3) +
+                    wT2 * self.__interpolateRow(i+2, j, wP0, wP1, wP2, wP3) + wT3 * self.__interpolateRow(i+3, j, wP0, wP1, wP2, wP3))
+            else:
+                logk = wT0 * self.logK[i,0] + wT1 * self.logK[i+1,0] + wT2 * self.logK[i+2,0] + wT3 * self.logK[i+3,0]
+            return math.exp(logk)
+        
+        i = min(int(x), self.Tcount - 2)
+        x -= i
+        if self.Pcount > 1:
+            y = (math.log(P) - self._logPmin) / self._dlogP
+            j = min(int(y), self.Pcount - 2)
+            y -= j
+            logk = ((1.0 - x) * ((1.0 - y) * self.logK[i,j] + y * self.logK[i,j+1]) +
+                x * ((1.0 - y) * self.logK[i+1,j] + y * self.logK[i+1,j+1]))
+        else:
+            logk = (1.0 - x) * self.logK[i,0] + x * self.logK[i+1,0]
+        return math.exp(logk)
+
+    def __interpolateRow(self, i, j, w0, w1, w2, w3):
+        # Return the weighted sum of the four tabulated values of ln k in row
+        # `i` of the table starting at column `j`, for cubic interpolation
+        return w0 * self.logK[i,j] + w1 * self.logK[i,j+1] + w2 * self.logK[i,j+2] + w3 * self.logK[i,j+3]
+
+    def getRateCoefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in SI units at temperatures `Tlist` in K
+        by interpolating in the table. If pressures `Plist` in Pa are also
+        given, the rate coefficients k(T, P) are returned as a matrix with one
+        row per temperature and one column per pressure.
+        """
+        cython.declare(logK=numpy.ndarray)
+        
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if Plist is not None:
+            Plist = numpy.asarray(Plist, numpy.float64)
+        if (self.exact or numpy.any(Tlist < self.Tmin) or numpy.any(Tlist > self.Tmax) or
+            (self.Pcount > 1 and (Plist is None or numpy.any(Plist < self.Pmin) or numpy.any(Plist > self.Pmax)))):
+            return self.model.getRateCoefficients(Tlist, Plist)
+        
+        if self.Pcount > 1:
+            return numpy.exp(self.__interpolate(Tlist, Plist))
+        logK = self.__interpolate(Tlist, None)
+        if Plist is not None:
+            return numpy.exp(logK).repeat(len(Plist), axis=1)
+        return numpy.exp(logK[:,0])
+
+################################################################################
+
+def fitChebyshevModels(Tlist, Plist, Klist, degreeT, degreeP, Tmin, Tmax, Pmin, Pmax, models=None):
+    """
+    Fit Chebyshev kinetic models to each of the matrices of rate coefficients
+    in `Klist`, all of which correspond to the same temperatures `Tlist` in K
+    and pressures `Plist` in Pa. The other parameters are as in
+    :meth:`ChebyshevModel.fitToData()`. Since the same design matrix applies
+    to every fit, all of the fits are done with a single linear least-squares
+    solve. The fitted models are stored in the :class:`ChebyshevModel` objects
+    in `models`, if given, and returned as a list.
+    """
+
+    cython.declare(A=numpy.ndarray, b=numpy.ndarray, x=numpy.ndarray, model=ChebyshevModel)
+    cython.declare(nT=cython.int, nP=cython.int, i=cython.int)
+
+    nT = len(Tlist); nP = len(Plist)
+
+    if models is None:
+        models = [ChebyshevModel() for i in range(len(Klist))]
+
+    # Set temperature and pressure ranges
+    for model in models:
+        model.Tmin = Tmin; model.Tmax = Tmax
+        model.Pmin = Pmin; model.Pmax = Pmax
+        model.degreeT = degreeT; model.degreeP = degreeP
+
+    # Create matrix for coefficient fit (linear least-squares), and one
+    # right-hand side vector per fit; the rows of each are ordered with the
+    # temperature index varying fastest
+    A = models[0].getDesignMatrix(Tlist, Plist, degreeT, degreeP)
+    b = numpy.log10(numpy.asarray(Klist, numpy.float64)).transpose((2,1,0)).reshape((nP*nT, len(Klist)))
+
+    # Do linear least-squares fit to get coefficients
+    x = numpy.linalg.lstsq(A, b)[0]
+
+    # Extract coefficients
+    for i, model in enumerate(models):
+        model.coeffs = x[:,i].reshape((degreeP, degreeT)).T.copy()
+
+    return models
+
+def fitArrheniusModels(Tlist, K, T0=298.15, models=None):
+    """
+    Fit modified Arrhenius kinetic models to many sets of rate coefficient data
+    at once. The columns of the matrix `K` contain the rate coefficients of
+    each model at the temperatures `Tlist` in K; a one-dimensional `K` is
+    treated as a single column. Since every fit shares the same design matrix,
+    its pseudo-inverse is computed only once and applied to all of the columns.
+    The fitted models are stored in the :class:`ArrheniusModel` objects in
+    `models`, if given, and created otherwise. Returns a tuple containing the
+    list of fitted models, an array containing the sum of squared residuals in
+    :math:`\\ln k` of each fit, and the condition number of the (column-scaled)
+    design matrix.
+    """
+
+    cython.declare(A=numpy.ndarray, b=numpy.ndarray, x=numpy.ndarray, scale=numpy.ndarray)
+    cython.declare(residuals=numpy.ndarray, condition=cython.double, model=ArrheniusModel, i=cython.int)
+
+    Tlist = numpy.asarray(Tlist, numpy.float64)
+    b = numpy.log(numpy.asarray(K, numpy.float64))
+    if b.ndim == 1:
+        b = b.reshape((len(Tlist), 1))
+
+    if models is None:
+        models = [ArrheniusModel() for i in range(b.shape[1])]
+
+    # Create matrix for parameter fit (linear least-squares), scaling each
+    # column to unit norm to improve its conditioning
+    A = numpy.zeros((len(Tlist),3), numpy.float64)
+    A[:,0] = 1.0
+    A[:,1] = numpy.log(Tlist / T0)
+    A[:,2] = -1.0 / constants.R / Tlist
+    scale = numpy.sqrt(numpy.sum(A * A, axis=0))
+    scale[scale == 0] = 1.0
+    A /= scale
+    condition = numpy.linalg.cond(A)
+
+    # Do linear least-squares fit of all columns with a single pseudo-inverse
+    x = numpy.dot(numpy.linalg.pinv(A), b)
+    residuals = numpy.sum((b - numpy.dot(A, x))**2, axis=0)
+    x /= scale[:,numpy.newaxis]
+
+    # Extract parameters
+    for i, model in enumerate(models):
+        model.A = math.exp(x[0,i])
+        model.n = x[1,i]
+        model.Ea = x[2,i]
+        model.T0 = T0
+
+    return models, residuals, condition
@@ -37,7 +37,8 @@ cdef class Atom(Vertex):
     cdef public short spinMultiplicity
     cdef public short implicitHydrogens
     cdef public short charge
-    cdef public str label
+    cdef str _label
+    cdef public object molecule
     cdef public AtomType atomType
 
     cpdef bint equivalent(self, Vertex other)
@@ -78,6 +79,7 @@ cdef class Molecule(Graph):
 
     cdef public bint implicitHydrogens
     cdef public int symmetryNumber
+    cdef public dict labelIndex
 
     cpdef addAtom(self, Atom atom)
 
@@ -107,6 +109,12 @@ cdef class Molecule(Graph):
 
     cpdef makeHydrogensExplicit(self)
 
+    cpdef __addToLabelIndex(self, Atom atom)
+
+    cpdef updateLabelIndex(self)
+
+    cpdef dict __getLabelIndex(self)
+
     cpdef clearLabeledAtoms(self)
 
     cpdef bint containsLabeledAtom(self, str label)
@@ -155,6 +163,16 @@ cdef class Molecule(Graph):
 
     cpdef getAdjacentResonanceIsomers(self)
 
+    cpdef tuple generateResonanceIsomers(self)
+
+    cpdef list __getResonancePaths(self, Molecule work, list atoms)
+
+    cpdef __shiftResonance(self, list path, bint forward)
+
+    cpdef tuple __getResonanceStateKey(self, list atoms, list bonds)
+
+    cpdef tuple __getResonanceCanonicalKey(self, list atoms, list bonds, list atomInvariants, list bondInvariants)
+
     cpdef findAllDelocalizationPaths(self, Atom atom1)
 
     cpdef int calculateAtomSymmetryNumber(self, Atom atom)
@@ -41,7 +41,7 @@ import element as elements
 from graph import Vertex, Edge, Graph
 from exception import ChemPyError
 from pattern import AtomPattern, BondPattern, MoleculePattern, AtomType
-from pattern import getAtomType, fromAdjacencyList, toAdjacencyList
+from pattern import getAtomType, assignAtomTypes, fromAdjacencyList, toAdjacencyList
 
 ################################################################################
 
@@ -58,6 +58,7 @@ class Atom(Vertex):
     `implicitHydrogens` ``short``           The number of implicit hydrogen atoms bonded to this atom
     `charge`            ``short``           The formal charge of the atom
     `label`             ``str``             A string label that can be used to tag individual atoms
+    `molecule`          :class:`Molecule`   The molecule whose index of labeled atoms contains the atom, if any
     =================== =================== ====================================
 
     Additionally, the ``mass``, ``number``, and ``symbol`` attributes of the
@@ -75,6 +76,8 @@ class Atom(Vertex):
         self.spinMultiplicity = spinMultiplicity
         self.implicitHydrogens = implicitHydrogens
         self.charge = charge
+        self._label = ''
+        self.molecule = None
         self.label = label
         self.atomType = None
 
@@ -95,6 +98,25 @@ class Atom(Vertex):
         """
         return "Atom(element='%s', radicalElectrons=%s, spinMultiplicity=%s, implicitHydrogens=%s, charge=%s, label='%s')" % (self.element, self.radicalElectrons, self.spinMultiplicity, self.implicitHydrogens, self.charge, self.label)
 
+    def __getLabel(self): return self._label
+    def __setLabel(self, label):
+        cython.declare(labelIndex=dict)
+        # Keep the index of labeled atoms of the owning molecule up to date
+        if label != self._label and self.molecule is not None and self in self.molecule.edges:
+            labelIndex = self.molecule.labelIndex
+            if labelIndex is not None:
+                if self in labelIndex.get(self._label, []):
+                    labelIndex[self._label].remove(self)
+                    if len(labelIndex[self._label]) == 0:
+                        del labelIndex[self._label]
+                if label != '':
+                    if label in labelIndex:
+                        labelIndex[label].append(self)
+                    else:
+                        labelIndex[label] = [self]
+        self._label = label
+    label = property(__getLabel, __setLabel)
+
     @property
     def mass(self): return self.element.mass
     
@@ -121,11 +143,9 @@ class Atom(Vertex):
                 self.implicitHydrogens == atom.implicitHydrogens and
                 self.charge == atom.charge)
         elif isinstance(other, AtomPattern):
-            cython.declare(a=AtomType, radical=cython.short, spin=cython.short, charge=cython.short)
+            cython.declare(radical=cython.short, spin=cython.short, charge=cython.short)
             ap = other
-            for a in ap.atomType:
-                if self.atomType.equivalent(a): break
-            else:
+            if self.atomType.mask & ap.equivalentMask == 0:
                 return False
             for radical, spin in zip(ap.radicalElectrons, ap.spinMultiplicity):
                 if self.radicalElectrons == radical and self.spinMultiplicity == spin: break
@@ -148,11 +168,9 @@ class Atom(Vertex):
         if isinstance(other, Atom):
             return self.equivalent(other)
         elif isinstance(other, AtomPattern):
-            cython.declare(atom=AtomPattern, a=AtomType, radical=cython.short, spin=cython.short, charge=cython.short)
+            cython.declare(atom=AtomPattern, radical=cython.short, spin=cython.short, charge=cython.short)
             atom = other
-            for a in atom.atomType: 
-                if self.atomType.isSpecificCaseOf(a): break
-            else:
+            if self.atomType.mask & atom.specificMask == 0:
                 return False
             for radical, spin in zip(atom.radicalElectrons, atom.spinMultiplicity):
                 if self.radicalElectrons == radical and self.spinMultiplicity == spin: break
@@ -401,6 +419,7 @@ class Molecule(Graph):
     def __init__(self, atoms=None, bonds=None, SMILES='', InChI='', implicitH=False):
         Graph.__init__(self, atoms, bonds)
         self.implicitHydrogens = False
+        self.labelIndex = None
         if SMILES != '': self.fromSMILES(SMILES, implicitH)
         elif InChI != '': self.fromInChI(InChI, implicitH)
     
@@ -417,7 +436,9 @@ class Molecule(Graph):
         return "Molecule(SMILES='%s')" % (self.toSMILES())
 
     def __getAtoms(self): return self.vertices
-    def __setAtoms(self, atoms): self.vertices = atoms
+    def __setAtoms(self, atoms):
+        self.vertices = atoms
+        self.labelIndex = None
     atoms = property(__getAtoms, __setAtoms)
 
     def __getBonds(self): return self.edges
@@ -428,6 +449,8 @@ class Molecule(Graph):
         """
         Add an `atom` to the graph. The atom is initialized with no bonds.
         """
+        if self.labelIndex is not None:
+            self.__addToLabelIndex(atom)
         return self.addVertex(atom)
     
     def addBond(self, atom1, atom2, bond):
@@ -469,6 +492,11 @@ class Molecule(Graph):
         not remove atoms that no longer have any bonds as a result of this
         removal.
         """
+        if self.labelIndex is not None and atom in self.labelIndex.get(atom.label, []):
+            self.labelIndex[atom.label].remove(atom)
+            if len(self.labelIndex[atom.label]) == 0:
+                del self.labelIndex[atom.label]
+        if atom.molecule is self: atom.molecule = None
         return self.removeVertex(atom)
 
     def removeBond(self, atom1, atom2):
@@ -607,47 +635,84 @@ class Molecule(Graph):
         to ensure they are correct (i.e. accurately describe their local bond
         environment) and complete (i.e. are as detailed as possible).
         """
+        assignAtomTypes(self)
+
+    def __addToLabelIndex(self, atom):
+        """
+        Add `atom` to the index of labeled atoms in the molecule and make the
+        molecule the owner of the atom, so that changes to the label of the atom
+        update the index. The index of any other molecule owning the atom is
+        invalidated, since it will no longer be updated.
+        """
+        if atom.molecule is not None and atom.molecule is not self:
+            atom.molecule.labelIndex = None
+        atom.molecule = self
+        if atom.label != '':
+            if atom.label in self.labelIndex:
+                self.labelIndex[atom.label].append(atom)
+            else:
+                self.labelIndex[atom.label] = [atom]
+
+    def updateLabelIndex(self):
+        """
+        Rebuild the index of labeled atoms in the molecule. The index is kept up
+        to date as atoms are added, removed, or relabeled, and is rebuilt
+        automatically when the atoms are replaced, so it is rarely necessary to
+        call this method directly.
+        """
+        cython.declare(atom=Atom)
+        self.labelIndex = {}
         for atom in self.vertices:
-            atom.atomType = getAtomType(atom, self.edges[atom])
+            self.__addToLabelIndex(atom)
+
+    def __getLabelIndex(self):
+        """
+        Return the index of labeled atoms in the molecule, a ``dict`` with the
+        keys being the labels and the values lists of the atoms with each
+        label, rebuilding it first if it is out of date.
+        """
+        if self.labelIndex is None:
+            self.updateLabelIndex()
+        return self.labelIndex
 
     def clearLabeledAtoms(self):
         """
         Remove the labels from all atoms in the molecule.
         """
+        self.labelIndex = None
         for atom in self.vertices:
             atom.label = ''
+        self.updateLabelIndex()
 
     def containsLabeledAtom(self, label):
         """
         Return :data:`True` if the molecule contains an atom with the label
         `label` and :data:`False` otherwise.
         """
-        for atom in self.vertices:
-            if atom.label == label: return True
-        return False
+        return label in self.__getLabelIndex()
 
     def getLabeledAtom(self, label):
         """
         Return the atoms in the molecule that are labeled.
         """
-        for atom in self.vertices:
-            if atom.label == label: return atom
-        return None
+        cython.declare(atoms=list)
+        atoms = self.__getLabelIndex().get(label)
+        if atoms is None: return None
+        return atoms[0]
 
     def getLabeledAtoms(self):
         """
         Return the labeled atoms as a ``dict`` with the keys being the labels
         and the values the atoms themselves. If two or more atoms have the
-        same label, the value is converted to a list of these atoms.
+        same label, the value is a list of these atoms.
         """
+        cython.declare(labeled=dict, label=str, atoms=list)
         labeled = {}
-        for atom in self.vertices:
-            if atom.label != '':
-                if atom.label in labeled:
-                    labeled[atom.label] = [labeled[atom.label]]
-                    labeled[atom.label].append(atom)
-                else:
-                    labeled[atom.label] = atom
+        for label, atoms in self.__getLabelIndex().iteritems():
+            if len(atoms) == 1:
+                labeled[label] = atoms[0]
+            else:
+                labeled[label] = atoms[:]
         return labeled
 
     def isIsomorphic(self, other, initialMap=None):
@@ -816,6 +881,7 @@ class Molecule(Graph):
 
         self.vertices = []
         self.edges = {}
+        self.labelIndex = None
 
         # Add hydrogen atoms to complete molecule if needed
         obmol.AddHydrogens()
@@ -882,6 +948,7 @@ class Molecule(Graph):
         ``False``.
         """
         self.vertices, self.edges = fromAdjacencyList(adjlist, False, True, withLabel)
+        self.updateLabelIndex()
         self.updateConnectivityValues()
         self.updateAtomTypes()
         self.makeHydrogensImplicit()
@@ -1424,6 +1491,148 @@ class Molecule(Graph):
 
         return isomers
 
+    def generateResonanceIsomers(self):
+        """
+        Generate all of the unique resonance isomers of this molecule by
+        repeated allyl radical shifts. The isomers are explored by applying
+        and undoing each shift in place on a single working copy of the
+        molecule, and each state is identified by a key formed from its radical
+        positions and bond orders, so that only previously-unseen isomers are
+        copied. Returns a tuple containing the list of unique isomers, starting
+        with this molecule, and the number of states explored.
+        """
+
+        cython.declare(work=Molecule, isomer=Molecule, atoms=list, bonds=list)
+        cython.declare(atomInvariants=list, bondInvariants=list, atom=Atom, bond=Bond)
+        cython.declare(visited=set, isomersByKey=dict, stack=list, isomers=list)
+        cython.declare(indices=dict, index=cython.int, explored=cython.int)
+
+        isomers = [self]
+
+        # Only radicals have resonance isomers
+        if sum([atom.radicalElectrons for atom in self.vertices]) == 0:
+            return isomers, 1
+
+        # Explore on a working copy so that this molecule is never modified
+        work = self.copy(deep=True)
+        work.implicitHydrogens = self.implicitHydrogens
+        for v1, v2 in zip(self.vertices, work.vertices):
+            v2.connectivity1 = v1.connectivity1
+            v2.connectivity2 = v1.connectivity2
+            v2.connectivity3 = v1.connectivity3
+            v2.sortingLabel = v1.sortingLabel
+        atoms = work.vertices[:]
+        indices = dict([(atom, index) for index, atom in enumerate(atoms)])
+        bonds = []
+        for atom1 in atoms:
+            for atom2, bond in work.edges[atom1].iteritems():
+                if indices[atom1] < indices[atom2]:
+                    bonds.append((atom1, atom2, bond))
+
+        # Each atom is described by an invariant that is unchanged by any
+        # isomorphism of the molecular skeleton; these are identical for all
+        # resonance isomers, so are only computed once
+        atomInvariants = [(atom.element.number, atom.implicitHydrogens, atom.charge, len(work.edges[atom])) for atom in atoms]
+        atomInvariants = [(atomInvariants[index], tuple(sorted([atomInvariants[indices[atom2]] for atom2 in work.edges[atom]]))) for index, atom in enumerate(atoms)]
+        bondInvariants = [tuple(sorted([atomInvariants[indices[atom1]], atomInvariants[indices[atom2]]])) for atom1, atom2, bond in bonds]
+
+        visited = set([self.__getResonanceStateKey(atoms, bonds)])
+        isomersByKey = {self.__getResonanceCanonicalKey(atoms, bonds, atomInvariants, bondInvariants): [self]}
+        explored = 1
+
+        # Depth-first search over the shifts; each stack frame holds the
+        # shifts to try from a state and the shift that led to that state
+        stack = [[self.__getResonancePaths(work, atoms), 0, None]]
+        while len(stack) > 0:
+            frame = stack[-1]
+            paths, index, incoming = frame
+            if index == len(paths):
+                # All shifts from this state have been tried, so restore the
+                # previous state
+                stack.pop()
+                if incoming is not None: self.__shiftResonance(incoming, False)
+                continue
+            frame[1] = index + 1
+            path = paths[index]
+            self.__shiftResonance(path, True)
+            key = self.__getResonanceStateKey(atoms, bonds)
+            if key in visited:
+                self.__shiftResonance(path, False)
+                continue
+            visited.add(key)
+            explored += 1
+            # Check for an isomorphic isomer among those with the same
+            # canonical key; if one is found, its neighbors have already been
+            # (or will be) explored, so there is no need to continue from here
+            key = self.__getResonanceCanonicalKey(atoms, bonds, atomInvariants, bondInvariants)
+            candidates = isomersByKey.setdefault(key, [])
+            for isomer in candidates:
+                if work.isIsomorphic(isomer): break
+            else:
+                isomer = work.copy(deep=True)
+                isomer.implicitHydrogens = work.implicitHydrogens
+                # Also copy the connectivity values, since they are the same
+                # for all resonance forms
+                for v1, v2 in zip(work.vertices, isomer.vertices):
+                    v2.connectivity1 = v1.connectivity1
+                    v2.connectivity2 = v1.connectivity2
+                    v2.connectivity3 = v1.connectivity3
+                    v2.sortingLabel = v1.sortingLabel
+                isomer.updateAtomTypes()
+                candidates.append(isomer)
+                isomers.append(isomer)
+                stack.append([self.__getResonancePaths(work, atoms), 0, path])
+                continue
+            self.__shiftResonance(path, False)
+
+        return isomers, explored
+
+    def __getResonancePaths(self, work, atoms):
+        """
+        Return all of the delocalization paths for the atoms `atoms` in the
+        working copy `work` used by :meth:`generateResonanceIsomers()`.
+        """
+        cython.declare(paths=list, atom=Atom)
+        paths = []
+        for atom in atoms:
+            paths.extend(work.findAllDelocalizationPaths(atom))
+        return paths
+
+    def __shiftResonance(self, path, forward):
+        """
+        Apply the allyl radical shift along the delocalization path `path` in
+        place, or undo it if `forward` is ``False``.
+        """
+        cython.declare(atom1=Atom, atom2=Atom, atom3=Atom, bond12=Bond, bond23=Bond)
+        atom1, atom2, atom3, bond12, bond23 = path
+        if forward:
+            atom1.decrementRadical()
+            atom3.incrementRadical()
+            bond12.incrementOrder()
+            bond23.decrementOrder()
+        else:
+            atom1.incrementRadical()
+            atom3.decrementRadical()
+            bond12.decrementOrder()
+            bond23.incrementOrder()
+
+    def __getResonanceStateKey(self, atoms, bonds):
+        """
+        Return a key that uniquely identifies the current radical positions and
+        bond orders of the atoms `atoms` and bonds `bonds`.
+        """
+        return (tuple([atom.radicalElectrons for atom in atoms]), tuple([bond.order for atom1, atom2, bond in bonds]))
+
+    def __getResonanceCanonicalKey(self, atoms, bonds, atomInvariants, bondInvariants):
+        """
+        Return a key for the current radical positions and bond orders of the
+        atoms `atoms` and bonds `bonds` that is identical for any two
+        isomorphic states. Non-isomorphic states may share a key.
+        """
+        cython.declare(index=cython.int)
+        return (tuple(sorted([(atomInvariants[index], atoms[index].radicalElectrons, atoms[index].spinMultiplicity) for index in range(len(atoms))])),
+            tuple(sorted([(bondInvariants[index], bonds[index][2].order) for index in range(len(bonds))])))
+
     def findAllDelocalizationPaths(self, atom1):
         """
         Find all the delocalization paths allyl to the radical center indicated
@@ -26,6 +26,8 @@
 
 from graph cimport Vertex, Edge, Graph
 
+cimport numpy
+
 ################################################################################
 
 cdef class AtomType:
@@ -33,6 +35,9 @@ cdef class AtomType:
     cdef public str label
     cdef public list generic
     cdef public list specific
+    cdef public long long mask
+    cdef public long long genericMask
+    cdef public long long specificMask
 
     cdef public list incrementBond
     cdef public list decrementBond
@@ -47,6 +52,8 @@ cdef class AtomType:
 
 cpdef AtomType getAtomType(atom, dict bonds)
 
+cpdef assignAtomTypes(Graph molecule)
+
 
 
 ################################################################################
@@ -57,10 +64,15 @@ cdef class AtomPattern(Vertex):
     cdef public list radicalElectrons
     cdef public list spinMultiplicity
     cdef public list charge
-    cdef public str label
+    cdef str _label
+    cdef public object molecule
+    cdef public long long specificMask
+    cdef public long long equivalentMask
 
     cpdef copy(self)
 
+    cpdef updateAtomTypeMasks(self)
+
     cpdef __changeBond(self, short order)
 
     cpdef __formBond(self, str order)
@@ -97,6 +109,8 @@ cdef class BondPattern(Edge):
 
 cdef class MoleculePattern(Graph):
 
+    cdef public dict labelIndex
+
     cpdef addAtom(self, AtomPattern atom)
 
     cpdef addBond(self, AtomPattern atom1, AtomPattern atom2, BondPattern bond)
@@ -117,6 +131,12 @@ cdef class MoleculePattern(Graph):
 
     cpdef Graph copy(self, bint deep=?)
 
+    cpdef __addToLabelIndex(self, AtomPattern atom)
+
+    cpdef updateLabelIndex(self)
+
+    cpdef dict __getLabelIndex(self)
+
     cpdef clearLabeledAtoms(self)
 
     cpdef bint containsLabeledAtom(self, str label)
@@ -110,6 +110,7 @@ We define the following reaction recipe actions:
 """
 
 import cython
+import numpy
 
 from graph import Vertex, Edge, Graph
 from exception import ChemPyError
@@ -127,13 +128,24 @@ class AtomType:
     Attribute           Type                Description
     =================== =================== ====================================
     `label`             ``str``             A unique string label for the atom type
+    `generic`           ``list``            The atom types that are more generic than this one
+    `specific`          ``list``            The atom types that are more specific than this one
+    `mask`              ``long``            A bitmask with only the bit of this atom type set
+    `genericMask`       ``long``            A bitmask of this atom type and all more generic atom types
+    `specificMask`      ``long``            A bitmask of this atom type and all more specific atom types
     =================== =================== ====================================
+
+    Each atom type is assigned a unique bit when the module is loaded, so that
+    the comparisons between atom types reduce to a bitwise AND of the masks.
     """
 
     def __init__(self, label, generic, specific):
         self.label = label
         self.generic = generic
         self.specific = specific
+        self.mask = 0
+        self.genericMask = 0
+        self.specificMask = 0
         self.incrementBond = []
         self.decrementBond = []
         self.formBond = []
@@ -158,14 +170,14 @@ class AtomType:
         equivalent or ``False``  otherwise. This function respects wildcards,
         e.g. ``R!H`` is equivalent to ``C``.
         """
-        return self is other or self in other.specific or other in self.specific
+        return (self.mask & (other.genericMask | other.specificMask)) != 0
 
     def isSpecificCaseOf(self, other):
         """
         Returns ``True`` if atom type `atomType1` is a specific case of
         atom type `atomType2` or ``False``  otherwise.
         """
-        return self is other or self in other.specific
+        return (self.mask & other.specificMask) != 0
 
 
 
@@ -250,61 +262,171 @@ for atomType in atomTypes.values():
         for index in range(len(items)):
             items[index] = atomTypes[items[index]]
 
+# Assign each atom type a unique bit, then build the generic and specific
+# bitmasks from the atom type hierarchy
+# Both masks are derived from the specific lists only, since not every generic
+# list is consistent with them (e.g. 'H' lists 'R!H' as a generic type)
+for index, label in enumerate(sorted(atomTypes.keys())):
+    atomTypes[label].mask = 1 << index
+for atomType in atomTypes.values():
+    atomType.genericMask = atomType.mask
+    atomType.specificMask = atomType.mask
+for atomType in atomTypes.values():
+    for other in atomType.specific:
+        atomType.specificMask |= other.mask
+        other.genericMask |= atomType.mask
+
+# The rules used to assign atom types to atoms, expressed as a table of
+# (element number, double, double-to-oxygen, triple, benzene) bond counts and
+# the label of the resulting atom type
+atomTypeRules = [
+    # Carbon
+    (6,  0, 0, 0, 0, 'Cs'),
+    (6,  1, 0, 0, 0, 'Cd'),
+    (6,  2, 0, 0, 0, 'Cdd'),
+    (6,  1, 1, 0, 0, 'Cdd'),
+    (6,  0, 2, 0, 0, 'Cdd'),
+    (6,  0, 0, 1, 0, 'Ct'),
+    (6,  0, 1, 0, 0, 'CO'),
+    (6,  0, 0, 0, 2, 'Cb'),
+    (6,  0, 0, 0, 3, 'Cbf'),
+    # Oxygen
+    (8,  0, 0, 0, 0, 'Os'),
+    (8,  1, 0, 0, 0, 'Od'),
+    (8,  0, 1, 0, 0, 'Od'),
+    # Silicon
+    (14, 0, 0, 0, 0, 'Sis'),
+    (14, 1, 0, 0, 0, 'Sid'),
+    (14, 2, 0, 0, 0, 'Sidd'),
+    (14, 1, 1, 0, 0, 'Sidd'),
+    (14, 0, 2, 0, 0, 'Sidd'),
+    (14, 0, 0, 1, 0, 'Sit'),
+    (14, 0, 1, 0, 0, 'SiO'),
+    (14, 0, 0, 0, 2, 'Sib'),
+    (14, 0, 0, 0, 3, 'Sibf'),
+    # Sulfur
+    (16, 0, 0, 0, 0, 'Ss'),
+    (16, 1, 0, 0, 0, 'Sd'),
+    (16, 0, 1, 0, 0, 'Sd'),
+]
+
+# The element numbers of atoms that are assigned the same atom type regardless
+# of their local bond structure, and the label of that atom type
+fixedAtomTypeElements = {1: 'H'}
+
+# The element numbers of atoms that are not assigned an atom type (N, He, Ne, Ar)
+untypedElements = [7, 2, 10, 18]
+
+# The largest number of bonds of any one type considered by the atom type table
+maxBondCount = 4
+
+# The list of atom types that can be assigned to an atom, so that atom types
+# can be referenced by integer index in the array version of the lookup table
+assignableAtomTypes = []
+# A dict mapping (element number, double, double-to-oxygen, triple, benzene)
+# tuples to atom types
+atomTypeTable = {}
+# The same lookup table as a dense array of indices into assignableAtomTypes;
+# -1 indicates an unknown atom type and -2 indicates an untyped element
+atomTypeIndexTable = numpy.zeros((max([rule[0] for rule in atomTypeRules] + fixedAtomTypeElements.keys() + untypedElements) + 1,
+    maxBondCount + 1, maxBondCount + 1, maxBondCount + 1, maxBondCount + 1), numpy.int8) - 1
+# The index into assignableAtomTypes for every element number, used for atoms
+# whose bond counts fall outside the lookup table; -1 indicates that the atom
+# type depends on the bond counts and -2 indicates an untyped element
+atomTypeElementIndexTable = numpy.zeros(atomTypeIndexTable.shape[0], numpy.int8) - 1
+
+for rule in atomTypeRules:
+    atomType = atomTypes[rule[5]]
+    if atomType not in assignableAtomTypes: assignableAtomTypes.append(atomType)
+    atomTypeTable[rule[0:5]] = atomType
+    atomTypeIndexTable[rule[0:5]] = assignableAtomTypes.index(atomType)
+for number, label in fixedAtomTypeElements.iteritems():
+    atomType = atomTypes[label]
+    if atomType not in assignableAtomTypes: assignableAtomTypes.append(atomType)
+    atomTypeIndexTable[number,:,:,:,:] = assignableAtomTypes.index(atomType)
+    atomTypeElementIndexTable[number] = assignableAtomTypes.index(atomType)
+for number in untypedElements:
+    atomTypeIndexTable[number,:,:,:,:] = -2
+    atomTypeElementIndexTable[number] = -2
+
 def getAtomType(atom, bonds):
     """
     Determine the appropriate atom type for an :class:`Atom` object `atom`
     with local bond structure `bonds`, a ``dict`` containing atom-bond pairs.
+    The atom type is looked up in a precomputed table using the element and
+    the numbers of each higher-order bond type. Returns ``None`` for elements
+    that do not have atom types.
     """
 
-    cython.declare(atomType=str)
-    cython.declare(double=cython.double, double0=cython.double, triple=cython.double, benzene=cython.double)
-    
-    atomType = ''
+    cython.declare(number=cython.int, order=str)
+    cython.declare(double=cython.int, doubleO=cython.int, triple=cython.int, benzene=cython.int)
     
     # Count numbers of each higher-order bond type
     double = 0; doubleO = 0; triple = 0; benzene = 0
     for atom2, bond12 in bonds.iteritems():
-        if bond12.isDouble():
-            if atom2.isOxygen(): doubleO +=1
-            else:                double += 1
-        elif bond12.isTriple(): triple += 1
-        elif bond12.isBenzene(): benzene += 1
-
-    # Use element and counts to determine proper atom type
-    if atom.symbol == 'C':
-        if   double == 0 and doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Cs'
-        elif double == 1 and doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Cd'
-        elif double + doubleO == 2        and triple == 0 and benzene == 0: atomType = 'Cdd'
-        elif double == 0 and doubleO == 0 and triple == 1 and benzene == 0: atomType = 'Ct'
-        elif double == 0 and doubleO == 1 and triple == 0 and benzene == 0: atomType = 'CO'
-        elif double == 0 and doubleO == 0 and triple == 0 and benzene == 2: atomType = 'Cb'
-        elif double == 0 and doubleO == 0 and triple == 0 and benzene == 3: atomType = 'Cbf'
-    elif atom.symbol == 'H':
-        atomType = 'H'
-    elif atom.symbol == 'O':
-        if   double + doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Os'
-        elif double + doubleO == 1 and triple == 0 and benzene == 0: atomType = 'Od'
-        elif len(bonds) == 0:                                        atomType = 'Oa'
-    elif atom.symbol == 'Si':
-        if   double == 0 and doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Sis'
-        elif double == 1 and doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Sid'
-        elif double + doubleO == 2        and triple == 0 and benzene == 0: atomType = 'Sidd'
-        elif double == 0 and doubleO == 0 and triple == 1 and benzene == 0: atomType = 'Sit'
-        elif double == 0 and doubleO == 1 and triple == 0 and benzene == 0: atomType = 'SiO'
-        elif double == 0 and doubleO == 0 and triple == 0 and benzene == 2: atomType = 'Sib'
-        elif double == 0 and doubleO == 0 and triple == 0 and benzene == 3: atomType = 'Sibf'
-    elif atom.symbol == 'S':
-        if   double + doubleO == 0 and triple == 0 and benzene == 0: atomType = 'Ss'
-        elif double + doubleO == 1 and triple == 0 and benzene == 0: atomType = 'Sd'
-        elif len(bonds) == 0:                                        atomType = 'Sa'
-    elif atom.symbol == 'N' or atom.symbol == 'Ar' or atom.symbol == 'He' or atom.symbol == 'Ne':
-        return None
-
-    # Raise exception if we could not identify the proper atom type
-    if atomType == '':
+        order = bond12.order
+        if order == 'D':
+            if atom2.element.number == 8: doubleO +=1
+            else:                         double += 1
+        elif order == 'T': triple += 1
+        elif order == 'B': benzene += 1
+
+    # Use element and counts to look up the proper atom type
+    number = atom.element.number
+    if number in fixedAtomTypeElements: return atomTypes[fixedAtomTypeElements[number]]
+    elif number in untypedElements: return None
+    try:
+        return atomTypeTable[number, double, doubleO, triple, benzene]
+    except KeyError:
+        # Raise exception if we could not identify the proper atom type
         raise ChemPyError('Unable to determine atom type for atom %s.' % atom)
 
-    return atomTypes[atomType]
+def assignAtomTypes(molecule):
+    """
+    Determine and set the appropriate atom type for every atom in `molecule`.
+    The element numbers and bond counts of all atoms are assembled as arrays
+    in a single pass over the bonds, and the atom types are then obtained at
+    once from the array version of the atom type lookup table.
+    """
+
+    cython.declare(numAtoms=cython.int, i=cython.int, j=cython.int)
+    cython.declare(numbers=numpy.ndarray, counts=numpy.ndarray, indices=numpy.ndarray)
+    cython.declare(bondIndices=list, order=str)
+
+    atoms = molecule.vertices
+    numAtoms = len(atoms)
+    if numAtoms == 0: return
+
+    # Array representation of the atoms: element number and the counts of
+    # each higher-order bond type (double, double-to-oxygen, triple, benzene)
+    numbers = numpy.array([atom.element.number for atom in atoms], numpy.int_)
+    bondIndices = []
+    for i, atom1 in enumerate(atoms):
+        for atom2, bond in molecule.edges[atom1].iteritems():
+            order = bond.order
+            if order == 'D':
+                if atom2.element.number == 8: bondIndices.append(4*i+1)
+                else:                         bondIndices.append(4*i)
+            elif order == 'T': bondIndices.append(4*i+2)
+            elif order == 'B': bondIndices.append(4*i+3)
+    counts = numpy.bincount(numpy.array(bondIndices, numpy.int_), minlength=4*numAtoms).reshape((numAtoms, 4))
+
+    # Look up the atom types of all atoms at once; atoms with bond counts
+    # outside the table fall back to the per-element atom type, if any
+    known = numbers < atomTypeIndexTable.shape[0]
+    valid = numpy.logical_and(known, counts.max(axis=1) <= maxBondCount)
+    indices = -numpy.ones(numAtoms, numpy.int_)
+    indices[known] = atomTypeElementIndexTable[numbers[known]]
+    indices[valid] = atomTypeIndexTable[numbers[valid], counts[valid,0], counts[valid,1], counts[valid,2], counts[valid,3]]
+
+    for i, atom in enumerate(atoms):
+        j = indices[i]
+        if j >= 0:
+            atom.atomType = assignableAtomTypes[j]
+        elif j == -2:
+            atom.atomType = None
+        else:
+            raise ChemPyError('Unable to determine atom type for atom %s.' % atom)
 
 ################################################################################
 
@@ -322,6 +444,9 @@ class AtomPattern(Vertex):
     `spinMultiplicity`  ``list``            The allowed spin multiplicities (as short integers)
     `charge`            ``list``            The allowed formal charges (as short integers)
     `label`             ``str``             A string label that can be used to tag individual atoms
+    `molecule`          ``MoleculePattern`` The pattern whose index of labeled atoms contains the atom, if any
+    `specificMask`      ``long``            The union of the specific bitmasks of the allowed atom types
+    `equivalentMask`    ``long``            The union of the generic and specific bitmasks of the allowed atom types
     =================== =================== ====================================
 
     Each list represents a logical OR construct, i.e. an atom will match the
@@ -330,6 +455,10 @@ class AtomPattern(Vertex):
     such that an atom must match values from the same index in each of these in
     order to match. Unlike an :class:`Atom` object, an :class:`AtomPattern`
     cannot store implicit hydrogen atoms.
+
+    The `specificMask` and `equivalentMask` attributes allow an atom type to be
+    checked against all of the allowed atom types at once; call
+    :meth:`updateAtomTypeMasks()` after modifying `atomType` directly.
     """
 
     def __init__(self, atomType=None, radicalElectrons=None, spinMultiplicity=None, charge=None, label=''):
@@ -341,7 +470,10 @@ class AtomPattern(Vertex):
         self.radicalElectrons = radicalElectrons or []
         self.spinMultiplicity = spinMultiplicity or []
         self.charge = charge or []
+        self._label = ''
+        self.molecule = None
         self.label = label
+        self.updateAtomTypeMasks()
 
     def __str__(self):
         """
@@ -355,6 +487,25 @@ class AtomPattern(Vertex):
         """
         return "AtomPattern(atomType=%s, radicalElectrons=%s, spinMultiplicity=%s, charge=%s, label='%s')" % (self.atomType, self.radicalElectrons, self.spinMultiplicity, self.charge, self.label)
 
+    def __getLabel(self): return self._label
+    def __setLabel(self, label):
+        cython.declare(labelIndex=dict)
+        # Keep the index of labeled atoms of the owning pattern up to date
+        if label != self._label and self.molecule is not None and self in self.molecule.edges:
+            labelIndex = self.molecule.labelIndex
+            if labelIndex is not None:
+                if self in labelIndex.get(self._label, []):
+                    labelIndex[self._label].remove(self)
+                    if len(labelIndex[self._label]) == 0:
+                        del labelIndex[self._label]
+                if label != '':
+                    if label in labelIndex:
+                        labelIndex[label].append(self)
+                    else:
+                        labelIndex[label] = [self]
+        self._label = label
+    label = property(__getLabel, __setLabel)
+
     def copy(self):
         """
         Return a deep copy of the :class:`AtomPattern` object. Modifying the
@@ -362,6 +513,18 @@ class AtomPattern(Vertex):
         """
         return AtomPattern(self.atomType[:], self.radicalElectrons[:], self.spinMultiplicity[:], self.charge[:], self.label)
 
+    def updateAtomTypeMasks(self):
+        """
+        Recompute the `specificMask` and `equivalentMask` bitmasks from the
+        current list of allowed atom types.
+        """
+        cython.declare(atomType=AtomType)
+        self.specificMask = 0
+        self.equivalentMask = 0
+        for atomType in self.atomType:
+            self.specificMask |= atomType.specificMask
+            self.equivalentMask |= atomType.genericMask | atomType.specificMask
+
     def __changeBond(self, order):
         """
         Update the atom pattern as a result of applying a CHANGE_BOND action,
@@ -380,6 +543,7 @@ class AtomPattern(Vertex):
             raise ChemPyError('Unable to update AtomPattern due to CHANGE_BOND action: Unknown atom type produced from set "%s".' % (self.atomType))
         # Set the new atom types, removing any duplicates
         self.atomType = list(set(atomType))
+        self.updateAtomTypeMasks()
 
     def __formBond(self, order):
         """
@@ -396,6 +560,7 @@ class AtomPattern(Vertex):
             raise ChemPyError('Unable to update AtomPattern due to FORM_BOND action: Unknown atom type produced from set "%s".' % (self.atomType))
         # Set the new atom types, removing any duplicates
         self.atomType = list(set(atomType))
+        self.updateAtomTypeMasks()
 
     def __breakBond(self, order):
         """
@@ -412,6 +577,7 @@ class AtomPattern(Vertex):
             raise ChemPyError('Unable to update AtomPattern due to BREAK_BOND action: Unknown atom type produced from set "%s".' % (self.atomType))
         # Set the new atom types, removing any duplicates
         self.atomType = list(set(atomType))
+        self.updateAtomTypeMasks()
 
     def __gainRadical(self, radical):
         """
@@ -483,15 +649,9 @@ class AtomPattern(Vertex):
         # Compare two atom patterns for equivalence
         # Each atom type in self must have an equivalent in other (and vice versa)
         for atomType1 in self.atomType:
-            for atomType2 in other.atomType:
-                if atomType1.equivalent(atomType2): break
-            else:
-                return False
+            if atomType1.mask & other.equivalentMask == 0: return False
         for atomType1 in other.atomType:
-            for atomType2 in self.atomType:
-                if atomType1.equivalent(atomType2): break
-            else:
-                return False
+            if atomType1.mask & self.equivalentMask == 0: return False
         # Each free radical electron state in self must have an equivalent in other (and vice versa)
         for radical1, spin1 in zip(self.radicalElectrons, self.spinMultiplicity):
             for radical2, spin2 in zip(other.radicalElectrons, other.spinMultiplicity):
@@ -522,10 +682,7 @@ class AtomPattern(Vertex):
         # Compare two atom patterns for equivalence
         # Each atom type in self must have an equivalent in other (and vice versa)
         for atomType1 in self.atomType: # all these must match
-            for atomType2 in other.atomType: # can match any of these
-                if atomType1.isSpecificCaseOf(atomType2): break
-            else:
-                return False
+            if atomType1.mask & other.specificMask == 0: return False
         # Each free radical electron state in self must have an equivalent in other (and vice versa)
         for radical1, spin1 in zip(self.radicalElectrons, self.spinMultiplicity): # all these must match
             for radical2, spin2 in zip(other.radicalElectrons, other.spinMultiplicity): # can match any of these
@@ -675,9 +832,12 @@ class MoleculePattern(Graph):
 
     def __init__(self, atoms=None, bonds=None):
         Graph.__init__(self, atoms, bonds)
+        self.labelIndex = None
     
     def __getAtoms(self): return self.vertices
-    def __setAtoms(self, atoms): self.vertices = atoms
+    def __setAtoms(self, atoms):
+        self.vertices = atoms
+        self.labelIndex = None
     atoms = property(__getAtoms, __setAtoms)
 
     def __getBonds(self): return self.edges
@@ -688,6 +848,8 @@ class MoleculePattern(Graph):
         """
         Add an `atom` to the graph. The atom is initialized with no bonds.
         """
+        if self.labelIndex is not None:
+            self.__addToLabelIndex(atom)
         return self.addVertex(atom)
 
     def addBond(self, atom1, atom2, bond):
@@ -729,6 +891,11 @@ class MoleculePattern(Graph):
         not remove atoms that no longer have any bonds as a result of this
         removal.
         """
+        if self.labelIndex is not None and atom in self.labelIndex.get(atom.label, []):
+            self.labelIndex[atom.label].remove(atom)
+            if len(self.labelIndex[atom.label]) == 0:
+                del self.labelIndex[atom.label]
+        if atom.molecule is self: atom.molecule = None
         return self.removeVertex(atom)
 
     def removeBond(self, atom1, atom2):
@@ -780,44 +947,82 @@ class MoleculePattern(Graph):
             molecules.append(molecule)
         return molecules
 
+    def __addToLabelIndex(self, atom):
+        """
+        Add `atom` to the index of labeled atoms in the pattern and make the
+        pattern the owner of the atom, so that changes to the label of the atom
+        update the index. The index of any other pattern owning the atom is
+        invalidated, since it will no longer be updated.
+        """
+        if atom.molecule is not None and atom.molecule is not self:
+            atom.molecule.labelIndex = None
+        atom.molecule = self
+        if atom.label != '':
+            if atom.label in self.labelIndex:
+                self.labelIndex[atom.label].append(atom)
+            else:
+                self.labelIndex[atom.label] = [atom]
+
+    def updateLabelIndex(self):
+        """
+        Rebuild the index of labeled atoms in the pattern. The index is kept up
+        to date as atoms are added, removed, or relabeled, and is rebuilt
+        automatically when the atoms are replaced, so it is rarely necessary to
+        call this method directly.
+        """
+        cython.declare(atom=AtomPattern)
+        self.labelIndex = {}
+        for atom in self.vertices:
+            self.__addToLabelIndex(atom)
+
+    def __getLabelIndex(self):
+        """
+        Return the index of labeled atoms in the pattern, a ``dict`` with the
+        keys being the labels and the values lists of the atoms with each
+        label, rebuilding it first if it is out of date.
+        """
+        if self.labelIndex is None:
+            self.updateLabelIndex()
+        return self.labelIndex
+
     def clearLabeledAtoms(self):
         """
         Remove the labels from all atoms in the molecular pattern.
         """
+        self.labelIndex = None
         for atom in self.vertices:
             atom.label = ''
+        self.updateLabelIndex()
 
     def containsLabeledAtom(self, label):
         """
         Return ``True`` if the pattern contains an atom with the label
         `label` and ``False`` otherwise.
         """
-        for atom in self.vertices:
-            if atom.label == label: return True
-        return False
+        return label in self.__getLabelIndex()
 
     def getLabeledAtom(self, label):
         """
         Return the atoms in the pattern that are labeled.
         """
-        for atom in self.vertices:
-            if atom.label == label: return atom
-        return None
+        cython.declare(atoms=list)
+        atoms = self.__getLabelIndex().get(label)
+        if atoms is None: return None
+        return atoms[0]
 
     def getLabeledAtoms(self):
         """
         Return the labeled atoms as a ``dict`` with the keys being the labels
         and the values the atoms themselves. If two or more atoms have the
-        same label, the value is converted to a list of these atoms.
+        same label, the value is a list of these atoms.
         """
+        cython.declare(labeled=dict, label=str, atoms=list)
         labeled = {}
-        for atom in self.vertices:
-            if atom.label != '':
-                if atom.label in labeled:
-                    labeled[atom.label] = [labeled[atom.label]]
-                    labeled[atom.label].append(atom)
-                else:
-                    labeled[atom.label] = atom
+        for label, atoms in self.__getLabelIndex().iteritems():
+            if len(atoms) == 1:
+                labeled[label] = atoms[0]
+            else:
+                labeled[label] = atoms[:]
         return labeled
 
     def fromAdjacencyList(self, adjlist, withLabel=True):
@@ -827,6 +1032,7 @@ class MoleculePattern(Graph):
         ``False``.
         """
         self.vertices, self.edges = fromAdjacencyList(adjlist, pattern=True, addH=False, withLabel=withLabel)
+        self.updateLabelIndex()
         self.updateConnectivityValues()
         return self
 
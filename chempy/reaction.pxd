@@ -25,7 +25,7 @@
 ################################################################################
 
 from species cimport Species, TransitionState
-from kinetics cimport KineticsModel, ArrheniusModel
+from kinetics cimport KineticsModel, ArrheniusModel, KineticsTable, ThirdBodyModel
 
 cimport numpy
 
@@ -65,15 +65,19 @@ cdef class Reaction:
 
     cpdef generateReverseRateCoefficient(self, numpy.ndarray Tlist)
 
-    cpdef numpy.ndarray calculateTSTRateCoefficients(self, numpy.ndarray Tlist, str tunneling=?)
+    cpdef numpy.ndarray calculateTSTRateCoefficients(self, numpy.ndarray Tlist, str tunneling=?, dict logPartitionFunctions=?)
 
     cpdef double calculateTSTRateCoefficient(self, double T, str tunneling=?)
     
     cpdef double calculateWignerTunnelingCorrection(self, double T)
+
+    cpdef numpy.ndarray calculateWignerTunnelingCorrections(self, numpy.ndarray Tlist)
     
     cpdef double calculateEckartTunnelingCorrection(self, double T)
 
-    cpdef double __eckartIntegrand(self, double E_kT, double kT, double dV1, double alpha1, double alpha2)
+    cpdef numpy.ndarray calculateEckartTunnelingCorrections(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray __eckartIntegrand(self, numpy.ndarray E_kT, numpy.ndarray kT, double dV1, double alpha1, double alpha2)
 
 ################################################################################
 
@@ -81,9 +85,47 @@ cdef class ReactionModel:
 
     cdef public list species
     cdef public list reactions
+    cdef public object stoichiometry
+    cdef public object stoichiometryTranspose
+    cdef public numpy.ndarray reactantIndices
+    cdef public numpy.ndarray productIndices
+    cdef public numpy.ndarray deltaMoles
+    cdef public numpy.ndarray thirdBodyFlags
+    cdef public KineticsTable kineticsTable
+    cdef public numpy.ndarray arrheniusIndices
+    cdef public list otherIndices
+    cdef public list otherKinetics
+    cdef public list efficiencies
+    cdef public numpy.ndarray thirdBodyIndices
+    cdef public numpy.ndarray jacobianIndices
+    cdef public numpy.ndarray jacobianIndptr
+    cdef public object jacobianMap
+    cdef double _cacheTemperature
+    cdef numpy.ndarray _freeEnergies
+    cdef numpy.ndarray _equilibriumConstants
 
     cpdef generateStoichiometryMatrix(self)
 
-    cpdef numpy.ndarray getReactionRates(self, double T, double P, dict Ci)
+    cpdef generateReactionIndices(self)
+
+    cpdef tuple __getRateTerms(self, double T, double P, Ci)
+
+    cpdef numpy.ndarray getFreeEnergies(self, double T)
+
+    cpdef numpy.ndarray getEquilibriumConstants(self, double T)
+
+    cpdef numpy.ndarray getReactionRates(self, double T, double P, Ci)
+
+    cpdef numpy.ndarray getNetProductionRates(self, double T, double P, Ci)
+
+    cpdef generateJacobianPattern(self)
+
+    cpdef getJacobian(self, double T, double P, Ci)
+
+    cpdef ReactionModel generateCompactModel(self)
+
+    cpdef list generateReverseRateCoefficients(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray calculateTSTRateCoefficients(self, numpy.ndarray Tlist, str tunneling=?)
 
 ################################################################################
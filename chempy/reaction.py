@@ -46,7 +46,7 @@ import constants
 from exception import ChemPyError
 
 from species import Species
-from kinetics import ArrheniusModel
+from kinetics import KineticsModel, ArrheniusModel, KineticsTable, ThirdBodyModel, fitArrheniusModels
 
 ################################################################################
 
@@ -190,23 +190,47 @@ class Reaction:
     def getEnthalpiesOfReaction(self, Tlist):
         """
         Return the enthalpies of reaction in J/mol evaluated at temperatures
-        `Tlist` in K.
+        `Tlist` in K. The enthalpies of each species are evaluated at all of
+        the temperatures at once.
         """
-        return numpy.array([self.getEnthalpyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dHrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dHrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dHrxn -= reactant.thermo.getEnthalpies(Tlist)
+        for product in self.products:
+            dHrxn += product.thermo.getEnthalpies(Tlist)
+        return dHrxn
 
     def getEntropiesOfReaction(self, Tlist):
         """
         Return the entropies of reaction in J/mol*K evaluated at temperatures
-        `Tlist` in K.
+        `Tlist` in K. The entropies of each species are evaluated at all of
+        the temperatures at once.
         """
-        return numpy.array([self.getEntropyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dSrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dSrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dSrxn -= reactant.thermo.getEntropies(Tlist)
+        for product in self.products:
+            dSrxn += product.thermo.getEntropies(Tlist)
+        return dSrxn
 
     def getFreeEnergiesOfReaction(self, Tlist):
         """
         Return the Gibbs free energies of reaction in J/mol evaluated at
-        temperatures `Tlist` in K.
+        temperatures `Tlist` in K. The free energies of each species are
+        evaluated at all of the temperatures at once.
         """
-        return numpy.array([self.getFreeEnergyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dGrxn=numpy.ndarray, reactant=Species, product=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        dGrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dGrxn -= reactant.thermo.getFreeEnergies(Tlist)
+        for product in self.products:
+            dGrxn += product.thermo.getFreeEnergies(Tlist)
+        return dGrxn
 
     def getEquilibriumConstants(self, Tlist, type='Kc'):
         """
@@ -216,7 +240,21 @@ class Reaction:
         ``Kc`` for concentrations (default), or ``Kp`` for pressures. Note that
         this function currently assumes an ideal gas mixture.
         """
-        return numpy.array([self.getEquilibriumConstant(T, type) for T in Tlist], numpy.float64)
+        cython.declare(K=numpy.ndarray, P0=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        # Use free energies of reaction to calculate Ka
+        K = numpy.exp(-self.getFreeEnergiesOfReaction(Tlist) / constants.R / Tlist)
+        # Convert Ka to Kc or Kp if specified
+        P0 = 1e5
+        if type == 'Kc':
+            # Convert from Ka to Kc; C0 is the reference concentration
+            K *= (P0 / constants.R / Tlist) ** (len(self.products) - len(self.reactants))
+        elif type == 'Kp':
+            # Convert from Ka to Kp; P0 is the reference pressure
+            K *= P0 ** (len(self.products) - len(self.reactants))
+        elif type != 'Ka' and type != '':
+            raise ChemPyError('Invalid type "%s" passed to Reaction.getEquilibriumConstants(); should be "Ka", "Kc", or "Kp".' % type)
+        return K
 
     def getStoichiometricCoefficient(self, spec):
         """
@@ -250,9 +288,14 @@ class Reaction:
         if totalConc == -1.0:
             totalConc=sum( conc.values() )
 
-        # Evaluate rate constant
-        rateConstant = self.kinetics.getRateCoefficient(T, P)
-        if self.thirdBody: rateConstant *= totalConc
+        # Evaluate rate constant, using the collision efficiencies of the
+        # kinetics model to determine the third-body concentration if it has
+        # them
+        if isinstance(self.kinetics, ThirdBodyModel):
+            rateConstant = self.kinetics.getRateCoefficient(T, P, self.kinetics.getColliderConcentration(conc, totalConc))
+        else:
+            rateConstant = self.kinetics.getRateCoefficient(T, P)
+            if self.thirdBody: rateConstant *= totalConc
 
         # Evaluate equilibrium constant
         equilibriumConstant = self.getEquilibriumConstant(T)
@@ -293,17 +336,53 @@ class Reaction:
         kf = self.kinetics
 
         # Determine the values of the reverse rate coefficient k_r(T) at each temperature
-        klist = numpy.zeros_like(Tlist)
-        for i in range(len(Tlist)):
-            klist[i] = kf.getRateCoefficient(Tlist[i]) / self.getEquilibriumConstant(Tlist[i])
+        klist = kf.getRateCoefficients(Tlist) / self.getEquilibriumConstants(Tlist)
 
         # Fit and return an Arrhenius model to the k_r(T) data
         kr = ArrheniusModel()
         kr.fitToData(Tlist, klist, kf.T0)
         return kr
 
-    def calculateTSTRateCoefficients(self, Tlist, tunneling=''):
-        return numpy.array([self.calculateTSTRateCoefficient(T, tunneling) for T in Tlist], numpy.float64)
+    def calculateTSTRateCoefficients(self, Tlist, tunneling='', logPartitionFunctions=None):
+        """
+        Evaluate the forward rate coefficients for the reaction at the
+        temperatures `Tlist` in K using (canonical) transition state theory;
+        see :meth:`calculateTSTRateCoefficient()`. The logarithms of the
+        partition functions of the reactants and the transition state are
+        evaluated at all of the temperatures at once, and are combined in log
+        space to avoid overflow. If a dictionary `logPartitionFunctions` is given, it is used
+        to look up and store the logarithms of the partition functions of each
+        reactant and transition state at `Tlist`, so that they can be shared
+        among several reactions; see
+        :meth:`ReactionModel.calculateTSTRateCoefficients()`.
+        """
+        cython.declare(E0=cython.double, logk=numpy.ndarray, logV=numpy.ndarray, klist=numpy.ndarray, spec=Species)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        
+        if logPartitionFunctions is None:
+            logPartitionFunctions = {}
+        for spec in self.reactants:
+            if spec not in logPartitionFunctions:
+                logPartitionFunctions[spec] = spec.states.getLogPartitionFunctions(Tlist)
+        if self.transitionState not in logPartitionFunctions:
+            logPartitionFunctions[self.transitionState] = self.transitionState.states.getLogPartitionFunctions(Tlist)
+        
+        # Determine barrier height
+        E0 = self.transitionState.E0 - sum([spec.E0 for spec in self.reactants])
+        # Determine TST rate constant at each temperature; each partition
+        # function is divided by the reference volume RT/P0
+        logV = numpy.log(constants.R * Tlist / 1e5)
+        logk = math.log(self.transitionState.degeneracy) + numpy.log(constants.kB * Tlist / constants.h) - E0 / constants.R / Tlist
+        logk += logPartitionFunctions[self.transitionState] - logV
+        for spec in self.reactants:
+            logk -= logPartitionFunctions[spec] - logV
+        klist = numpy.exp(logk)
+        # Apply tunneling correction
+        if tunneling.lower() == 'wigner':
+            klist *= self.calculateWignerTunnelingCorrections(Tlist)
+        elif tunneling.lower() == 'eckart':
+            klist *= self.calculateEckartTunnelingCorrections(Tlist)
+        return klist
 
     def calculateTSTRateCoefficient(self, T, tunneling=''):
         """
@@ -321,20 +400,7 @@ class Reaction:
         is the Planck constant. :math:`\\kappa(T)` is an optional tunneling
         correction.
         """
-        cython.declare(E0=cython.double)
-        # Determine barrier height
-        E0 = self.transitionState.E0 - sum([spec.E0 for spec in self.reactants])
-        # Determine TST rate constant at each temperature
-        Qreac = 1.0
-        for spec in self.reactants: Qreac *= spec.states.getPartitionFunction(T) / (constants.R * T / 1e5)
-        Qts = self.transitionState.states.getPartitionFunction(T) / (constants.R * T / 1e5)
-        k = self.transitionState.degeneracy * (constants.kB * T / constants.h * Qts / Qreac *	numpy.exp(-E0 / constants.R / T))
-        # Apply tunneling correction
-        if tunneling.lower() == 'wigner':
-            k *= self.calculateWignerTunnelingCorrection(T)
-        elif tunneling.lower() == 'eckart':
-            k *= self.calculateEckartTunnelingCorrection(T)
-        return k
+        return self.calculateTSTRateCoefficients(numpy.array([T], numpy.float64), tunneling)[0]
     
     def calculateWignerTunnelingCorrection(self, T):
         """
@@ -353,6 +419,17 @@ class Reaction:
         """
         frequency = abs(self.transitionState.frequency)
         return 1.0 + (constants.h * constants.c * 100.0 * frequency / constants.kB / T)**2 / 24.0
+
+    def calculateWignerTunnelingCorrections(self, Tlist):
+        """
+        Calculate and return the values of the Wigner tunneling correction for
+        the reaction with corresponding transition state `TS` at the list of
+        temperatures `Tlist` in K, using the formula given in
+        :meth:`calculateWignerTunnelingCorrection()`.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        frequency = abs(self.transitionState.frequency)
+        return 1.0 + (constants.h * constants.c * 100.0 * frequency / constants.kB / Tlist)**2 / 24.0
     
     def calculateEckartTunnelingCorrection(self, T):
         """
@@ -391,10 +468,24 @@ class Reaction:
         extra information allows the Eckart correction to generally give a
         better result than the Wignet correction.
         """
+        return self.calculateEckartTunnelingCorrections(numpy.array([T], numpy.float64))[0]
+
+    def calculateEckartTunnelingCorrections(self, Tlist):
+        """
+        Calculate and return the values of the Eckart tunneling correction for
+        the reaction with corresponding transition state `TS` at the list of
+        temperatures `Tlist` in K, using the formula given in
+        :meth:`calculateEckartTunnelingCorrection()`. The integrals at all of
+        the temperatures are evaluated at once using fixed-order Gauss-Legendre
+        quadrature, after shifting the integration variable to the barrier
+        height and mapping it with a hyperbolic sine scaled by the width of the
+        barrier, so that the rapid change in the transmission probability near
+        the top of the barrier is resolved.
+        """
         
         cython.declare(frequency=cython.double, alpha1=cython.double, alpha2=cython.double, dV1=cython.double, dV2=cython.double)
-        cython.declare(kappa=cython.double, E_kT=numpy.ndarray, f=numpy.ndarray, integral=cython.double)
-        cython.declare(i=cython.int, tol=cython.double, fcrit=cython.double, E_kTmin=cython.double, E_kTmax=cython.double)
+        cython.declare(kT=numpy.ndarray, E0_kT=numpy.ndarray, width=numpy.ndarray, tmin=numpy.ndarray, tmax=numpy.ndarray)
+        cython.declare(x=numpy.ndarray, w=numpy.ndarray, t=numpy.ndarray, dE_kT=numpy.ndarray, edges=numpy.ndarray)
         
         frequency = abs(self.transitionState.frequency)
         
@@ -412,68 +503,60 @@ class Reaction:
         alpha1 = 2 * math.pi * dV1 / constants.Na / (constants.h * constants.c * 100.0 * frequency)
         alpha2 = 2 * math.pi * dV2 / constants.Na / (constants.h * constants.c * 100.0 * frequency)
         
-        # Integrate to get Eckart correction
-        kappa = 0.0
+        # The integrand is sharply peaked near the top of the barrier, with a
+        # width (in units of kB * T) set by the imaginary frequency, so we
+        # integrate in terms of the energy relative to the barrier height,
+        # dE_kT = width * sinh(t), from E = 0 to 50 kB * T above the barrier
+        kT = constants.R * numpy.asarray(Tlist, numpy.float64).reshape(-1,1) # [=] J/mol
+        E0_kT = dV1 / kT
+        width = E0_kT / alpha1
+        tmin = numpy.arcsinh(-E0_kT / width)
+        tmax = numpy.arcsinh(50.0 / width)
         
-        # First we need to determine the lower and upper bounds at which to
-        # truncate the integral
-        tol = 1e-3
-        E_kT = numpy.arange(0.0, 1000.01, 0.1)
-        f = numpy.zeros_like(E_kT)
-        for j in range(len(E_kT)):
-            f[j] = self.__eckartIntegrand(E_kT[j], constants.R * T, dV1, alpha1, alpha2)
-        # Find the cutoff values of the integrand
-        fcrit = tol * f.max()
-        x = (f > fcrit).nonzero()
-        E_kTmin = E_kT[x[0][0]]
-        E_kTmax = E_kT[x[0][-1]]
-
-        # Now that we know the bounds we can formally integrate
-        import scipy.integrate
-        integral = scipy.integrate.quad(self.__eckartIntegrand, E_kTmin, E_kTmax,
-            args=(constants.R * T,dV1,alpha1,alpha2,))[0]
-        kappa = integral * math.exp(dV1 / constants.R / T)
+        # Gauss-Legendre nodes x and weights w on [0, 1], using four panels
+        # of 32 points each
+        x, w = numpy.polynomial.legendre.leggauss(32)
+        edges = numpy.linspace(0.0, 1.0, 5)
+        x = (edges[:-1].reshape(-1,1) + 0.5 * (x + 1) * (edges[1:] - edges[:-1]).reshape(-1,1)).reshape(1,-1)
+        w = (0.5 * w * (edges[1:] - edges[:-1]).reshape(-1,1)).reshape(1,-1)
         
-        # Return the calculated Eckart correction
-        return kappa
+        # Integrate to get Eckart correction at each temperature
+        t = tmin + (tmax - tmin) * x
+        dE_kT = width * numpy.sinh(t)
+        return numpy.sum(w * (tmax - tmin) * width * numpy.cosh(t) * self.__eckartIntegrand(E0_kT + dE_kT, kT, dV1, alpha1, alpha2), axis=1)
     
     def __eckartIntegrand(self, E_kT, kT, dV1, alpha1, alpha2):
-        # Evaluate the integrand of the Eckart tunneling correction integral
-        # for the given values
-        #    E_kT = energy scaled by kB * T (dimensionless)
-        #    kT = Boltzmann constant * T [=] J/mol
+        # Evaluate the integrand of the Eckart tunneling correction integral,
+        # including the factor of exp(dV1 / kT), for the given values
+        #    E_kT = energy scaled by kB * T (dimensionless, array)
+        #    kT = Boltzmann constant * T [=] J/mol (array broadcastable with E_kT)
         #    dV1 = energy difference between TS and reactants [=] J/mol
         #    alpha1, alpha2 dimensionless
         
-        cython.declare(xi=cython.double, twopia=cython.double, twopib=cython.double, twopid=cython.double, kappaE=cython.double)
-        from math import sqrt, exp, cosh, pi
+        cython.declare(xi=numpy.ndarray, twopia=numpy.ndarray, twopib=numpy.ndarray, twopid=cython.double)
+        cython.declare(scale=numpy.ndarray, kappaE=numpy.ndarray)
         
         xi = E_kT * kT / dV1
         # 2 * pi * a
-        twopia = 2*sqrt(alpha1*xi)/(1/sqrt(alpha1)+1/sqrt(alpha2))
+        twopia = 2*numpy.sqrt(alpha1*xi)/(1/math.sqrt(alpha1)+1/math.sqrt(alpha2))
         # 2 * pi * b
-        twopib = 2*sqrt(abs((xi-1)*alpha1+alpha2))/(1/sqrt(alpha1)+1/sqrt(alpha2))
+        twopib = 2*numpy.sqrt(numpy.abs((xi-1)*alpha1+alpha2))/(1/math.sqrt(alpha1)+1/math.sqrt(alpha2))
         # 2 * pi * d
-        twopid = 2*sqrt(abs(alpha1*alpha2-4*pi*pi/16))
+        twopid = 2*math.sqrt(abs(alpha1*alpha2-4*math.pi*math.pi/16))
         
-        # We use different approximate versions of the integrand to avoid
-        # domain errors when evaluating cosh(x) for large x
-        # If all of 2*pi*a, 2*pi*b, and 2*pi*d are sufficiently small,
-        # compute as normal
-        if twopia < 200 and twopib < 200 and twopid < 200:
-            kappaE = 1 - (cosh(twopia-twopib)+cosh(twopid)) / (cosh(twopia+twopib)+cosh(twopid))
-        # If one of the following is true, then we can eliminate most of the
-        # exponential terms after writing out the definition of cosh and
-        # dividing all terms by exp(2*pi*d)
-        elif twopia-twopib-twopid > 10 or twopib-twopia-twopid > 10 or twopia+twopib-twopid > 10:
-            kappaE = 1 - exp(-2*twopia) - exp(-2*twopib) - exp(-twopia-twopib+twopid) - exp(-twopia-twopib-twopid)
-        # Otherwise expand each cosh(x) in terms of its exponentials and divide
-        # all terms by exp(2*pi*d) before evaluating
-        else:
-            kappaE = 1 - (exp(twopia-twopib-twopid) + exp(-twopia+twopib-twopid) + 1 + exp(-2*twopid)) / (exp(twopia+twopib-twopid) + exp(-twopia-twopib-twopid) + 1 + exp(-2*twopid))
+        # Using cosh(x+y) - cosh(x-y) = 2 sinh(x) sinh(y), the transmission
+        # probability is
+        #    1 - (cosh(2*pi*a-2*pi*b)+cosh(2*pi*d)) / (cosh(2*pi*a+2*pi*b)+cosh(2*pi*d))
+        #    = 2 sinh(2*pi*a) sinh(2*pi*b) / (cosh(2*pi*a+2*pi*b)+cosh(2*pi*d))
+        # We write each hyperbolic function in terms of exponentials and
+        # divide through by the largest of them to avoid overflow and
+        # cancellation for large or small arguments
+        scale = numpy.maximum(twopia+twopib, twopid)
+        kappaE = numpy.expm1(-2*twopia) * numpy.expm1(-2*twopib) * numpy.exp(twopia+twopib-scale) / \
+            (numpy.exp(twopia+twopib-scale) + numpy.exp(-twopia-twopib-scale) + numpy.exp(twopid-scale) + numpy.exp(-twopid-scale))
 
         # Complete and return integrand
-        return exp(-E_kT) * kappaE
+        return numpy.exp(dV1 / kT - E_kT) * kappaE
     
 ################################################################################
 
@@ -482,20 +565,46 @@ class ReactionModel:
     A chemical reaction model, composed of a list of species and a list of
     reactions.
 
-    =============== =========================== ================================
-    Attribute       Type                        Description
-    =============== =========================== ================================
-    `species`       :class:`list`               The species involved in the reaction model
-    `reactions`     :class:`list`               The reactions comprising the reaction model
-    `stoichiometry` :class:`numpy.ndarray`      The stoichiometric matrix for the reaction model, stored as a sparse matrix
-    =============== =========================== ================================
+    ========================== ======================= =====================
+    Attribute                  Type                    Description
+    ========================== ======================= =====================
+    `species`                  :class:`list`           The species involved in the reaction model
+    `reactions`                :class:`list`           The reactions comprising the reaction model
+    `stoichiometry`            :class:`numpy.ndarray`  The stoichiometric matrix for the reaction model, stored as a sparse matrix
+    `stoichiometryTranspose`   :class:`numpy.ndarray`  The transpose of the stoichiometric matrix, stored as a sparse matrix
+    ========================== ======================= =====================
 
+    To evaluate the reaction rates quickly, the reaction model also stores the
+    species indices of the reactants and products of every reaction in
+    integer arrays; see :meth:`generateReactionIndices()`. The free
+    energies of the species and the equilibrium constants of the reactions
+    are cached for the most recently used temperature; see
+    :meth:`getFreeEnergies()`. A compact copy of the model that contains only
+    what is needed to evaluate the reaction rates and their Jacobian can be
+    made using :meth:`generateCompactModel()`.
     """
 
     def __init__(self, species=None, reactions=None):
         self.species = species or []
         self.reactions = reactions or []
         self.stoichiometry = None
+        self.stoichiometryTranspose = None
+        self.reactantIndices = None
+        self.productIndices = None
+        self.deltaMoles = None
+        self.thirdBodyFlags = None
+        self.kineticsTable = None
+        self.arrheniusIndices = None
+        self.otherIndices = None
+        self.otherKinetics = None
+        self.efficiencies = None
+        self.thirdBodyIndices = None
+        self.jacobianIndices = None
+        self.jacobianIndptr = None
+        self.jacobianMap = None
+        self._cacheTemperature = 0.0
+        self._freeEnergies = None
+        self._equilibriumConstants = None
 
     def generateStoichiometryMatrix(self):
         """
@@ -504,38 +613,439 @@ class ReactionModel:
         rows correspond to the `index` attribute of each species object, while
         the columns correspond to the `index` attribute of each reaction object.
         The generated matrix is not returned, but is instead stored in the
-        `stoichiometry` attribute for future use.
+        `stoichiometry` attribute for future use, in compressed-sparse-row
+        format; its transpose is also stored, in compressed-sparse-column
+        format, in the `stoichiometryTranspose` attribute.
         """
-        cython.declare(rxn=Reaction, spec=Species, i=cython.int, j=cython.int, nu=cython.int)
+        cython.declare(Nspec=cython.int, Nrxn=cython.int, order=cython.int)
+        cython.declare(rows=numpy.ndarray, cols=numpy.ndarray, data=numpy.ndarray, mask=numpy.ndarray)
         from scipy import sparse
 
-        # Use dictionary-of-keys format to efficiently assemble stoichiometry matrix
-        self.stoichiometry = sparse.dok_matrix((len(self.species), len(self.reactions)), numpy.float64)
+        if self.reactantIndices is None:
+            self.generateReactionIndices()
+        Nspec = len(self.species); Nrxn = len(self.reactions)
+        order = self.reactantIndices.shape[1]
+
+        # Assemble the matrix in coordinate format directly from the reactant
+        # and product index arrays, skipping the padding; duplicate entries
+        # (e.g. a species appearing twice, or as both reactant and product)
+        # are summed when converting to compressed-sparse-row format
+        rows = numpy.concatenate((self.reactantIndices.reshape(-1), self.productIndices.reshape(-1)))
+        cols = numpy.tile(numpy.repeat(numpy.arange(Nrxn), order), 2)
+        data = numpy.concatenate((-numpy.ones(Nrxn * order, numpy.float64), numpy.ones(Nrxn * order, numpy.float64)))
+        mask = rows < Nspec
+        self.stoichiometry = sparse.coo_matrix((data[mask], (rows[mask], cols[mask])), shape=(Nspec, Nrxn)).tocsr()
+        self.stoichiometry.eliminate_zeros()
+        self.stoichiometryTranspose = self.stoichiometry.transpose().tocsc()
+
+    def generateReactionIndices(self):
+        """
+        Generate the integer arrays used to evaluate the reaction rates. Row
+        ``j`` of `reactantIndices` and `productIndices` contains the species
+        indices (starting from zero) of the reactants and products of the
+        reaction whose `index` attribute is ``j + 1``, padded with the number
+        of species; the padding refers to an extra entry with a concentration
+        of one. The reactions with
+        :class:`ArrheniusModel` kinetics are collected into a
+        :class:`KineticsTable` so that their rate coefficients can be
+        evaluated at once, and the collision efficiencies of the reactions
+        with :class:`ThirdBodyModel` kinetics are collected into arrays.
+        This must be called again if the species or reactions are changed.
+        """
+        cython.declare(rxn=Reaction, spec=Species, Nspec=cython.int, Nrxn=cython.int, order=cython.int)
+        cython.declare(j=cython.int, i=cython.int, arrhenius=list, other=list, reactions=list, species=list)
+
+        Nspec = len(self.species); Nrxn = len(self.reactions)
+        species = [None for spec in self.species]
+        for spec in self.species:
+            species[spec.index - 1] = spec
+        reactions = [None for rxn in self.reactions]
         for rxn in self.reactions:
-            j = rxn.index - 1
-            # Only need to iterate over the species involved in the reaction,
-            # not all species in the reaction model
-            for spec in rxn.reactants:
-                i = spec.index - 1
-                nu = rxn.getStoichiometricCoefficient(spec)
-                if nu != 0: self.stoichiometry[i,j] = nu
-            for spec in rxn.products:
-                i = spec.index - 1
-                nu = rxn.getStoichiometricCoefficient(spec)
-                if nu != 0: self.stoichiometry[i,j] = nu
-
-        # Convert to compressed-sparse-row format for efficient use in matrix operations
-        self.stoichiometry.tocsr()
+            reactions[rxn.index - 1] = rxn
+
+        order = max([max(len(rxn.reactants), len(rxn.products)) for rxn in self.reactions] or [1])
+        self.reactantIndices = numpy.empty((Nrxn, order), numpy.int64); self.reactantIndices.fill(Nspec)
+        self.productIndices = numpy.empty((Nrxn, order), numpy.int64); self.productIndices.fill(Nspec)
+        self.deltaMoles = numpy.zeros(Nrxn, numpy.float64)
+        self.thirdBodyFlags = numpy.zeros(Nrxn, numpy.bool_)
+        arrhenius = []; other = []
+        for j in range(Nrxn):
+            rxn = reactions[j]
+            for i, spec in enumerate(rxn.reactants):
+                self.reactantIndices[j,i] = spec.index - 1
+            for i, spec in enumerate(rxn.products):
+                self.productIndices[j,i] = spec.index - 1
+            self.deltaMoles[j] = len(rxn.products) - len(rxn.reactants)
+            if isinstance(rxn.kinetics, ArrheniusModel):
+                arrhenius.append(j)
+                self.thirdBodyFlags[j] = rxn.thirdBody
+            else:
+                other.append(j)
+                self.thirdBodyFlags[j] = rxn.thirdBody and not isinstance(rxn.kinetics, ThirdBodyModel)
+
+        self.arrheniusIndices = numpy.array(arrhenius, numpy.int64)
+        self.kineticsTable = KineticsTable([reactions[j].kinetics for j in arrhenius])
+        self.otherIndices = other
+        self.otherKinetics = [reactions[j].kinetics for j in other]
+        self.efficiencies = [reactions[j].kinetics.getEfficiencies(species) if isinstance(reactions[j].kinetics, ThirdBodyModel) else None for j in other]
+
+        # The species or reactions may have changed, so clear the stoichiometry
+        # matrix, the Jacobian sparsity pattern, and the cached free energies
+        # and equilibrium constants
+        self.stoichiometry = None
+        self.stoichiometryTranspose = None
+        self.jacobianIndices = None
+        self.jacobianIndptr = None
+        self.jacobianMap = None
+        self._freeEnergies = None
+        self._equilibriumConstants = None
+
+    def __getRateTerms(self, T, P, Ci):
+        """
+        Return the concentrations `Ci` as an array (with an extra entry of one
+        for the padding in the index arrays), the rate coefficients (without
+        the factor of the total concentration for third-body reactions), the
+        equilibrium constants, and the total concentration.
+        """
+        cython.declare(C=numpy.ndarray, kf=numpy.ndarray, totalConc=cython.double, spec=Species, i=cython.int, j=cython.int)
+
+        if self.reactantIndices is None:
+            self.generateReactionIndices()
+
+        # Append an entry of one to the concentrations for the padding in the
+        # index arrays
+        C = numpy.ones(len(self.species) + 1, numpy.float64)
+        if isinstance(Ci, dict):
+            C[:-1] = 0.0
+            for spec in Ci:
+                C[spec.index - 1] = Ci[spec]
+        else:
+            C[:-1] = Ci
+        totalConc = numpy.sum(C[:-1])
+
+        # Evaluate rate coefficients
+        kf = numpy.zeros(len(self.reactantIndices), numpy.float64)
+        kf[self.arrheniusIndices] = self.kineticsTable.getRateCoefficients(T)
+        for i in range(len(self.otherIndices)):
+            j = self.otherIndices[i]
+            if self.efficiencies[i] is not None:
+                kf[j] = self.otherKinetics[i].getRateCoefficient(T, P, numpy.dot(self.efficiencies[i], C[:-1]))
+            else:
+                kf[j] = self.otherKinetics[i].getRateCoefficient(T, P)
+
+        return C, kf, self.getEquilibriumConstants(T), totalConc
+
+    def getFreeEnergies(self, T):
+        """
+        Return an array of the Gibbs free energies in J/mol of each species in
+        the model at temperature `T` in K, ordered by the `index` attribute of
+        each species. The free energies are cached, so repeated calls at the
+        same temperature (e.g. in successive evaluations of the reaction rates
+        in an isothermal simulation) do not evaluate the thermodynamics models
+        again.
+        """
+        cython.declare(spec=Species)
+        if self._freeEnergies is None or T != self._cacheTemperature:
+            self._freeEnergies = numpy.zeros(len(self.species), numpy.float64)
+            for spec in self.species:
+                self._freeEnergies[spec.index - 1] = spec.thermo.getFreeEnergy(T)
+            self._cacheTemperature = T
+            self._equilibriumConstants = None
+        return self._freeEnergies
+
+    def getEquilibriumConstants(self, T):
+        """
+        Return an array of the equilibrium constants in terms of concentrations
+        of each reaction in the model at temperature `T` in K, ordered by the
+        `index` attribute of each reaction. The equilibrium constants are
+        obtained from the free energies of the species via the stoichiometry
+        matrix, assuming an ideal gas mixture with reference pressure
+        P0 = 1e5 Pa, and are cached along with the free energies.
+        """
+        cython.declare(G=numpy.ndarray, dGrxn=numpy.ndarray)
+        if self.stoichiometry is None:
+            self.generateStoichiometryMatrix()
+        G = self.getFreeEnergies(T)
+        if self._equilibriumConstants is None:
+            dGrxn = self.stoichiometryTranspose.dot(G)
+            self._equilibriumConstants = numpy.exp(-dGrxn / constants.R / T) * (1e5 / constants.R / T) ** self.deltaMoles
+        return self._equilibriumConstants
 
     def getReactionRates(self, T, P, Ci):
         """
         Return an array of reaction rates for each reaction in the model core
-        and edge. The id of the reaction is the index into the vector.
+        and edge. The id of the reaction is the index into the vector. The
+        concentrations `Ci` in mol/m^3 are given either as an array ordered by
+        the `index` attribute of each species or as a map with species as
+        keys and concentrations as values.
+        """
+        cython.declare(C=numpy.ndarray, kf=numpy.ndarray, Kc=numpy.ndarray, totalConc=cython.double)
+        cython.declare(forward=numpy.ndarray, reverse=numpy.ndarray)
+
+        C, kf, Kc, totalConc = self.__getRateTerms(T, P, Ci)
+        kf[self.thirdBodyFlags] *= totalConc
+
+        # Evaluate forward and reverse concentration products
+        forward = numpy.prod(C[self.reactantIndices], axis=1)
+        reverse = numpy.prod(C[self.productIndices], axis=1)
+
+        return kf * (forward - reverse / Kc)
+
+    def getNetProductionRates(self, T, P, Ci):
+        """
+        Return an array of the net rates of production of each species in the
+        model core and edge, obtained by multiplying the stoichiometry matrix
+        by the reaction rates. The id of the species is the index into the
+        vector. The concentrations `Ci` are given as in
+        :meth:`getReactionRates()`.
+        """
+        if self.stoichiometry is None:
+            self.generateStoichiometryMatrix()
+        return self.stoichiometry.dot(self.getReactionRates(T, P, Ci))
+
+    def generateJacobianPattern(self):
+        """
+        Generate the sparsity pattern of the Jacobian of the net rates of
+        production with respect to the species concentrations. The Jacobian
+        is the product of the stoichiometry matrix and the derivatives of the
+        reaction rates; the latter are evaluated as one array of values, one
+        for each reactant or product position in the reactant and product
+        index arrays followed by one for each species in each reaction whose
+        rate depends on the third-body concentration. The pattern is stored
+        as the `indices` and `indptr` arrays of a compressed-sparse-row
+        matrix, along with a sparse matrix mapping the array of values to the
+        nonzero entries of the Jacobian. The pattern is cleared by
+        :meth:`generateReactionIndices()` and regenerated when next needed.
+        """
+        cython.declare(Nspec=cython.int, Nrxn=cython.int, order=cython.int, i=cython.int)
+        cython.declare(rows=numpy.ndarray, cols=numpy.ndarray, valid=numpy.ndarray, entries=numpy.ndarray, S=object)
+        cython.declare(starts=numpy.ndarray, counts=numpy.ndarray, offsets=numpy.ndarray, positions=numpy.ndarray)
+        cython.declare(keys=numpy.ndarray, unique=numpy.ndarray, inverse=numpy.ndarray)
+        from scipy import sparse
+
+        if self.stoichiometry is None:
+            self.generateStoichiometryMatrix()
+        Nspec = len(self.species); Nrxn = len(self.reactions)
+        order = self.reactantIndices.shape[1]
+
+        # The reactions whose rates depend on the third-body concentration
+        self.thirdBodyIndices = numpy.concatenate((
+            numpy.flatnonzero(self.thirdBodyFlags),
+            numpy.array([self.otherIndices[i] for i in range(len(self.otherIndices)) if self.efficiencies[i] is not None], numpy.int64),
+        )).astype(numpy.int64)
+
+        # The (reaction, species) pair of each value in the array of reaction
+        # rate derivatives
+        rows = numpy.concatenate((
+            numpy.tile(numpy.repeat(numpy.arange(Nrxn), order), 2),
+            numpy.repeat(self.thirdBodyIndices, Nspec),
+        ))
+        cols = numpy.concatenate((
+            self.reactantIndices.reshape(-1),
+            self.productIndices.reshape(-1),
+            numpy.tile(numpy.arange(Nspec), len(self.thirdBodyIndices)),
+        ))
+        valid = cols < Nspec
+        entries = numpy.flatnonzero(valid)
+        rows = rows[valid]; cols = cols[valid]
+
+        # Each value contributes to the Jacobian entry (i, s) for every species
+        # i with a nonzero stoichiometric coefficient in reaction j
+        S = self.stoichiometry.tocsc()
+        starts = S.indptr[rows]
+        counts = S.indptr[rows + 1] - starts
+        offsets = numpy.arange(numpy.sum(counts)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        positions = numpy.repeat(starts, counts) + offsets
+        keys = S.indices[positions].astype(numpy.int64) * Nspec + numpy.repeat(cols, counts)
+        unique, inverse = numpy.unique(keys, return_inverse=True)
+
+        self.jacobianIndices = (unique % Nspec).astype(numpy.int32)
+        self.jacobianIndptr = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(unique // Nspec, minlength=Nspec)))).astype(numpy.int32)
+        self.jacobianMap = sparse.coo_matrix(
+            (S.data[positions], (inverse, numpy.repeat(entries, counts))),
+            shape=(len(unique), len(valid)),
+        ).tocsr()
+
+    def getJacobian(self, T, P, Ci):
         """
-        cython.declare(rxnRates=numpy.ndarray, rxn=Reaction, j=cython.int)
-        rxnRates = numpy.zeros(len(self.reactions), numpy.float64)
+        Return the Jacobian of the net rates of production of each species
+        with respect to the species concentrations as a compressed-sparse-row
+        matrix, whose rows and columns are ordered by the `index` attribute of
+        each species. The derivatives of the mass-action rate expressions are
+        evaluated analytically, as is the dependence on the third-body
+        concentration, except for falloff kinetics, where the derivative of
+        the rate coefficient with respect to the third-body concentration is
+        evaluated by finite difference. The concentrations `Ci` are given as
+        in :meth:`getReactionRates()`.
+        """
+        cython.declare(C=numpy.ndarray, kf=numpy.ndarray, Kc=numpy.ndarray, totalConc=cython.double)
+        cython.declare(kr=numpy.ndarray, forward=numpy.ndarray, reverse=numpy.ndarray, net=numpy.ndarray)
+        cython.declare(reactantValues=numpy.ndarray, productValues=numpy.ndarray, thirdBodyValues=list)
+        cython.declare(factors=numpy.ndarray, order=cython.int, p=cython.int, i=cython.int, j=cython.int)
+        cython.declare(M=cython.double, dM=cython.double, dkdM=cython.double, kinetics=KineticsModel)
+        from scipy import sparse
+
+        if self.jacobianMap is None:
+            self.generateJacobianPattern()
+
+        C, kf, Kc, totalConc = self.__getRateTerms(T, P, Ci)
+        forward = numpy.prod(C[self.reactantIndices], axis=1)
+        reverse = numpy.prod(C[self.productIndices], axis=1)
+        net = forward - reverse / Kc
+
+        # Third-body terms: d(rate)/dC_s = (dk/dM) (dM/dC_s) (forward - reverse / Kc)
+        thirdBodyValues = [numpy.outer(kf[self.thirdBodyFlags] * net[self.thirdBodyFlags], numpy.ones(len(self.species), numpy.float64))]
+        for i in range(len(self.otherIndices)):
+            if self.efficiencies[i] is None: continue
+            j = self.otherIndices[i]; kinetics = self.otherKinetics[i]
+            M = numpy.dot(self.efficiencies[i], C[:-1])
+            if type(kinetics) is ThirdBodyModel:
+                dkdM = kinetics.arrheniusLow.getRateCoefficient(T)
+            else:
+                dM = 1.0e-6 * M + 1.0e-12
+                dkdM = (kinetics.getRateCoefficient(T, P, M + dM) - kf[j]) / dM
+            thirdBodyValues.append((dkdM * net[j] * self.efficiencies[i]).reshape((1, len(self.species))))
+        kf[self.thirdBodyFlags] *= totalConc
+
+        # Mass-action terms: the derivative of each concentration product with
+        # respect to the concentration at one position is the product of the
+        # concentrations at the other positions
+        order = self.reactantIndices.shape[1]
+        kr = kf / Kc
+        reactantValues = numpy.empty((len(self.reactantIndices), order), numpy.float64)
+        productValues = numpy.empty((len(self.reactantIndices), order), numpy.float64)
+        for p in range(order):
+            factors = C[self.reactantIndices]; factors[:,p] = 1.0
+            reactantValues[:,p] = kf * numpy.prod(factors, axis=1)
+            factors = C[self.productIndices]; factors[:,p] = 1.0
+            productValues[:,p] = -kr * numpy.prod(factors, axis=1)
+
+        return sparse.csr_matrix((
+            self.jacobianMap.dot(numpy.concatenate([reactantValues.reshape(-1), productValues.reshape(-1)] + [values.reshape(-1) for values in thirdBodyValues])),
+            self.jacobianIndices, self.jacobianIndptr,
+        ), shape=(len(self.species), len(self.species)))
+
+    def generateCompactModel(self):
+        """
+        Return a copy of the reaction model that contains only what is needed
+        to evaluate the reaction rates and their Jacobian: the reaction index
+        arrays, the kinetics table, the other kinetics models, the
+        stoichiometry matrix, the Jacobian sparsity pattern, and the
+        thermodynamics model of each species. The species of the copy are new
+        :class:`Species` objects with only the index, label, and
+        thermodynamics model of the originals, and the copy has no reactions,
+        so it is much cheaper to copy or to send to another process than the
+        full model, e.g. in :func:`chempy.reactor.simulateConditions()`. The
+        arrays cannot be regenerated from the copy, so a new copy must be made
+        if the species or reactions are changed.
+        """
+        cython.declare(model=ReactionModel, spec=Species, species=dict, kinetics=KineticsModel)
+        import copy
+
+        if self.jacobianMap is None:
+            self.generateJacobianPattern()
+
+        species = {}
+        for spec in self.species:
+            species[spec] = Species(index=spec.index, label=spec.label, thermo=spec.thermo)
+        model = ReactionModel(species=[species[spec] for spec in self.species])
+        model.stoichiometry = self.stoichiometry
+        model.stoichiometryTranspose = self.stoichiometryTranspose
+        model.reactantIndices = self.reactantIndices
+        model.productIndices = self.productIndices
+        model.deltaMoles = self.deltaMoles
+        model.thirdBodyFlags = self.thirdBodyFlags
+        model.kineticsTable = self.kineticsTable
+        model.arrheniusIndices = self.arrheniusIndices
+        model.otherIndices = self.otherIndices
+        model.efficiencies = self.efficiencies
+        model.thirdBodyIndices = self.thirdBodyIndices
+        model.jacobianIndices = self.jacobianIndices
+        model.jacobianIndptr = self.jacobianIndptr
+        model.jacobianMap = self.jacobianMap
+
+        # The collision efficiencies refer to the original species, so point
+        # them at the new species instead
+        model.otherKinetics = []
+        for kinetics in self.otherKinetics:
+            if isinstance(kinetics, ThirdBodyModel):
+                kinetics = copy.copy(kinetics)
+                kinetics.efficiencies = dict([(species[spec], efficiency) for spec, efficiency in kinetics.efficiencies.iteritems() if spec in species])
+            model.otherKinetics.append(kinetics)
+
+        return model
+
+    def generateReverseRateCoefficients(self, Tlist):
+        """
+        Generate and return rate coefficient models for the reverse of every
+        reaction in the model using a supplied set of temperatures `Tlist`.
+        The free energies of the species are evaluated once, the equilibrium
+        constants of all reactions are obtained from them using the
+        stoichiometry matrix, and the reverse Arrhenius expressions are fitted
+        together using :func:`fitArrheniusModels()`. The returned list is
+        ordered by the `index` attribute of each reaction. Currently this only
+        works if the `kinetics` attribute of every reaction is an
+        :class:`ArrheniusModel` object.
+        """
+        cython.declare(rxn=Reaction, spec=Species, forward=list, reverse=list, groups=dict, columns=list)
+        cython.declare(G=numpy.ndarray, dGrxn=numpy.ndarray, dn=numpy.ndarray, Kc=numpy.ndarray)
+        cython.declare(kf=numpy.ndarray, kr=numpy.ndarray, j=cython.int, T0=cython.double)
+
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        forward = [None for rxn in self.reactions]
         for rxn in self.reactions:
-            j = rxn.index - 1
-            rxnRates[j] = rxn.getRate(T, P, Ci)
-        return rxnRates
+            if not isinstance(rxn.kinetics, ArrheniusModel):
+                raise ReactionError(rxn, "ArrheniusModel kinetics required to use ReactionModel.generateReverseRateCoefficients(), but %s object encountered." % (rxn.kinetics.__class__))
+            forward[rxn.index - 1] = rxn.kinetics
+
+        if self.stoichiometry is None:
+            self.generateStoichiometryMatrix()
+
+        # Evaluate the free energy of each species at all temperatures at once
+        G = numpy.zeros((len(self.species), len(Tlist)), numpy.float64)
+        for spec in self.species:
+            G[spec.index - 1,:] = spec.thermo.getFreeEnergies(Tlist)
 
+        # Use the stoichiometry matrix to get the free energies of reaction and
+        # the changes in the number of moles, and from them Kc (assuming an
+        # ideal gas mixture with reference pressure P0 = 1e5 Pa)
+        dGrxn = numpy.asarray(self.stoichiometryTranspose.dot(G))
+        dn = numpy.asarray(self.stoichiometry.sum(axis=0)).reshape(-1)
+        Kc = numpy.exp(-dGrxn / constants.R / Tlist) * (1e5 / constants.R / Tlist) ** dn[:,numpy.newaxis]
+
+        # Determine the values of the reverse rate coefficients at each temperature
+        kf = KineticsTable(forward).getRateCoefficients(Tlist)
+        kr = kf / Kc.T
+
+        # Fit the reverse Arrhenius expressions, doing one batch fit for each
+        # distinct reference temperature used by the forward expressions
+        groups = {}
+        for j in range(len(forward)):
+            groups.setdefault(forward[j].T0, []).append(j)
+        reverse = [None for rxn in self.reactions]
+        for T0, columns in groups.iteritems():
+            for j, model in zip(columns, fitArrheniusModels(Tlist, kr[:,columns], T0)[0]):
+                reverse[j] = model
+        return reverse
+
+    def calculateTSTRateCoefficients(self, Tlist, tunneling=''):
+        """
+        Evaluate the forward rate coefficients of every reaction in the model
+        at the temperatures `Tlist` in K using (canonical) transition state
+        theory, with optional `tunneling` correction (see
+        :meth:`Reaction.calculateTSTRateCoefficients()`). The logarithm of the
+        partition function of each species and transition state is evaluated
+        only once, even if it is involved in several reactions. The returned
+        array has one row for each reaction, ordered by the `index` attribute
+        of each reaction, and one column for each temperature. Every reaction
+        must have a transition state.
+        """
+        cython.declare(rxn=Reaction, klist=numpy.ndarray, logPartitionFunctions=dict)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        klist = numpy.zeros((len(self.reactions), len(Tlist)), numpy.float64)
+        logPartitionFunctions = {}
+        for rxn in self.reactions:
+            if rxn.transitionState is None:
+                raise ReactionError(rxn, 'Transition state required to use ReactionModel.calculateTSTRateCoefficients().')
+            klist[rxn.index - 1,:] = rxn.calculateTSTRateCoefficients(Tlist, tunneling, logPartitionFunctions)
+        return klist
@@ -0,0 +1,55 @@
+################################################################################
+#
+#   ChemPy - A chemistry toolkit for Python
+#
+#   Copyright (c) 2010 by Joshua W. Allen (jwallen@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+from reaction cimport ReactionModel
+
+cimport numpy
+
+################################################################################
+
+cdef class BatchReactor:
+
+    cdef public ReactionModel model
+    cdef public double T
+    cdef public double P
+    cdef public bint isobaric
+    cdef public str method
+    cdef public double rtol
+    cdef public double atol
+    cdef tuple _cacheState
+    cdef numpy.ndarray _cacheProductionRates
+
+    cpdef numpy.ndarray __getNetProductionRates(self, numpy.ndarray C)
+
+    cpdef numpy.ndarray getRightHandSide(self, double t, numpy.ndarray C)
+
+    cpdef getJacobian(self, double t, numpy.ndarray C)
+
+    cpdef __getSolver(self, numpy.ndarray C0, double t0, double tf)
+
+    cpdef double __getConversion(self, numpy.ndarray C, numpy.ndarray C0, numpy.ndarray indices, numpy.ndarray conversions)
+
+    cpdef tuple simulate(self, numpy.ndarray C0, double tf, numpy.ndarray outputTimes, dict terminationConversion=?)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+#
+#   ChemPy - A chemistry toolkit for Python
+#
+#   Copyright (c) 2010 by Joshua W. Allen (jwallen@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module provides a simple batch reactor for simulating the evolution of
+the species concentrations of a :class:`ReactionModel` in time. The governing
+equations are integrated with one of the stiff solvers in
+:mod:`scipy.integrate`, using the reaction rates and the analytical sparse
+Jacobian of the reaction model. Simulations of the same reaction model at many
+conditions can be run in parallel using :func:`simulateConditions()`.
+"""
+
+import cython
+import logging
+import time
+import numpy
+
+import constants
+from exception import ChemPyError
+from reaction import ReactionModel
+
+################################################################################
+
+class BatchReactor:
+    """
+    An isothermal batch reactor containing an ideal gas mixture whose
+    composition evolves according to a reaction model. The reactor is either
+    isobaric, in which case the volume changes with the number of moles so
+    that the total concentration remains :math:`P/RT`, or isochoric. The
+    attributes are:
+
+    =============== ======================= ====================================
+    Attribute       Type                    Description
+    =============== ======================= ====================================
+    `model`         :class:`ReactionModel`  The reaction model to simulate
+    `T`             :class:`float`          The temperature in K
+    `P`             :class:`float`          The pressure in Pa
+    `isobaric`      :class:`bool`           :data:`True` for constant pressure, :data:`False` for constant volume
+    `method`        :class:`str`            The integration method: ``BDF`` or ``LSODA``
+    `rtol`          :class:`float`          The relative tolerance of the integrator
+    `atol`          :class:`float`          The absolute tolerance of the integrator in mol/m^3
+    =============== ======================= ====================================
+
+    The concentrations are ordered by the `index` attribute of each species.
+    Conversions are computed on a concentration basis, i.e.
+    :math:`X = 1 - C/C_0`.
+    """
+
+    def __init__(self, model=None, T=1000.0, P=1.0e5, isobaric=True, method='BDF', rtol=1.0e-6, atol=1.0e-12):
+        self.model = model
+        self.T = T
+        self.P = P
+        self.isobaric = isobaric
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self._cacheState = None
+        self._cacheProductionRates = None
+
+    def __getNetProductionRates(self, C):
+        """
+        Return the net rates of production of each species at the
+        concentrations `C` in mol/m^3. The rates at the most recent state are
+        cached, since the integrators usually evaluate the Jacobian at the
+        state at which they have just evaluated the right-hand side.
+        """
+        if (self._cacheState is None or self._cacheState[0] != self.T or self._cacheState[1] != self.P
+            or not numpy.array_equal(self._cacheState[2], C)):
+            self._cacheProductionRates = self.model.getNetProductionRates(self.T, self.P, C)
+            self._cacheState = (self.T, self.P, numpy.array(C, numpy.float64))
+        return self._cacheProductionRates
+
+    def getRightHandSide(self, t, C):
+        """
+        Return the time derivatives of the species concentrations `C` in
+        mol/m^3 at time `t` in s. In an isobaric reactor the net change in the
+        number of moles changes the volume, which dilutes (or concentrates)
+        every species.
+        """
+        cython.declare(dCdt=numpy.ndarray)
+        dCdt = self.__getNetProductionRates(C).copy()
+        if self.isobaric:
+            dCdt -= C * (numpy.sum(dCdt) * constants.R * self.T / self.P)
+        return dCdt
+
+    def getJacobian(self, t, C):
+        """
+        Return the Jacobian of the time derivatives of the species
+        concentrations `C` in mol/m^3 at time `t` in s, as a
+        compressed-sparse-row matrix. In an isobaric reactor this requires
+        the net rates of production, which are reused from the evaluation of
+        the right-hand side at the same state.
+        """
+        cython.declare(jacobian=object, dCdt=numpy.ndarray, factor=cython.double)
+        from scipy import sparse
+        jacobian = self.model.getJacobian(self.T, self.P, C)
+        if self.isobaric:
+            factor = constants.R * self.T / self.P
+            dCdt = self.__getNetProductionRates(C)
+            jacobian = (jacobian
+                - sparse.identity(len(C), format='csr') * (numpy.sum(dCdt) * factor)
+                - sparse.csr_matrix(C.reshape((-1,1)) * factor).dot(sparse.csr_matrix(jacobian.sum(axis=0))))
+            jacobian = jacobian.tocsr()
+        if self.method == 'LSODA':
+            return jacobian.toarray()
+        return jacobian
+
+    def __getSolver(self, C0, t0, tf):
+        """
+        Return a :mod:`scipy.integrate` solver for integrating from the
+        initial concentrations `C0` in mol/m^3 at time `t0` in s to time `tf`
+        in s.
+        """
+        import scipy.integrate
+        if self.method == 'BDF':
+            solverClass = scipy.integrate.BDF
+        elif self.method == 'LSODA':
+            solverClass = scipy.integrate.LSODA
+        else:
+            raise ChemPyError('Invalid integration method "%s"; should be "BDF" or "LSODA".' % (self.method))
+        return solverClass(self.getRightHandSide, t0, numpy.array(C0, numpy.float64), tf,
+            rtol=self.rtol, atol=self.atol, jac=self.getJacobian)
+
+    def __getConversion(self, C, C0, indices, conversions):
+        """
+        Return the largest margin by which any of the species at positions
+        `indices` exceeds its target conversion `conversions`, given the
+        current and initial concentrations `C` and `C0`. A nonnegative value
+        means a target has been reached.
+        """
+        return numpy.max(1.0 - C[indices] / C0[indices] - conversions)
+
+    def generateSnapshots(self, C0, tf, outputTimes=None, stride=1, terminationConversion=None):
+        """
+        Integrate the reactor from the initial concentrations `C0` in mol/m^3
+        at time zero, yielding ``(t, C)`` tuples of the time in s and the
+        concentrations in mol/m^3 as the integration proceeds. If `outputTimes`
+        is given, snapshots are produced at those times by interpolating
+        within the integrator steps; otherwise a snapshot is produced after
+        every `stride` steps of the integrator. The integration terminates at
+        time `tf` in s, or when any of the species in the `terminationConversion`
+        dictionary reaches its conversion, in which case a final snapshot is
+        produced at the point of termination.
+        """
+        from scipy.optimize import brentq
+
+        C0 = numpy.array(C0, numpy.float64)
+        if terminationConversion:
+            indices = numpy.array([spec.index - 1 for spec in terminationConversion], numpy.int64)
+            conversions = numpy.array([terminationConversion[spec] for spec in terminationConversion], numpy.float64)
+        else:
+            indices = None; conversions = None
+        if outputTimes is not None:
+            outputTimes = numpy.asarray(outputTimes, numpy.float64)
+            outputTimes = outputTimes[outputTimes <= tf]
+
+        solver = self.__getSolver(C0, 0.0, tf)
+        step = 0; output = 0
+        if outputTimes is None:
+            yield 0.0, C0.copy()
+        while solver.status == 'running':
+            message = solver.step()
+            if solver.status == 'failed':
+                raise ChemPyError('Batch reactor integration failed at t = %g s: %s' % (solver.t, message))
+            step += 1
+
+            # Check for termination on conversion, locating the time at which
+            # the conversion is reached within the last step
+            terminated = False; tEnd = solver.t
+            if indices is not None and self.__getConversion(solver.y, C0, indices, conversions) >= 0.0:
+                terminated = True
+                interpolant = solver.dense_output()
+                if self.__getConversion(interpolant(solver.t_old), C0, indices, conversions) < 0.0:
+                    tEnd = brentq(lambda t: self.__getConversion(interpolant(t), C0, indices, conversions), solver.t_old, solver.t)
+                else:
+                    tEnd = solver.t_old
+
+            if outputTimes is not None:
+                interpolant = solver.dense_output()
+                while output < len(outputTimes) and outputTimes[output] <= tEnd:
+                    yield outputTimes[output], interpolant(outputTimes[output])
+                    output += 1
+                if terminated:
+                    if output == 0 or outputTimes[output-1] < tEnd:
+                        yield tEnd, interpolant(tEnd)
+                    return
+            elif terminated:
+                yield tEnd, solver.dense_output()(tEnd)
+                return
+            elif step % stride == 0 or solver.status == 'finished':
+                yield solver.t, solver.y.copy()
+
+    def simulate(self, C0, tf, outputTimes, terminationConversion=None):
+        """
+        Integrate the reactor from the initial concentrations `C0` in mol/m^3
+        at time zero to time `tf` in s, and return the times in s and the
+        concentrations in mol/m^3 at each of the `outputTimes` in s as arrays,
+        the latter with one row per time. The arrays are preallocated and
+        filled as the integration proceeds; if the integration terminates
+        early on reaching a conversion in `terminationConversion`, they are
+        truncated after the final snapshot at the point of termination.
+        """
+        cython.declare(tlist=numpy.ndarray, Clist=numpy.ndarray, i=cython.int)
+        tlist = numpy.zeros(len(outputTimes) + 1, numpy.float64)
+        Clist = numpy.zeros((len(outputTimes) + 1, len(C0)), numpy.float64)
+        i = 0
+        for t, C in self.generateSnapshots(C0, tf, outputTimes=outputTimes, terminationConversion=terminationConversion):
+            tlist[i] = t
+            Clist[i,:] = C
+            i += 1
+        return tlist[:i], Clist[:i,:]
+
+################################################################################
+
+# The batch reactor used by each worker process of a parameter sweep, set up
+# once per worker by _initializeSweepWorker()
+_sweepReactor = None
+
+def _initializeSweepWorker(model, options):
+    """
+    Set up the batch reactor used by a worker process of a parameter sweep
+    from the reaction model `model` and a dictionary of :class:`BatchReactor`
+    attributes `options`.
+    """
+    global _sweepReactor
+    _sweepReactor = BatchReactor(model=model, **options)
+
+def _simulateSweepCondition(task):
+    """
+    Simulate one condition of a parameter sweep using the batch reactor of
+    the current worker process. The `task` is a tuple of the index of the
+    condition, the temperature in K, pressure in Pa, initial concentrations in
+    mol/m^3, final time in s, output times in s, and termination conversions.
+    Returns the index, the output times and concentrations, and the time taken
+    in s.
+    """
+    cython.declare(index=cython.int, tlist=numpy.ndarray, Clist=numpy.ndarray, start=cython.double)
+    index, T, P, C0, tf, outputTimes, terminationConversion = task
+    start = time.time()
+    _sweepReactor.T = T
+    _sweepReactor.P = P
+    tlist, Clist = _sweepReactor.simulate(C0, tf, outputTimes, terminationConversion)
+    return index, tlist, Clist, time.time() - start
+
+def simulateConditions(model, conditions, tf, outputTimes, terminationConversion=None, processes=None, **options):
+    """
+    Simulate the reaction model `model` in a :class:`BatchReactor` at each of
+    the `conditions`, a list of tuples of temperature in K, pressure in Pa,
+    and initial concentrations in mol/m^3, from time zero to time `tf` in s,
+    recording the concentrations at the `outputTimes` in s. The remaining
+    keyword arguments set the other attributes of the reactor.
+
+    The simulations are distributed over a pool of `processes` worker
+    processes (by default, one per CPU). A compact copy of the reaction model
+    (see :meth:`ReactionModel.generateCompactModel()`), which contains the
+    reaction index arrays, kinetics table, stoichiometry matrix, Jacobian
+    sparsity pattern, and thermodynamics models of the species but not the
+    full species and reactions, is generated once and sent to each worker
+    when it starts, rather than with each condition. The species in
+    `terminationConversion` are replaced with the corresponding species of
+    the compact copy.
+    The results are yielded as tuples of the index of the condition, the
+    output times and concentrations (as returned by
+    :meth:`BatchReactor.simulate()`), and the time taken in s, in the order in
+    which the simulations finish. Progress is reported via the
+    :mod:`logging` module. If `processes` is 1, the simulations are run in the
+    current process instead.
+    """
+    cython.declare(compact=ReactionModel, species=dict, tasks=list, count=cython.int, start=cython.double)
+    import multiprocessing
+
+    model.generateReactionIndices()
+    compact = model.generateCompactModel()
+    if terminationConversion:
+        species = dict([(spec.index, spec) for spec in compact.species])
+        terminationConversion = dict([(species[spec.index], conversion) for spec, conversion in terminationConversion.iteritems()])
+    tasks = [(index, T, P, numpy.array(C0, numpy.float64), tf, numpy.asarray(outputTimes, numpy.float64), terminationConversion)
+        for index, (T, P, C0) in enumerate(conditions)]
+
+    if processes == 1:
+        _initializeSweepWorker(compact, options)
+        results = (_simulateSweepCondition(task) for task in tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes, _initializeSweepWorker, (compact, options))
+        results = pool.imap_unordered(_simulateSweepCondition, tasks)
+
+    try:
+        count = 0; start = time.time()
+        for index, tlist, Clist, elapsed in results:
+            count += 1
+            logging.info('Simulated condition %i of %i (T = %g K, P = %g Pa) in %.3f s; %i of %i complete after %.3f s.' % (index + 1, len(tasks), tasks[index][1], tasks[index][2], elapsed, count, len(tasks), time.time() - start))
+            yield index, tlist, Clist, elapsed
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
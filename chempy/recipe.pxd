@@ -0,0 +1,48 @@
+################################################################################
+#
+#   ChemPy - A chemistry toolkit for Python
+#
+#   Copyright (c) 2010 by Joshua W. Allen (jwallen@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+from molecule cimport Atom, Bond, Molecule
+from pattern cimport AtomType
+
+################################################################################
+
+cdef class ReactionRecipe:
+
+    cdef public list actions
+    cdef public list labels
+    cdef public list operations
+
+    cpdef int __getCenterIndex(self, str label)
+
+    cpdef addAction(self, list action)
+
+    cpdef __updateAtomType(self, Molecule molecule, Atom atom, int opcode, value, list log, list unresolved)
+
+    cpdef list applyForward(self, Molecule molecule, dict labeledAtoms=?)
+
+    cpdef undo(self, Molecule molecule, list log)
+
+    cpdef Molecule generateProduct(self, Molecule molecule, dict labeledAtoms=?)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+#
+#   ChemPy - A chemistry toolkit for Python
+#
+#   Copyright (c) 2010 by Joshua W. Allen (jwallen@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module provides a compiled representation of reaction recipes, the
+sequences of actions that convert the labeled reactant atoms of a reaction
+template into the corresponding products. The available actions can be found
+:ref:`here <reaction-recipe-actions>`. A recipe is compiled once into a list of
+integer opcodes, then applied in place to any number of labeled molecules; each
+application returns an undo log that restores the molecule to its original
+state, so that a product need only be copied if it is to be kept.
+"""
+
+import cython
+
+from exception import ChemPyError
+from molecule import Atom, Bond, Molecule
+from pattern import AtomType, getAtomType
+
+################################################################################
+
+# The integer opcodes of the reaction recipe actions
+CHANGE_BOND = 1
+FORM_BOND = 2
+BREAK_BOND = 3
+GAIN_RADICAL = 4
+LOSE_RADICAL = 5
+# An opcode used only in undo logs to restore the atom type of an atom
+RESTORE_ATOM_TYPE = 6
+
+actionOpcodes = {
+    'CHANGE_BOND': CHANGE_BOND,
+    'FORM_BOND': FORM_BOND,
+    'BREAK_BOND': BREAK_BOND,
+    'GAIN_RADICAL': GAIN_RADICAL,
+    'LOSE_RADICAL': LOSE_RADICAL,
+}
+
+################################################################################
+
+class ReactionRecipe:
+    """
+    A reaction recipe, compiled for repeated application to labeled
+    molecules. The attributes are:
+
+    =================== =================== ====================================
+    Attribute           Type                Description
+    =================== =================== ====================================
+    `actions`           ``list``            The actions in the recipe, in the form used by :meth:`Atom.applyAction()`
+    `labels`            ``list``            The atom labels referenced by the recipe
+    `operations`        ``list``            The compiled actions as tuples of (opcode, center index, center index, value)
+    =================== =================== ====================================
+
+    Each compiled operation refers to the reacting atoms by their index in
+    `labels`, so that the labels are only resolved once per application.
+    """
+
+    def __init__(self, actions=None):
+        self.actions = []
+        self.labels = []
+        self.operations = []
+        for action in actions or []:
+            self.addAction(action)
+
+    def __repr__(self):
+        """
+        Return a representation that can be used to reconstruct the object.
+        """
+        return 'ReactionRecipe(actions=%r)' % (self.actions)
+
+    def __getCenterIndex(self, label):
+        """
+        Return the index of the atom label `label` in the list of labels
+        referenced by the recipe, adding it if necessary.
+        """
+        if label not in self.labels:
+            self.labels.append(label)
+        return self.labels.index(label)
+
+    def addAction(self, action):
+        """
+        Compile the reaction recipe action `action`, a list containing the name
+        of the action along with its required parameters, and add it to the
+        end of the recipe.
+        """
+        cython.declare(opcode=cython.int, center1=cython.int, center2=cython.int)
+        try:
+            opcode = actionOpcodes[action[0].upper()]
+        except KeyError:
+            raise ChemPyError('Unable to compile reaction recipe: Invalid action %s.' % (action))
+        if opcode == CHANGE_BOND or opcode == FORM_BOND or opcode == BREAK_BOND:
+            center1 = self.__getCenterIndex(action[1])
+            center2 = self.__getCenterIndex(action[3])
+            value = action[2]
+            if opcode == CHANGE_BOND and value != 1 and value != -1:
+                raise ChemPyError('Unable to compile reaction recipe due to CHANGE_BOND action: Invalid order "%s".' % (value))
+            elif opcode != CHANGE_BOND and value != 'S':
+                raise ChemPyError('Unable to compile reaction recipe due to %s action: Invalid order "%s".' % (action[0].upper(), value))
+        else:
+            center1 = self.__getCenterIndex(action[1])
+            center2 = -1
+            value = abs(action[2])
+        self.actions.append(action)
+        self.operations.append((opcode, center1, center2, value))
+
+    def __updateAtomType(self, molecule, atom, opcode, value, log, unresolved):
+        """
+        Update the atom type of `atom` in `molecule` after applying the action
+        with the given `opcode` and `value`. The new atom type is taken from
+        the corresponding action table of the current atom type. If the table
+        does not determine it uniquely, the atom type is left unresolved and
+        the atom is added to the list `unresolved`, so that its atom type can
+        be recomputed from its bonds once the recipe is finished; intermediate
+        states of a recipe need not correspond to any atom type. The previous
+        atom type is recorded in the undo log `log`.
+        """
+        cython.declare(atomType=AtomType, atomTypes=list)
+        atomType = atom.atomType
+        log.append((RESTORE_ATOM_TYPE, atom, None, atomType))
+        if atomType is None:
+            atomTypes = []
+        elif opcode == CHANGE_BOND:
+            atomTypes = atomType.incrementBond if value == 1 else atomType.decrementBond
+        elif opcode == FORM_BOND:
+            atomTypes = atomType.formBond
+        elif opcode == BREAK_BOND:
+            atomTypes = atomType.breakBond
+        elif opcode == GAIN_RADICAL:
+            atomTypes = atomType.incrementRadical
+        else:
+            atomTypes = atomType.decrementRadical
+        if len(atomTypes) == 1:
+            atom.atomType = atomTypes[0]
+        else:
+            atom.atomType = None
+            if atom not in unresolved: unresolved.append(atom)
+
+    def applyForward(self, molecule, labeledAtoms=None):
+        """
+        Apply the recipe in place to `molecule`, whose reacting atoms are
+        labeled with the labels used in the recipe. The labeled atoms can
+        instead be provided as a ``dict`` `labeledAtoms` mapping labels to
+        atoms, e.g. from a subgraph isomorphism. The atom types of the
+        reacting atoms are updated as the actions are applied, and any that
+        cannot be updated incrementally are recomputed at the end. Returns the
+        undo log to pass to :meth:`undo()` to restore the molecule; if any
+        action fails, the molecule is restored before the exception is raised.
+        """
+        cython.declare(centers=list, log=list, unresolved=list, label=str, opcode=cython.int, center1=cython.int, center2=cython.int)
+        cython.declare(atom1=Atom, atom2=Atom, bond=Bond, i=cython.int)
+
+        # Resolve the labels to atoms once
+        centers = []
+        for label in self.labels:
+            if labeledAtoms is not None:
+                atom1 = labeledAtoms.get(label)
+            else:
+                atom1 = molecule.getLabeledAtom(label)
+            if atom1 is None:
+                raise ChemPyError('Unable to apply reaction recipe: No atom with label "%s".' % (label))
+            centers.append(atom1)
+
+        log = []; unresolved = []
+        try:
+            for opcode, center1, center2, value in self.operations:
+                atom1 = centers[center1]
+                if opcode == CHANGE_BOND:
+                    atom2 = centers[center2]
+                    bond = molecule.getBond(atom1, atom2)
+                    if value == 1: bond.incrementOrder()
+                    else: bond.decrementOrder()
+                    log.append((opcode, atom1, atom2, value))
+                    self.__updateAtomType(molecule, atom1, opcode, value, log, unresolved)
+                    self.__updateAtomType(molecule, atom2, opcode, value, log, unresolved)
+                elif opcode == FORM_BOND:
+                    atom2 = centers[center2]
+                    if molecule.hasBond(atom1, atom2):
+                        raise ChemPyError('Unable to apply reaction recipe due to FORM_BOND action: Atoms "%s" and "%s" are already bonded.' % (atom1, atom2))
+                    bond = Bond(value)
+                    molecule.addBond(atom1, atom2, bond)
+                    log.append((opcode, atom1, atom2, bond))
+                    self.__updateAtomType(molecule, atom1, opcode, value, log, unresolved)
+                    self.__updateAtomType(molecule, atom2, opcode, value, log, unresolved)
+                elif opcode == BREAK_BOND:
+                    atom2 = centers[center2]
+                    bond = molecule.getBond(atom1, atom2)
+                    molecule.removeBond(atom1, atom2)
+                    log.append((opcode, atom1, atom2, bond))
+                    self.__updateAtomType(molecule, atom1, opcode, value, log, unresolved)
+                    self.__updateAtomType(molecule, atom2, opcode, value, log, unresolved)
+                elif opcode == GAIN_RADICAL:
+                    for i in range(value): atom1.incrementRadical()
+                    log.append((opcode, atom1, None, value))
+                    self.__updateAtomType(molecule, atom1, opcode, value, log, unresolved)
+                elif opcode == LOSE_RADICAL:
+                    for i in range(value): atom1.decrementRadical()
+                    log.append((opcode, atom1, None, value))
+                    self.__updateAtomType(molecule, atom1, opcode, value, log, unresolved)
+            # Determine the atom types left unresolved from the final bonds
+            for atom1 in unresolved:
+                atom1.atomType = getAtomType(atom1, molecule.edges[atom1])
+        except (ChemPyError, KeyError):
+            self.undo(molecule, log)
+            raise
+
+        return log
+
+    def undo(self, molecule, log):
+        """
+        Restore `molecule` to its state before the application of the recipe
+        that generated the undo log `log`.
+        """
+        cython.declare(opcode=cython.int, atom1=Atom, atom2=Atom, i=cython.int)
+        for opcode, atom1, atom2, value in reversed(log):
+            if opcode == RESTORE_ATOM_TYPE:
+                atom1.atomType = value
+            elif opcode == CHANGE_BOND:
+                if value == 1:
+                    molecule.getBond(atom1, atom2).decrementOrder()
+                else:
+                    molecule.getBond(atom1, atom2).incrementOrder()
+            elif opcode == FORM_BOND:
+                molecule.removeBond(atom1, atom2)
+            elif opcode == BREAK_BOND:
+                molecule.addBond(atom1, atom2, value)
+            elif opcode == GAIN_RADICAL:
+                for i in range(value): atom1.decrementRadical()
+            elif opcode == LOSE_RADICAL:
+                for i in range(value): atom1.incrementRadical()
+
+    def generateProduct(self, molecule, labeledAtoms=None):
+        """
+        Return a copy of the product of applying the recipe to `molecule`,
+        leaving `molecule` itself unchanged. See :meth:`applyForward()` for
+        the meaning of the parameters.
+        """
+        cython.declare(log=list, product=Molecule)
+        log = self.applyForward(molecule, labeledAtoms)
+        try:
+            product = molecule.copy(deep=True)
+            product.implicitHydrogens = molecule.implicitHydrogens
+        finally:
+            self.undo(molecule, log)
+        return product
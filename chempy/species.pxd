@@ -50,7 +50,7 @@ cdef class Species:
     cdef public double molecularWeight
     cdef public bint reactive
 
-    cpdef generateResonanceIsomers(self)
+    cpdef int generateResonanceIsomers(self)
 
 ################################################################################
 
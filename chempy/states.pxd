@@ -30,6 +30,8 @@ cdef class Mode:
 
     cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
 
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
+
     cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
 
     cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
@@ -43,6 +45,12 @@ cdef class Translation(Mode):
     cdef public double mass
     
     cpdef double getPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
+
+    cpdef double getLogPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
     
     cpdef double getHeatCapacity(self, double T)
     
@@ -62,6 +70,12 @@ cdef class RigidRotor(Mode):
 
     cpdef double getPartitionFunction(self, double T)
 
+    cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
+
+    cpdef double getLogPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
+
     cpdef double getHeatCapacity(self, double T)
 
     cpdef double getEnthalpy(self, double T)
@@ -82,6 +96,12 @@ cdef class HinderedRotor(Mode):
 
     cpdef double getPartitionFunction(self, double T)
 
+    cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
+
+    cpdef double getLogPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
+
     cpdef double getHeatCapacity(self, double T)
 
     cpdef double getEnthalpy(self, double T)
@@ -106,6 +126,12 @@ cdef class HarmonicOscillator(Mode):
     
     cpdef double getPartitionFunction(self, double T)
 
+    cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
+
+    cpdef double getLogPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
+
     cpdef double getHeatCapacity(self, double T)
 
     cpdef double getEnthalpy(self, double T)
@@ -137,6 +163,10 @@ cdef class StatesModel:
 
     cpdef numpy.ndarray getPartitionFunctions(self, numpy.ndarray Tlist)
 
+    cpdef double getLogPartitionFunction(self, double T)
+
+    cpdef numpy.ndarray getLogPartitionFunctions(self, numpy.ndarray Tlist)
+
     cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
 
     cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
@@ -105,6 +105,9 @@ class Mode:
     def getPartitionFunctions(self, Tlist):
         return numpy.array([self.getPartitionFunction(T) for T in Tlist], numpy.float64)
 
+    def getLogPartitionFunctions(self, Tlist):
+        return numpy.array([self.getLogPartitionFunction(T) for T in Tlist], numpy.float64)
+
     def getHeatCapacities(self, Tlist):
         return numpy.array([self.getHeatCapacity(T) for T in Tlist], numpy.float64)
 
@@ -149,6 +152,32 @@ class Translation(Mode):
         qt = ((2 * constants.pi * self.mass / constants.Na) / (constants.h * constants.h))**1.5 / 1e5
         return qt * (constants.kB * T)**2.5
 
+    def getPartitionFunctions(self, Tlist):
+        """
+        Return the values of the partition function at the specified
+        temperatures `Tlist` in K, using the formula given in
+        :meth:`getPartitionFunction()`.
+        """
+        cython.declare(qt=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        qt = ((2 * constants.pi * self.mass / constants.Na) / (constants.h * constants.h))**1.5 / 1e5
+        return qt * (constants.kB * Tlist)**2.5
+
+    def getLogPartitionFunction(self, T):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperature `T` in K.
+        """
+        return 1.5 * math.log(2 * constants.pi * self.mass / constants.Na / (constants.h * constants.h)) - math.log(1e5) + 2.5 * math.log(constants.kB * T)
+
+    def getLogPartitionFunctions(self, Tlist):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return 1.5 * math.log(2 * constants.pi * self.mass / constants.Na / (constants.h * constants.h)) - math.log(1e5) + 2.5 * numpy.log(constants.kB * Tlist)
+
     def getHeatCapacity(self, T):
         """
         Return the contribution to the heat capacity due to translation in
@@ -181,7 +210,7 @@ class Translation(Mode):
         where :math:`T` is temperature, :math:`q_\\mathrm{trans}` is the
         partition function, and :math:`R` is the gas law constant.
         """
-        return (numpy.log(self.getPartitionFunction(T)) + 1.5 + 1.0) * constants.R
+        return (self.getLogPartitionFunction(T) + 1.5 + 1.0) * constants.R
 
     def getDensityOfStates(self, Elist):
         """
@@ -251,6 +280,46 @@ class RigidRotor(Mode):
                 theta *= constants.h * constants.h / (8 * constants.pi * constants.pi * inertia * constants.kB)
             return numpy.sqrt(constants.pi * T**len(self.inertia) / theta) / self.symmetry
 
+    def getPartitionFunctions(self, Tlist):
+        """
+        Return the values of the partition function at the specified
+        temperatures `Tlist` in K, using the formulas given in
+        :meth:`getPartitionFunction()`.
+        """
+        cython.declare(theta=cython.double, inertia=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.linear:
+            theta = constants.h * constants.h / (8 * constants.pi * constants.pi * self.inertia[0] * constants.kB)
+            return Tlist / theta / self.symmetry
+        else:
+            theta = 1.0
+            for inertia in self.inertia:
+                theta *= constants.h * constants.h / (8 * constants.pi * constants.pi * inertia * constants.kB)
+            return numpy.sqrt(constants.pi * Tlist**len(self.inertia) / theta) / self.symmetry
+
+    def getLogPartitionFunction(self, T):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperature `T` in K.
+        """
+        return self.getLogPartitionFunctions(numpy.array([T], numpy.float64))[0]
+
+    def getLogPartitionFunctions(self, Tlist):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperatures `Tlist` in K.
+        """
+        cython.declare(logTheta=cython.double, inertia=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.linear:
+            logTheta = math.log(constants.h * constants.h / (8 * constants.pi * constants.pi * self.inertia[0] * constants.kB))
+            return numpy.log(Tlist) - logTheta - math.log(self.symmetry)
+        else:
+            logTheta = 0.0
+            for inertia in self.inertia:
+                logTheta += math.log(constants.h * constants.h / (8 * constants.pi * constants.pi * inertia * constants.kB))
+            return 0.5 * (math.log(constants.pi) + len(self.inertia) * numpy.log(Tlist) - logTheta) - math.log(self.symmetry)
+
     def getHeatCapacity(self, T):
         """
         Return the contribution to the heat capacity due to rigid rotation
@@ -304,9 +373,9 @@ class RigidRotor(Mode):
         function for a rigid rotor and :math:`R` is the gas law constant.
         """
         if self.linear:
-            return (numpy.log(self.getPartitionFunction(T)) + 1.0) * constants.R
+            return (self.getLogPartitionFunction(T) + 1.0) * constants.R
         else:
-            return (numpy.log(self.getPartitionFunction(T)) + 1.5) * constants.R
+            return (self.getLogPartitionFunction(T) + 1.5) * constants.R
 
     def getDensityOfStates(self, Elist):
         """
@@ -475,6 +544,53 @@ class HinderedRotor(Mode):
             z = 0.5 * self.barrier / (constants.R * T)
             return x / (1 - numpy.exp(-x)) * numpy.sqrt(2 * math.pi * self.inertia * constants.kB * T / constants.h / constants.h) * (2 * math.pi / self.symmetry) * numpy.exp(-z) * besseli0(z)
 
+    def getPartitionFunctions(self, Tlist):
+        """
+        Return the values of the partition function at the specified
+        temperatures `Tlist` in K, using the formulas given in
+        :meth:`getPartitionFunction()`.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.fourier is not None:
+            cython.declare(e_kT=numpy.ndarray)
+            e_kT = numpy.exp(-self.energies.reshape(1,-1) / constants.R / Tlist.reshape(-1,1))
+            return numpy.sum(e_kT, axis=1) / self.symmetry
+        else:
+            cython.declare(frequency=cython.double, x=numpy.ndarray, z=numpy.ndarray)
+            import scipy.special
+            frequency = self.getFrequency() * constants.c * 100
+            x = constants.h * frequency / (constants.kB * Tlist)
+            z = 0.5 * self.barrier / (constants.R * Tlist)
+            # i0e(z) = exp(-z) * i0(z)
+            return x / (1 - numpy.exp(-x)) * numpy.sqrt(2 * math.pi * self.inertia * constants.kB * Tlist / constants.h / constants.h) * (2 * math.pi / self.symmetry) * scipy.special.i0e(z)
+
+    def getLogPartitionFunction(self, T):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperature `T` in K.
+        """
+        return self.getLogPartitionFunctions(numpy.array([T], numpy.float64))[0]
+
+    def getLogPartitionFunctions(self, Tlist):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperatures `Tlist` in K. Since the energy levels are
+        measured from the lowest one, the sum of Boltzmann factors for the
+        Fourier series potential is at least one and cannot overflow.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        if self.fourier is not None:
+            cython.declare(e_kT=numpy.ndarray)
+            e_kT = numpy.exp(-self.energies.reshape(1,-1) / constants.R / Tlist.reshape(-1,1))
+            return numpy.log(numpy.sum(e_kT, axis=1)) - math.log(self.symmetry)
+        else:
+            cython.declare(frequency=cython.double, x=numpy.ndarray, z=numpy.ndarray)
+            import scipy.special
+            frequency = self.getFrequency() * constants.c * 100
+            x = constants.h * frequency / (constants.kB * Tlist)
+            z = 0.5 * self.barrier / (constants.R * Tlist)
+            return numpy.log(x) - numpy.log1p(-numpy.exp(-x)) + 0.5 * numpy.log(2 * math.pi * self.inertia * constants.kB * Tlist / constants.h / constants.h) + math.log(2 * math.pi / self.symmetry) + numpy.log(scipy.special.i0e(z))
+
     def getHeatCapacity(self, T):
         """
         Return the contribution to the heat capacity due to hindered rotation
@@ -537,8 +653,8 @@ class HinderedRotor(Mode):
             Tlow = T * 0.999
             Thigh = T * 1.001
             return (T *
-                (numpy.log(self.getPartitionFunction(Thigh)) -
-                numpy.log(self.getPartitionFunction(Tlow))) /
+                (self.getLogPartitionFunction(Thigh) -
+                self.getLogPartitionFunction(Tlow)) /
                 (Thigh - Tlow)) * constants.R * T
 
     def getEntropy(self, T):
@@ -557,16 +673,16 @@ class HinderedRotor(Mode):
         if self.fourier is not None:
             cython.declare(S=cython.double, E=numpy.ndarray, e_kT=numpy.ndarray, i=cython.int)
             E = self.energies
-            S = constants.R * numpy.log(self.getPartitionFunction(T))
+            S = constants.R * self.getLogPartitionFunction(T)
             e_kT = numpy.exp(-E / constants.R / T)
             S += numpy.sum(E*e_kT) / (T * numpy.sum(e_kT))
             return S
         else:
             Tlow = T * 0.999
             Thigh = T * 1.001
-            return (numpy.log(self.getPartitionFunction(Thigh)) +
-                T * (numpy.log(self.getPartitionFunction(Thigh)) -
-                numpy.log(self.getPartitionFunction(Tlow))) /
+            return (self.getLogPartitionFunction(Thigh) +
+                T * (self.getLogPartitionFunction(Thigh) -
+                self.getLogPartitionFunction(Tlow)) /
                 (Thigh - Tlow)) * constants.R
 
     def getDensityOfStates(self, Elist):
@@ -680,6 +796,38 @@ class HarmonicOscillator(Mode):
             Q = Q / (1 - numpy.exp(-freq / (0.695039 * T)))  # kB = 0.695039 cm^-1/K
         return Q
 
+    def getPartitionFunctions(self, Tlist):
+        """
+        Return the values of the partition function at the specified
+        temperatures `Tlist` in K, using the formula given in
+        :meth:`getPartitionFunction()`.
+        """
+        cython.declare(freq=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        freq = numpy.array(self.frequencies, numpy.float64).reshape(1,-1)
+        return 1.0 / numpy.prod(1 - numpy.exp(-freq / (0.695039 * Tlist.reshape(-1,1))), axis=1)  # kB = 0.695039 cm^-1/K
+
+    def getLogPartitionFunction(self, T):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperature `T` in K.
+        """
+        cython.declare(logQ=cython.double, freq=cython.double)
+        logQ = 0.0
+        for freq in self.frequencies:
+            logQ -= math.log1p(-math.exp(-freq / (0.695039 * T)))  # kB = 0.695039 cm^-1/K
+        return logQ
+
+    def getLogPartitionFunctions(self, Tlist):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperatures `Tlist` in K.
+        """
+        cython.declare(freq=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        freq = numpy.array(self.frequencies, numpy.float64).reshape(1,-1)
+        return -numpy.sum(numpy.log1p(-numpy.exp(-freq / (0.695039 * Tlist.reshape(-1,1)))), axis=1)  # kB = 0.695039 cm^-1/K
+
     def getHeatCapacity(self, T):
         """
         Return the contribution to the heat capacity due to vibration
@@ -737,7 +885,7 @@ class HarmonicOscillator(Mode):
         """
         cython.declare(S=cython.double, freq=cython.double)
         cython.declare(x=cython.double, exp_x=cython.double)
-        S = numpy.log(self.getPartitionFunction(T))
+        S = self.getLogPartitionFunction(T)
         for freq in self.frequencies:
             x = freq / (0.695039 * T)	# kB = 0.695039 cm^-1/K
             exp_x = numpy.exp(x)
@@ -836,6 +984,26 @@ class StatesModel:
             Q *= mode.getPartitionFunction(T)
         return Q * self.spinMultiplicity
 
+    def getLogPartitionFunction(self, T):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperature `T` in K, evaluated as the sum of the logarithms
+        of the partition functions of each mode to avoid overflow. An active
+        K-rotor is automatically included if there are no external rotational
+        modes.
+        """
+        cython.declare(logQ=cython.double, Trot=cython.double)
+        logQ = math.log(self.spinMultiplicity)
+        # Active K-rotor
+        rotors = [mode for mode in self.modes if isinstance(mode, RigidRotor)]
+        if len(rotors) == 0:
+            Trot = 1.0 / constants.R / 3.141592654
+            logQ += 0.5 * math.log(T / Trot)
+        # Other modes
+        for mode in self.modes:
+            logQ += mode.getLogPartitionFunction(T)
+        return logQ
+
     def getDensityOfStates(self, Elist):
         """
         Return the value of the density of states in mol/J at the specified
@@ -876,7 +1044,45 @@ class StatesModel:
         return sumStates
     
     def getPartitionFunctions(self, Tlist):
-        return numpy.array([self.getPartitionFunction(T) for T in Tlist], numpy.float64)
+        """
+        Return the the partition function at the specified temperatures
+        `Tlist` in K, evaluating the partition function of each mode at all
+        of the temperatures at once. An active K-rotor is automatically
+        included if there are no external rotational modes.
+        """
+        cython.declare(Q=numpy.ndarray, Trot=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Q = numpy.ones(len(Tlist), numpy.float64)
+        # Active K-rotor
+        rotors = [mode for mode in self.modes if isinstance(mode, RigidRotor)]
+        if len(rotors) == 0:
+            Trot = 1.0 / constants.R / 3.141592654
+            Q *= numpy.sqrt(Tlist / Trot)
+        # Other modes
+        for mode in self.modes:
+            Q *= mode.getPartitionFunctions(Tlist)
+        return Q * self.spinMultiplicity
+
+    def getLogPartitionFunctions(self, Tlist):
+        """
+        Return the natural logarithm of the partition function at the
+        specified temperatures `Tlist` in K, evaluating the logarithm of the
+        partition function of each mode at all of the temperatures at once.
+        An active K-rotor is automatically included if there are no external
+        rotational modes.
+        """
+        cython.declare(logQ=numpy.ndarray, Trot=cython.double)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        logQ = numpy.zeros(len(Tlist), numpy.float64) + math.log(self.spinMultiplicity)
+        # Active K-rotor
+        rotors = [mode for mode in self.modes if isinstance(mode, RigidRotor)]
+        if len(rotors) == 0:
+            Trot = 1.0 / constants.R / 3.141592654
+            logQ += 0.5 * numpy.log(Tlist / Trot)
+        # Other modes
+        for mode in self.modes:
+            logQ += mode.getLogPartitionFunctions(Tlist)
+        return logQ
 
     def getHeatCapacities(self, Tlist):
         return numpy.array([self.getHeatCapacity(T) for T in Tlist], numpy.float64)
@@ -889,9 +1095,7 @@ class StatesModel:
 
     def __phi(self, beta, E):
         beta = float(beta)
-        cython.declare(T=numpy.ndarray, Q=cython.double)
-        Q = self.getPartitionFunction(1.0 / (constants.R * beta))
-        return math.log(Q) + beta * float(E)
+        return self.getLogPartitionFunction(1.0 / (constants.R * beta)) + beta * float(E)
 
     def getDensityOfStatesILT(self, Elist, order=1):
         """
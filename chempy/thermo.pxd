@@ -88,6 +88,14 @@ cdef class WilhoitModel(ThermoModel):
     cpdef double getEntropy(self, double T)
 
     cpdef double getFreeEnergy(self, double T)
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
     
     cpdef double __residual(self, double B, numpy.ndarray Tlist, numpy.ndarray Cplist, 
         bint linear, int nFreq, int nRotors, double H298, double S298)
@@ -111,6 +119,14 @@ cdef class NASAPolynomial(ThermoModel):
     cpdef double getEntropy(self, double T)
 
     cpdef double getFreeEnergy(self, double T)
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
     
 ################################################################################
 
@@ -127,3 +143,14 @@ cdef class NASAModel(ThermoModel):
     cpdef double getFreeEnergy(self, double T)
     
     cpdef NASAPolynomial __selectPolynomialForTemperature(self, double T)
+
+    cpdef list __selectPolynomialsForTemperatures(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
+
@@ -43,7 +43,7 @@ from exception import InvalidThermoModelError
 
 ################################################################################
 
-class ThermoError:
+class ThermoError(Exception):
     """
     An exception class for errors that occur while working with thermodynamics
     models. Pass a string describing the circumstances that caused the
@@ -337,6 +337,51 @@ class WilhoitModel(ThermoModel):
         `T` in K.
         """
         return self.getEnthalpy(T) - T * self.getEntropy(T)
+
+    def getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities (Cp) in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cython.declare(y=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        y = Tlist/(Tlist+self.B)
+        return self.cp0+(self.cpInf-self.cp0)*y*y*( 1 +
+            (y-1)*(self.a0 + y*(self.a1 + y*(self.a2 + y*self.a3))) )
+
+    def getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K, using the same formula as :meth:`getEnthalpy()`.
+        """
+        cython.declare(cp0=cython.double, cpInf=cython.double, B=cython.double, a0=cython.double, a1=cython.double, a2=cython.double, a3=cython.double)
+        cython.declare(y=numpy.ndarray, y2=numpy.ndarray, logBplust=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        cp0, cpInf, B, a0, a1, a2, a3 = self.cp0, self.cpInf, self.B, self.a0, self.a1, self.a2, self.a3
+        y = Tlist/(Tlist+B)
+        y2 = y*y
+        logBplust = numpy.log(B + Tlist)
+        return self.H0 + cp0*Tlist - (cpInf-cp0)*Tlist*(y2*((3*a0 + a1 + a2 + a3)/6. + (4*a1 + a2 + a3)*y/12. + (5*a2 + a3)*y2/20. + a3*y2*y/5.) + (2 + a0 + a1 + a2 + a3)*( y/2. - 1 + (1/y-1)*logBplust))
+
+    def getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K, using the same formula as :meth:`getEntropy()`.
+        """
+        cython.declare(cp0=cython.double, cpInf=cython.double, B=cython.double, a0=cython.double, a1=cython.double, a2=cython.double, a3=cython.double)
+        cython.declare(y=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        cp0, cpInf, B, a0, a1, a2, a3 = self.cp0, self.cpInf, self.B, self.a0, self.a1, self.a2, self.a3
+        y = Tlist/(Tlist+B)
+        return self.S0 + cpInf*numpy.log(Tlist)-(cpInf-cp0)*(numpy.log(y)+y*(1+y*(a0/2+y*(a1/3 + y*(a2/4 + y*a3/5)))))
+
+    def getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return self.getEnthalpies(Tlist) - Tlist * self.getEntropies(Tlist)
     
     def __residual(self, B, Tlist, Cplist, linear, nFreq, nRotors, H298, S298):
         # The residual corresponding to the fitToData() method
@@ -471,6 +516,38 @@ class NASAPolynomial(ThermoModel):
         """
         return self.getEnthalpy(T) - T * self.getEntropy(T)
 
+    def getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities (Cp) in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return (self.c0 + Tlist*(self.c1 + Tlist*(self.c2 + Tlist*(self.c3 + self.c4*Tlist)))) * constants.R
+
+    def getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return (self.c0 + Tlist*(self.c1/2 + Tlist*(self.c2/3 + Tlist*(self.c3/4 + self.c4*Tlist/5))) + self.c5/Tlist) * constants.R * Tlist
+
+    def getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return (self.c0*numpy.log(Tlist) + Tlist*(self.c1 + Tlist*(self.c2/2 + Tlist*(self.c3/3 + self.c4*Tlist/4))) + self.c6) * constants.R
+
+    def getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        return self.getEnthalpies(Tlist) - Tlist * self.getEntropies(Tlist)
+
     def toCantera(self):
         """
         Return a Cantera ctml_writer instance.
@@ -534,6 +611,69 @@ class NASAModel(ThermoModel):
         else:
             raise ThermoError("No valid NASA polynomial found for T=%g K" % T)
 
+    def __selectPolynomialsForTemperatures(self, Tlist):
+        # Return a list of (polynomial, indices) pairs, where the indices are
+        # those of the temperatures in Tlist evaluated using that polynomial
+        cython.declare(poly=NASAPolynomial, valid=numpy.ndarray, remaining=numpy.ndarray, selected=list)
+        remaining = numpy.ones(len(Tlist), numpy.bool_)
+        selected = []
+        for poly in self.polynomials:
+            valid = remaining & (poly.Tmin <= Tlist) & (Tlist <= poly.Tmax)
+            if valid.any():
+                selected.append((poly, valid.nonzero()[0]))
+                remaining &= ~valid
+        if remaining.any():
+            raise ThermoError("No valid NASA polynomial found for T=%g K" % Tlist[remaining][0])
+        return selected
+
+    def getHeatCapacities(self, Tlist):
+        """
+        Return the constant-pressure heat capacities (Cp) in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cython.declare(Cplist=numpy.ndarray, poly=NASAPolynomial, indices=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Cplist = numpy.zeros(len(Tlist), numpy.float64)
+        for poly, indices in self.__selectPolynomialsForTemperatures(Tlist):
+            Cplist[indices] = poly.getHeatCapacities(Tlist[indices])
+        return Cplist
+
+    def getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        cython.declare(Hlist=numpy.ndarray, poly=NASAPolynomial, indices=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Hlist = numpy.zeros(len(Tlist), numpy.float64)
+        for poly, indices in self.__selectPolynomialsForTemperatures(Tlist):
+            Hlist[indices] = poly.getEnthalpies(Tlist[indices])
+        return Hlist
+
+    def getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        cython.declare(Slist=numpy.ndarray, poly=NASAPolynomial, indices=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Slist = numpy.zeros(len(Tlist), numpy.float64)
+        for poly, indices in self.__selectPolynomialsForTemperatures(Tlist):
+            Slist[indices] = poly.getEntropies(Tlist[indices])
+        return Slist
+
+    def getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        cython.declare(Glist=numpy.ndarray, poly=NASAPolynomial, indices=numpy.ndarray)
+        Tlist = numpy.asarray(Tlist, numpy.float64)
+        Glist = numpy.zeros(len(Tlist), numpy.float64)
+        for poly, indices in self.__selectPolynomialsForTemperatures(Tlist):
+            Glist[indices] = poly.getFreeEnergies(Tlist[indices])
+        return Glist
+
     def toCantera(self):
         """
         Return a Cantera ctml_writer instance.
@@ -51,6 +51,8 @@ ext_modules = [
     Extension('chempy.molecule', ['chempy/molecule.py']),
     Extension('chempy.pattern', ['chempy/pattern.py']),
     Extension('chempy.reaction', ['chempy/reaction.py']),
+    Extension('chempy.reactor', ['chempy/reactor.py']),
+    Extension('chempy.recipe', ['chempy/recipe.py']),
     Extension('chempy.species', ['chempy/species.py']),
     Extension('chempy.states', ['chempy/states.py']),
     Extension('chempy.thermo', ['chempy/thermo.py']),
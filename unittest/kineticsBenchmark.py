@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compares the accuracy and speed of :class:`TabulatedKineticsModel` to exact
+evaluation of the kinetics models it tabulates, for a range of table sizes.
+Run from the unittest directory using ``python kineticsBenchmark.py``.
+"""
+
+import numpy
+import time
+import sys
+sys.path.append('.')
+
+from chempy.kinetics import *
+
+################################################################################
+
+def benchmark(label, model, Tcounts, Pcount=0, N=20000):
+
+    numpy.random.seed(0)
+    Tlist = numpy.random.uniform(300.0, 2000.0, N)
+    Plist = 10**numpy.random.uniform(3.0, 7.0, N)
+
+    t0 = time.time()
+    kexact = numpy.array([model.getRateCoefficient(T, P) for T, P in zip(Tlist, Plist)])
+    texact = time.time() - t0
+
+    print '%s: exact evaluation %.2f us per call' % (label, 1.0e6 * texact / N)
+    print '    %8s %8s %8s %12s %12s %12s %10s' % ('interp', 'Tcount', 'Pcount', 'estimate', 'max error', 'us per call', 'speedup')
+    for interpolation in ['linear', 'cubic']:
+        for Tcount in Tcounts:
+            table = TabulatedKineticsModel(model, Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, Tcount=Tcount, Pcount=Pcount, interpolation=interpolation)
+            t0 = time.time()
+            ktable = numpy.array([table.getRateCoefficient(T, P) for T, P in zip(Tlist, Plist)])
+            ttable = time.time() - t0
+            error = numpy.max(numpy.abs(numpy.log(ktable / kexact)))
+            print '    %8s %8i %8i %12.3e %12.3e %12.2f %10.1f' % (interpolation, Tcount, Pcount, table.errorEstimate, error, 1.0e6 * ttable / N, texact / ttable)
+
+if __name__ == '__main__':
+
+    arrhenius = ArrheniusModel(A=1.0e10, n=1.5, Ea=50000.0, T0=1.0)
+    benchmark('ArrheniusModel', arrhenius, [20, 50, 100, 200, 500])
+
+    pdepArrhenius = PDepArrheniusModel(
+        pressures=[1.0e3, 1.0e4, 1.0e5, 1.0e6, 1.0e7],
+        arrhenius=[ArrheniusModel(A=1.0e10*(i+1), n=0.5*i, Ea=20000.0*(i+1), T0=300.0) for i in range(5)],
+    )
+    benchmark('PDepArrheniusModel', pdepArrhenius, [20, 50, 100, 200, 500], Pcount=5)
+
+    chebyshev = ChebyshevModel(Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, coeffs=numpy.array([
+        [ 8.2,  0.4, -0.1],
+        [-1.5,  0.3,  0.05],
+        [-0.2,  0.1, -0.02],
+        [ 0.05, -0.01, 0.01],
+    ], numpy.float64))
+    benchmark('ChebyshevModel', chebyshev, [20, 50, 100, 200, 500], Pcount=50)
@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy
+import unittest
+import sys
+sys.path.append('.')
+
+from chempy.kinetics import *
+import chempy.constants as constants
+
+################################################################################
+
+class KineticsTest(unittest.TestCase):
+    """
+    Contains unit tests for the chempy.kinetics module, used for working with
+    kinetics models.
+    """
+    
+    def testArrheniusRateCoefficients(self):
+        """
+        Tests the vectorized evaluation of the Arrhenius kinetics model.
+        """
+        
+        arrhenius = ArrheniusModel(A=1.0e6, n=1.5, Ea=50000.0, T0=300.0)
+        
+        Tlist = numpy.arange(300.0, 2001.0, 100.0, numpy.float64)
+        klist = arrhenius.getRateCoefficients(Tlist)
+        self.assertEqual(klist.shape, Tlist.shape)
+        for i in range(len(Tlist)):
+            self.assertAlmostEqual(klist[i] / arrhenius.getRateCoefficient(Tlist[i]), 1.0, 10)
+        
+        # A 2-D grid of temperatures should give a grid of the same shape
+        Tgrid = Tlist.reshape((3,6))
+        Kgrid = arrhenius.getRateCoefficients(Tgrid)
+        self.assertEqual(Kgrid.shape, (3,6))
+        self.assertTrue(numpy.allclose(Kgrid.flatten(), klist, rtol=1e-12))
+        
+        # Adding pressures should give one (identical) column per pressure
+        Plist = numpy.array([1.0e4, 1.0e5, 1.0e6], numpy.float64)
+        K = arrhenius.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (len(Tlist), len(Plist)))
+        for j in range(len(Plist)):
+            self.assertTrue(numpy.allclose(K[:,j], klist, rtol=1e-12))
+        
+        # A single temperature must be evaluated with getRateCoefficient()
+        self.assertRaises(InvalidKineticsModelError, arrhenius.getRateCoefficients, numpy.array(1000.0))
+
+    def testArrheniusFit(self):
+        """
+        Tests that fitting many Arrhenius models at once recovers the
+        parameters of the models used to generate the rate coefficients, and
+        that the residuals and condition number are reported.
+        """
+        
+        Tlist = numpy.linspace(300.0, 2000.0, 20)
+        arrhenius = [ArrheniusModel(A=1.0e10*(i+1), n=0.3*i, Ea=20000.0*(i+1), T0=298.0) for i in range(4)]
+        K = numpy.array([arrh.getRateCoefficients(Tlist) for arrh in arrhenius]).T
+        
+        models, residuals, condition = fitArrheniusModels(Tlist, K, 298.0)
+        self.assertEqual(len(models), len(arrhenius))
+        self.assertEqual(residuals.shape, (len(arrhenius),))
+        self.assertTrue(condition >= 1.0)
+        for arrh, model in zip(arrhenius, models):
+            self.assertAlmostEqual(model.A / arrh.A, 1.0, 8)
+            self.assertAlmostEqual(model.n, arrh.n, 8)
+            self.assertAlmostEqual(model.Ea / arrh.Ea, 1.0, 8)
+            self.assertEqual(model.T0, 298.0)
+        for residual in residuals:
+            self.assertAlmostEqual(residual, 0.0, 10)
+        
+        model = ArrheniusModel().fitToData(Tlist, K[:,1], 298.0)
+        self.assertAlmostEqual(model.A / arrhenius[1].A, 1.0, 8)
+        self.assertAlmostEqual(model.n, arrhenius[1].n, 8)
+        self.assertAlmostEqual(model.Ea / arrhenius[1].Ea, 1.0, 8)
+
+    def testKineticsTable(self):
+        """
+        Tests the batched evaluation of many Arrhenius kinetics models.
+        """
+        
+        models = [
+            ArrheniusModel(A=1.0e6, n=1.5, Ea=50000.0, T0=300.0),
+            ArrheniusModel(A=2.0e13, n=0.0, Ea=150000.0, T0=1.0),
+            ArrheniusModel(A=3.5e8, n=-0.5, Ea=0.0, T0=298.15),
+        ]
+        table = KineticsTable(models)
+        
+        klist = table.getRateCoefficients(1000.0)
+        self.assertEqual(klist.shape, (3,))
+        for i, model in enumerate(models):
+            self.assertAlmostEqual(klist[i] / model.getRateCoefficient(1000.0), 1.0, 10)
+        
+        Tlist = numpy.arange(300.0, 2001.0, 100.0, numpy.float64)
+        K = table.getRateCoefficients(Tlist)
+        self.assertEqual(K.shape, (len(Tlist), 3))
+        for i, model in enumerate(models):
+            self.assertTrue(numpy.allclose(K[:,i], model.getRateCoefficients(Tlist), rtol=1e-12))
+        
+        # Changing a model should be reflected after refreshing the table
+        models[1].Ea = 100000.0
+        table.update(1)
+        klist = table.getRateCoefficients(1000.0)
+        self.assertAlmostEqual(klist[1] / models[1].getRateCoefficient(1000.0), 1.0, 10)
+
+    def testArrheniusEPRateCoefficients(self):
+        """
+        Tests the evaluation of Evans-Polanyi kinetics, both for a single
+        model and for many reactions estimated from a table of models.
+        """
+        
+        models = [
+            ArrheniusEPModel(A=1.0e6, n=1.5, E0=40000.0, alpha=0.5),
+            ArrheniusEPModel(A=5.0e7, n=0.5, E0=60000.0, alpha=0.3),
+        ]
+        dHrxn = numpy.array([-50000.0, 0.0, 20000.0, -10000.0], numpy.float64)
+        indices = numpy.array([0, 1, 1, 0])
+        Tlist = numpy.array([300.0, 1000.0, 1500.0], numpy.float64)
+        
+        k = models[0].getRateCoefficient(1000.0, -50000.0)
+        self.assertAlmostEqual(k / (1.0e6 * 1000.0**1.5 * numpy.exp(-15000.0 / constants.R / 1000.0)), 1.0, 10)
+        K = models[1].getRateCoefficients(Tlist, dHrxn)
+        self.assertEqual(K.shape, (len(Tlist), len(dHrxn)))
+        for i, T in enumerate(Tlist):
+            for j, dH in enumerate(dHrxn):
+                self.assertAlmostEqual(K[i,j] / models[1].getRateCoefficient(T, dH), 1.0, 10)
+        K = models[1].getRateCoefficients(Tlist, numpy.array(dHrxn[2]))
+        self.assertEqual(K.shape, (len(Tlist), 1))
+        self.assertAlmostEqual(K[1,0] / models[1].getRateCoefficient(Tlist[1], dHrxn[2]), 1.0, 10)
+        
+        table = ArrheniusEPTable(models)
+        K = table.getRateCoefficients(Tlist, dHrxn, indices)
+        arrhenius = table.toArrhenius(dHrxn, indices)
+        Karrh = arrhenius.getRateCoefficients(Tlist)
+        self.assertEqual(K.shape, (len(Tlist), len(dHrxn)))
+        for j, dH in enumerate(dHrxn):
+            model = models[indices[j]]
+            self.assertAlmostEqual(arrhenius.Ea[j], model.getActivationEnergy(dH), 6)
+            for i, T in enumerate(Tlist):
+                self.assertAlmostEqual(K[i,j] / model.getRateCoefficient(T, dH), 1.0, 10)
+                self.assertAlmostEqual(Karrh[i,j] / K[i,j], 1.0, 10)
+
+    def testPDepArrheniusRateCoefficients(self):
+        """
+        Tests the evaluation of the pressure-dependent Arrhenius kinetics
+        model, which should interpolate linearly in log pressure between the
+        bounding expressions and use the nearest expression outside the range
+        of pressures, regardless of the order in which the pressures are given.
+        """
+        
+        arrhenius = [
+            ArrheniusModel(A=1.0e12, n=0.0, Ea=30000.0, T0=300.0),
+            ArrheniusModel(A=2.0e10, n=0.5, Ea=20000.0, T0=300.0),
+            ArrheniusModel(A=3.0e10, n=1.0, Ea=10000.0, T0=300.0),
+        ]
+        pdepArrhenius = PDepArrheniusModel(pressures=[1.0e6, 1.0e3, 1.0e5], arrhenius=arrhenius)
+        
+        T = 800.0
+        k0, k1, k2 = [arrh.getRateCoefficient(T) for arrh in arrhenius]
+        self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, 1.0e3) / k1, 1.0, 10)
+        self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, 1.0e4) / numpy.sqrt(k1 * k2), 1.0, 10)
+        self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, 1.0e5) / k2, 1.0, 10)
+        self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, 1.0e2) / k1, 1.0, 10)
+        self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, 1.0e8) / k0, 1.0, 10)
+        
+        Tlist = numpy.array([300.0, 800.0, 1500.0], numpy.float64)
+        Plist = numpy.array([1.0e1, 1.0e3, 3.0e3, 1.0e5, 5.0e5, 1.0e6, 1.0e8], numpy.float64)
+        K = pdepArrhenius.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (len(Tlist), len(Plist)))
+        for i, T in enumerate(Tlist):
+            for j, P in enumerate(Plist):
+                self.assertAlmostEqual(K[i,j] / pdepArrhenius.getRateCoefficient(T, P), 1.0, 10)
+        
+        # A single pressure should give a single column
+        K = pdepArrhenius.getRateCoefficients(Tlist, numpy.array(1.0e4))
+        self.assertEqual(K.shape, (len(Tlist), 1))
+        self.assertAlmostEqual(K[1,0] / numpy.sqrt(k1 * k2), 1.0, 10)
+        
+        # Assigning new pressures, or changing the Arrhenius parameters and
+        # calling update(), should give the same results as a newly-constructed
+        # model
+        pdepArrhenius.pressures = [1.0e2, 1.0e7, 1.0e4]
+        arrhenius[1].A = 4.0e10
+        pdepArrhenius.update()
+        model = PDepArrheniusModel(pressures=[1.0e2, 1.0e7, 1.0e4], arrhenius=[ArrheniusModel(A=arrh.A, n=arrh.n, Ea=arrh.Ea, T0=arrh.T0) for arrh in arrhenius])
+        K = pdepArrhenius.getRateCoefficients(Tlist, Plist)
+        K0 = model.getRateCoefficients(Tlist, Plist)
+        for i, T in enumerate(Tlist):
+            for j, P in enumerate(Plist):
+                self.assertAlmostEqual(K[i,j] / K0[i,j], 1.0, 10)
+                self.assertAlmostEqual(pdepArrhenius.getRateCoefficient(T, P) / K0[i,j], 1.0, 10)
+
+    def testChebyshevRateCoefficients(self):
+        """
+        Tests the evaluation of the Chebyshev kinetics model, both at single
+        temperatures and pressures and on a grid.
+        """
+        
+        coeffs = numpy.array([
+            [ 8.2,  0.4, -0.1],
+            [-1.5,  0.3,  0.05],
+            [-0.2,  0.1, -0.02],
+            [ 0.05, -0.01, 0.01],
+        ], numpy.float64)
+        chebyshev = ChebyshevModel(Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, coeffs=coeffs)
+        
+        Tlist = numpy.array([300.0, 500.0, 1000.0, 1500.0, 2000.0], numpy.float64)
+        Plist = numpy.array([1.0e3, 1.0e5, 1.0e7], numpy.float64)
+        K = chebyshev.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (len(Tlist), len(Plist)))
+        for i, T in enumerate(Tlist):
+            for j, P in enumerate(Plist):
+                # Evaluate the double sum explicitly using T_n(x) = cos(n acos(x))
+                Tred = (2.0/T - 1.0/300.0 - 1.0/2000.0) / (1.0/2000.0 - 1.0/300.0)
+                Pred = (2.0*numpy.log(P) - numpy.log(1.0e3) - numpy.log(1.0e7)) / (numpy.log(1.0e7) - numpy.log(1.0e3))
+                logk = 0.0
+                for t in range(coeffs.shape[0]):
+                    for p in range(coeffs.shape[1]):
+                        logk += coeffs[t,p] * numpy.cos(t * numpy.arccos(Tred)) * numpy.cos(p * numpy.arccos(Pred))
+                self.assertAlmostEqual(chebyshev.getRateCoefficient(T, P) / 10**logk, 1.0, 10)
+                self.assertAlmostEqual(K[i,j] / 10**logk, 1.0, 10)
+
+    def testChebyshevFit(self):
+        """
+        Tests that fitting a Chebyshev model to rate coefficients generated by
+        a known Chebyshev model recovers its coefficients, both for a single
+        model and for a batch of models fitted in one solve.
+        """
+        
+        Tlist = numpy.linspace(300.0, 2000.0, 12)
+        Plist = numpy.logspace(3.0, 7.0, 7)
+        coeffsList = [
+            numpy.array([[8.2, 0.4, -0.1], [-1.5, 0.3, 0.05], [-0.2, 0.1, -0.02], [0.05, -0.01, 0.01]], numpy.float64),
+            numpy.array([[6.0, -0.2, 0.05], [-2.5, 0.1, 0.0], [0.3, -0.05, 0.01], [-0.1, 0.02, 0.0]], numpy.float64),
+        ]
+        Klist = []
+        for coeffs in coeffsList:
+            chebyshev = ChebyshevModel(Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, coeffs=coeffs)
+            Klist.append(chebyshev.getRateCoefficients(Tlist, Plist))
+        
+        chebyshev = ChebyshevModel().fitToData(Tlist, Plist, Klist[0], 4, 3, 300.0, 2000.0, 1.0e3, 1.0e7)
+        self.assertEqual(chebyshev.coeffs.shape, (4, 3))
+        for c0, c in zip(coeffsList[0].flat, chebyshev.coeffs.flat):
+            self.assertAlmostEqual(c0, c, 8)
+        
+        models = fitChebyshevModels(Tlist, Plist, Klist, 4, 3, 300.0, 2000.0, 1.0e3, 1.0e7)
+        self.assertEqual(len(models), len(coeffsList))
+        for coeffs, model in zip(coeffsList, models):
+            self.assertEqual(model.degreeT, 4)
+            self.assertEqual(model.degreeP, 3)
+            for c0, c in zip(coeffs.flat, model.coeffs.flat):
+                self.assertAlmostEqual(c0, c, 8)
+
+    def testFalloffRateCoefficients(self):
+        """
+        Tests the evaluation of the third-body, Lindemann, and Troe kinetics
+        models using the reaction H + CH3 (+M) <=> CH4 (+M) from GRI-Mech 3.0.
+        """
+        
+        arrheniusHigh = ArrheniusModel(A=1.39e10, n=-0.534, Ea=536.0*4.184, T0=1.0)
+        arrheniusLow = ArrheniusModel(A=2.62e21, n=-4.76, Ea=2440.0*4.184, T0=1.0)
+        thirdBody = ThirdBodyModel(arrheniusLow=arrheniusLow, efficiencies={'H2O': 6.0, 'Ar': 0.7})
+        lindemann = LindemannModel(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow)
+        troe = TroeModel(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, alpha=0.783, T3=74.0, T1=2941.0, T2=6964.0)
+        
+        self.assertEqual(list(thirdBody.getEfficiencies(['N2', 'H2O', 'Ar'])), [1.0, 6.0, 0.7])
+        self.assertAlmostEqual(thirdBody.getColliderConcentration({'N2': 10.0, 'H2O': 2.0, 'Ar': 5.0}), 10.0 + 12.0 + 3.5, 10)
+        
+        Tlist = numpy.array([300.0, 1000.0, 2000.0], numpy.float64)
+        Plist = numpy.array([1.0e2, 1.0e5, 1.0e8], numpy.float64)
+        K0 = thirdBody.getRateCoefficients(Tlist, Plist)
+        K1 = lindemann.getRateCoefficients(Tlist, Plist)
+        K2 = troe.getRateCoefficients(Tlist, Plist)
+        for i, T in enumerate(Tlist):
+            k0 = arrheniusLow.getRateCoefficient(T)
+            kinf = arrheniusHigh.getRateCoefficient(T)
+            for j, P in enumerate(Plist):
+                M = P / constants.R / T
+                Pr = k0 * M / kinf
+                Fcent = 0.217 * numpy.exp(-T / 74.0) + 0.783 * numpy.exp(-T / 2941.0) + numpy.exp(-6964.0 / T)
+                c = -0.4 - 0.67 * numpy.log10(Fcent)
+                n = 0.75 - 1.27 * numpy.log10(Fcent)
+                F = 10**(numpy.log10(Fcent) / (1 + ((numpy.log10(Pr) + c) / (n - 0.14 * (numpy.log10(Pr) + c)))**2))
+                self.assertAlmostEqual(K0[i,j] / (k0 * M), 1.0, 10)
+                self.assertAlmostEqual(K1[i,j] / (kinf * Pr / (1 + Pr)), 1.0, 10)
+                self.assertAlmostEqual(K2[i,j] / (kinf * Pr / (1 + Pr) * F), 1.0, 10)
+                self.assertAlmostEqual(thirdBody.getRateCoefficient(T, P) / K0[i,j], 1.0, 10)
+                self.assertAlmostEqual(lindemann.getRateCoefficient(T, P) / K1[i,j], 1.0, 10)
+                self.assertAlmostEqual(troe.getRateCoefficient(T, P) / K2[i,j], 1.0, 10)
+        
+        # Evaluating with one third-body concentration per temperature
+        Mlist = Plist / constants.R / Tlist
+        K = troe.getRateCoefficients(Tlist, Mlist=Mlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(K[i] / troe.getRateCoefficient(T, M=Mlist[i]), 1.0, 10)
+        
+        # The falloff expressions approach the high- and low-pressure limits
+        self.assertAlmostEqual(troe.getRateCoefficient(1000.0, 1.0e14) / arrheniusHigh.getRateCoefficient(1000.0), 1.0, 4)
+        self.assertAlmostEqual(lindemann.getRateCoefficient(1000.0, 1.0e-6) / thirdBody.getRateCoefficient(1000.0, 1.0e-6), 1.0, 4)
+        
+        # Zero values of T3 and T1 omit the corresponding terms of Fcent,
+        # which is also the limit as either approaches zero
+        for T3, T1 in [(0.0, 2941.0), (74.0, 0.0)]:
+            troe0 = TroeModel(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, alpha=0.783, T3=T3, T1=T1, T2=6964.0)
+            troe1 = TroeModel(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, alpha=0.783, T3=T3 or 1.0e-3, T1=T1 or 1.0e-3, T2=6964.0)
+            with numpy.errstate(divide='raise'):
+                K = troe0.getRateCoefficients(Tlist, Plist)
+            self.assertTrue(numpy.allclose(K, troe1.getRateCoefficients(Tlist, Plist), rtol=1e-12))
+            self.assertAlmostEqual(troe0.getRateCoefficient(1000.0, 1.0e5) / K[1,1], 1.0, 10)
+
+    def testTabulatedKinetics(self):
+        """
+        Tests that a tabulated kinetics model reproduces the model it
+        tabulates to within its estimated error, using linear or cubic
+        interpolation, falls back to exact evaluation outside the table or
+        when requested, and gives the same results when evaluated on arrays
+        or lists.
+        """
+        
+        coeffs = numpy.array([
+            [ 8.2,  0.4, -0.1],
+            [-1.5,  0.3,  0.05],
+            [-0.2,  0.1, -0.02],
+            [ 0.05, -0.01, 0.01],
+        ], numpy.float64)
+        chebyshev = ChebyshevModel(Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, coeffs=coeffs)
+        table = TabulatedKineticsModel(chebyshev, Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, Tcount=100, Pcount=20)
+        self.assertEqual(table.logK.shape, (100, 20))
+        self.assertTrue(0.0 < table.errorEstimate < 0.01)
+        
+        Tlist = numpy.linspace(300.0, 2000.0, 37)
+        Plist = numpy.logspace(3.0, 7.0, 23)
+        K = table.getRateCoefficients(Tlist, Plist)
+        K0 = chebyshev.getRateCoefficients(Tlist, Plist)
+        for i, T in enumerate(Tlist):
+            for j, P in enumerate(Plist):
+                self.assertTrue(abs(numpy.log(K[i,j] / K0[i,j])) <= 1.01 * table.errorEstimate)
+                self.assertAlmostEqual(table.getRateCoefficient(T, P) / K[i,j], 1.0, 10)
+        
+        # Lists of temperatures and pressures are interpolated in the table
+        # rather than passed on to the underlying model
+        class CountingChebyshevModel(ChebyshevModel):
+            calls = 0
+            def getRateCoefficients(self, Tlist, Plist=None):
+                CountingChebyshevModel.calls += 1
+                return ChebyshevModel.getRateCoefficients(self, Tlist, Plist)
+        table.model = CountingChebyshevModel(Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, coeffs=coeffs)
+        self.assertTrue(numpy.allclose(table.getRateCoefficients(list(Tlist), list(Plist)), K, rtol=1e-12))
+        self.assertEqual(CountingChebyshevModel.calls, 0)
+        table.getRateCoefficients(list(Tlist), [1.0e2, 1.0e5])
+        self.assertEqual(CountingChebyshevModel.calls, 1)
+        table.model = chebyshev
+        
+        # Cubic interpolation reproduces a Chebyshev polynomial of degree at
+        # most three in each direction exactly, even on a coarse grid
+        cubic = TabulatedKineticsModel(chebyshev, Tmin=300.0, Tmax=2000.0, Pmin=1.0e3, Pmax=1.0e7, Tcount=10, Pcount=5, interpolation='cubic')
+        self.assertTrue(cubic.errorEstimate < 1e-10)
+        K = cubic.getRateCoefficients(Tlist, Plist)
+        for i, T in enumerate(Tlist):
+            for j, P in enumerate(Plist):
+                self.assertAlmostEqual(K[i,j] / K0[i,j], 1.0, 10)
+                self.assertAlmostEqual(cubic.getRateCoefficient(T, P) / K[i,j], 1.0, 10)
+        self.assertRaises(InvalidKineticsModelError, TabulatedKineticsModel, chebyshev, Pcount=20, interpolation='quadratic')
+        self.assertRaises(InvalidKineticsModelError, TabulatedKineticsModel, chebyshev, Tcount=3, Pcount=20, interpolation='cubic')
+        
+        self.assertEqual(table.getRateCoefficient(250.0, 1.0e5), chebyshev.getRateCoefficient(250.0, 1.0e5))
+        table.exact = True
+        self.assertEqual(table.getRateCoefficient(1234.0, 1.0e5), chebyshev.getRateCoefficient(1234.0, 1.0e5))
+        
+        arrhenius = ArrheniusModel(A=1.0e10, n=1.5, Ea=50000.0, T0=1.0)
+        table = TabulatedKineticsModel(arrhenius, Tmin=300.0, Tmax=2000.0, Tcount=200)
+        klist = table.getRateCoefficients(Tlist)
+        klist0 = arrhenius.getRateCoefficients(Tlist)
+        for k, k0 in zip(klist, klist0):
+            self.assertTrue(abs(numpy.log(k / k0)) <= 1.01 * table.errorEstimate)
+        # Cubic interpolation is more accurate on a coarser grid
+        errorEstimate = table.errorEstimate
+        table = TabulatedKineticsModel(arrhenius, Tmin=300.0, Tmax=2000.0, Tcount=50, interpolation='cubic')
+        self.assertTrue(0.0 < table.errorEstimate < errorEstimate)
+        klist = table.getRateCoefficients(Tlist)
+        for T, k, k0 in zip(Tlist, klist, klist0):
+            self.assertTrue(abs(numpy.log(k / k0)) <= 2.0 * table.errorEstimate)
+            self.assertAlmostEqual(table.getRateCoefficient(T) / k, 1.0, 10)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main( testRunner = unittest.TextTestRunner(verbosity=2) )
@@ -6,8 +6,8 @@ import unittest
 import sys
 sys.path.append('.')
 
-from chempy.molecule import Molecule
-from chempy.pattern import MoleculePattern
+from chempy.molecule import Molecule, Atom, Bond
+from chempy.pattern import MoleculePattern, AtomPattern, atomTypes, getAtomType, assignAtomTypes
 
 ################################################################################
 
@@ -165,6 +165,136 @@ class MoleculeCheck(unittest.TestCase):
         """)
         pattern1.toAdjacencyList()
 
+    def testAtomTypes(self):
+        """
+        Check that the table-based atom type assignment for a full molecule
+        agrees with the per-atom lookup.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 C 0 {2,D} {3,S}
+        2 C 0 {1,D} {4,S}
+        3 O 0 {1,S} {5,D}
+        4 C 0 {2,S} {5,S} {6,T}
+        5 C 0 {3,D} {4,S}
+        6 C 0 {4,T}
+        7 C 0 {8,D}
+        8 O 0 {7,D}
+        """)
+        molecule.makeHydrogensExplicit()
+        assignAtomTypes(molecule)
+        for atom in molecule.atoms:
+            self.assertTrue(atom.atomType is getAtomType(atom, molecule.edges[atom]))
+        labels = [atom.atomType.label for atom in molecule.atoms[0:8]]
+        self.assertEqual(labels, ['Cd', 'Cd', 'Od', 'Ct', 'CO', 'Ct', 'CO', 'Od'])
+
+        # Hydrogen is always 'H' and untyped elements have no atom type, even
+        # for bond counts outside the lookup table
+        for element in ['H', 'N']:
+            molecule = Molecule()
+            center = Atom(element=element)
+            molecule.addAtom(center)
+            for i in range(5):
+                atom = Atom(element='C')
+                molecule.addAtom(atom)
+                molecule.addBond(center, atom, Bond(order='D'))
+            assignAtomTypes(molecule)
+            for atom in molecule.atoms:
+                atomType = getAtomType(atom, molecule.edges[atom])
+                self.assertTrue(atom.atomType is atomType)
+                if atom.symbol == 'C':
+                    self.assertEqual(atomType.label, 'Cd')
+                elif atom.symbol == 'H':
+                    self.assertEqual(atomType.label, 'H')
+                else:
+                    self.assertTrue(atomType is None)
+
+    def testAtomTypeMasks(self):
+        """
+        Check that the atom type bitmasks reproduce the atom type hierarchy,
+        both for single atom types and for atom patterns.
+        """
+        for atomType1 in atomTypes.values():
+            for atomType2 in atomTypes.values():
+                self.assertEqual(atomType1.isSpecificCaseOf(atomType2),
+                    atomType1 is atomType2 or atomType1 in atomType2.specific)
+                self.assertEqual(atomType1.equivalent(atomType2),
+                    atomType1 is atomType2 or atomType1 in atomType2.specific or atomType2 in atomType1.specific)
+        pattern1 = AtomPattern(['Cd','Os'], [0], [1], [0])
+        pattern2 = AtomPattern(['C','O'], [0], [1], [0])
+        pattern3 = AtomPattern(['R!H'], [0], [1], [0])
+        pattern4 = AtomPattern(['H'], [0], [1], [0])
+        self.assertTrue(pattern1.isSpecificCaseOf(pattern2))
+        self.assertFalse(pattern2.isSpecificCaseOf(pattern1))
+        self.assertTrue(pattern2.isSpecificCaseOf(pattern3))
+        self.assertTrue(pattern1.equivalent(pattern3))
+        self.assertFalse(pattern4.equivalent(pattern3))
+
+    def testResonanceIsomers(self):
+        """
+        Check the generation of resonance isomers for the benzyl radical,
+        which has three unique isomers once the two ortho positions are
+        recognized as equivalent.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 C 0 {2,D} {6,S} {7,S}
+        2 C 0 {1,D} {3,S}
+        3 C 0 {2,S} {4,D}
+        4 C 0 {3,D} {5,S}
+        5 C 0 {4,S} {6,D}
+        6 C 0 {5,D} {1,S}
+        7 C 1 {1,S}
+        """)
+        isomers, explored = molecule.generateResonanceIsomers()
+        self.assertEqual(len(isomers), 3)
+        self.assertTrue(isomers[0] is molecule)
+        self.assertTrue(explored >= len(isomers))
+        for isomer in isomers[1:]:
+            self.assertFalse(isomer.isIsomorphic(molecule))
+        self.assertFalse(isomers[1].isIsomorphic(isomers[2]))
+
+    def testLabeledAtoms(self):
+        """
+        Check that the labeled atom lookups follow changes to the atom labels
+        and to the atoms in the molecule.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 *1 C 1 {2,S}
+        2 *2 C 0 {1,S} {3,D}
+        3 *2 C 0 {2,D} {4,S}
+        4 C 0 {3,S}
+        """)
+        atom1, atom2, atom3, atom4 = molecule.atoms
+        labeled = molecule.getLabeledAtoms()
+        self.assertTrue(labeled['*1'] is atom1)
+        self.assertEqual(labeled['*2'], [atom2, atom3])
+        self.assertFalse(molecule.containsLabeledAtom('*3'))
+        labelIndex = molecule.labelIndex
+        atom4.label = '*3'
+        self.assertTrue(molecule.getLabeledAtom('*3') is atom4)
+        self.assertTrue(molecule.labelIndex is labelIndex)
+        molecule.removeAtom(atom4)
+        self.assertFalse(molecule.containsLabeledAtom('*3'))
+        atom4.label = '*4'
+        self.assertFalse(molecule.containsLabeledAtom('*4'))
+
+        # Replacing the atoms or sharing them with another molecule must not
+        # leave a stale index
+        atom5 = Atom(element='C', label='*5')
+        self.assertFalse(molecule.containsLabeledAtom('*5'))
+        molecule.atoms = molecule.atoms + [atom5]
+        self.assertTrue(molecule.getLabeledAtom('*5') is atom5)
+        other = Molecule(atoms=molecule.atoms[:], bonds=molecule.bonds)
+        self.assertTrue(other.getLabeledAtom('*1') is atom1)
+        atom1.label = '*6'
+        self.assertTrue(other.getLabeledAtom('*6') is atom1)
+        self.assertTrue(molecule.getLabeledAtom('*6') is atom1)
+        self.assertFalse(molecule.containsLabeledAtom('*1'))
+        self.assertFalse(other.containsLabeledAtom('*1'))
+        atom1.label = '*1'
+        molecule.clearLabeledAtoms()
+        self.assertEqual(molecule.getLabeledAtoms(), {})
+        self.assertTrue(molecule.getLabeledAtom('*1') is None)
+
     def testSSSR(self):
         """
         Check the graph's Smallest Set of Smallest Rings function
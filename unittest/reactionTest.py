@@ -9,7 +9,7 @@ sys.path.append('.')
 from chempy.species import Species, TransitionState
 from chempy.reaction import *
 from chempy.states import *
-from chempy.kinetics import ArrheniusModel
+from chempy.kinetics import ArrheniusModel, ThirdBodyModel, TroeModel
 from chempy.thermo import WilhoitModel
 
 ################################################################################
@@ -74,6 +74,155 @@ class ReactionTest(unittest.TestCase):
             self.assertAlmostEqual(Kclist[i] / Kclist0[i], 1.0, 4)
             self.assertAlmostEqual(Kplist[i] / Kplist0[i], 1.0, 4)
 
+        # A list of temperatures should give the same results as an array
+        self.assertTrue(numpy.allclose(reaction.getEnthalpiesOfReaction(list(Tlist)), Hlist, rtol=1e-12))
+        self.assertTrue(numpy.allclose(reaction.getEntropiesOfReaction(list(Tlist)), Slist, rtol=1e-12))
+        self.assertTrue(numpy.allclose(reaction.getFreeEnergiesOfReaction(list(Tlist)), Glist, rtol=1e-12))
+        self.assertTrue(numpy.allclose(reaction.getEquilibriumConstants(list(Tlist), type='Kc'), Kclist, rtol=1e-12))
+
+    def testReverseRateCoefficients(self):
+        """
+        Tests that generating the reverse rate coefficients for a whole
+        reaction model at once agrees with generating them one reaction at a
+        time, using the reactions acetyl + oxygen <=> acetylperoxy and
+        acetylperoxy + acetyl <=> 2 acetyl + oxygen.
+        """
+        
+        acetylperoxy = Species(
+            index=1,
+            label='acetylperoxy',
+            thermo=WilhoitModel(cp0=4.0*constants.R, cpInf=21.0*constants.R, a0=-3.95, a1=9.26, a2=-15.6, a3=8.55, B=500.0, H0=-6.151e+04, S0=-790.2),
+        )
+        acetyl = Species(
+            index=2,
+            label='acetyl',
+            thermo=WilhoitModel(cp0=4.0*constants.R, cpInf=15.5*constants.R, a0=0.2541, a1=-0.4712, a2=-4.434, a3=2.25, B=500.0, H0=-1.439e+05, S0=-524.6),
+        )
+        oxygen = Species(
+            index=3,
+            label='oxygen',
+            thermo=WilhoitModel(cp0=3.5*constants.R, cpInf=4.5*constants.R, a0=-0.9324, a1=26.18, a2=-70.47, a3=44.12, B=500.0, H0=1.453e+04, S0=-12.19),
+        )
+        reactions = [
+            Reaction(index=2, reactants=[acetyl, oxygen], products=[acetylperoxy], kinetics=ArrheniusModel(A=2.65e6, n=0.0, Ea=0.0, T0=1.0)),
+            Reaction(index=1, reactants=[acetylperoxy, acetyl], products=[acetyl, acetyl, oxygen], kinetics=ArrheniusModel(A=1.0e13, n=0.5, Ea=120000.0, T0=298.15)),
+        ]
+        model = ReactionModel(species=[acetylperoxy, acetyl, oxygen], reactions=reactions)
+        
+        Tlist = numpy.arange(300.0, 2001.0, 100.0, numpy.float64)
+        reverse = model.generateReverseRateCoefficients(Tlist)
+        self.assertEqual(len(reverse), len(reactions))
+        for reaction in reactions:
+            kr0 = reaction.generateReverseRateCoefficient(Tlist)
+            kr = reverse[reaction.index - 1]
+            self.assertEqual(kr.T0, reaction.kinetics.T0)
+            self.assertAlmostEqual(kr.A / kr0.A, 1.0, 6)
+            self.assertAlmostEqual(kr.n, kr0.n, 6)
+            self.assertAlmostEqual(kr.Ea, kr0.Ea, 3)
+
+    def testReactionRates(self):
+        """
+        Tests that evaluating the rates of all reactions in a reaction model
+        at once agrees with evaluating them one reaction at a time, and that
+        the net rates of production of the species and their Jacobian follow,
+        using the reactions acetyl + oxygen <=> acetylperoxy, acetylperoxy
+        (+M) <=> acetyl + oxygen (+M), and acetylperoxy + acetyl <=> 2 acetyl
+        + oxygen.
+        """
+        
+        acetylperoxy = Species(
+            index=3,
+            label='acetylperoxy',
+            thermo=WilhoitModel(cp0=4.0*constants.R, cpInf=21.0*constants.R, a0=-3.95, a1=9.26, a2=-15.6, a3=8.55, B=500.0, H0=-6.151e+04, S0=-790.2),
+        )
+        acetyl = Species(
+            index=1,
+            label='acetyl',
+            thermo=WilhoitModel(cp0=4.0*constants.R, cpInf=15.5*constants.R, a0=0.2541, a1=-0.4712, a2=-4.434, a3=2.25, B=500.0, H0=-1.439e+05, S0=-524.6),
+        )
+        oxygen = Species(
+            index=2,
+            label='oxygen',
+            thermo=WilhoitModel(cp0=3.5*constants.R, cpInf=4.5*constants.R, a0=-0.9324, a1=26.18, a2=-70.47, a3=44.12, B=500.0, H0=1.453e+04, S0=-12.19),
+        )
+        reactions = [
+            Reaction(index=3, reactants=[acetyl, oxygen], products=[acetylperoxy], kinetics=ArrheniusModel(A=2.65e6, n=0.0, Ea=0.0, T0=1.0)),
+            Reaction(index=1, reactants=[acetylperoxy], products=[acetyl, oxygen], kinetics=ArrheniusModel(A=1.0e10, n=0.0, Ea=100000.0, T0=1.0), thirdBody=True),
+            Reaction(index=2, reactants=[acetylperoxy, acetyl], products=[acetyl, acetyl, oxygen], kinetics=ThirdBodyModel(arrheniusLow=ArrheniusModel(A=1.0e7, n=0.5, Ea=120000.0, T0=298.15), efficiencies={oxygen: 2.5})),
+        ]
+        model = ReactionModel(species=[acetylperoxy, acetyl, oxygen], reactions=reactions)
+        
+        T = 1000.0; P = 1.0e5
+        conc = {acetyl: 2.0, oxygen: 5.0, acetylperoxy: 0.5}
+        rates = model.getReactionRates(T, P, numpy.array([2.0, 5.0, 0.5], numpy.float64))
+        for reaction in reactions:
+            self.assertAlmostEqual(rates[reaction.index - 1] / reaction.getRate(T, P, conc), 1.0, 10)
+        rates = model.getReactionRates(T, P, conc)
+        for reaction in reactions:
+            self.assertAlmostEqual(rates[reaction.index - 1] / reaction.getRate(T, P, conc), 1.0, 10)
+
+        # The equilibrium constants should agree with those of each reaction,
+        # and be reused at the same temperature but not at a different one
+        for T0 in [T, 500.0]:
+            Kc = model.getEquilibriumConstants(T0)
+            for reaction in reactions:
+                self.assertAlmostEqual(Kc[reaction.index - 1] / reaction.getEquilibriumConstant(T0), 1.0, 10)
+            self.assertTrue(model.getEquilibriumConstants(T0) is Kc)
+            self.assertTrue(model.getFreeEnergies(T0) is model.getFreeEnergies(T0))
+
+        # The stoichiometry matrix should be in compressed-sparse-row format
+        # and give the net rates of production of each species
+        model.generateStoichiometryMatrix()
+        self.assertEqual(model.stoichiometry.format, 'csr')
+        self.assertEqual(model.stoichiometryTranspose.format, 'csc')
+        production = model.getNetProductionRates(T, P, conc)
+        for spec in model.species:
+            for reaction in reactions:
+                self.assertEqual(model.stoichiometry[spec.index - 1, reaction.index - 1], reaction.getStoichiometricCoefficient(spec))
+                self.assertEqual(model.stoichiometryTranspose[reaction.index - 1, spec.index - 1], reaction.getStoichiometricCoefficient(spec))
+            rate = sum([reaction.getStoichiometricCoefficient(spec) * reaction.getRate(T, P, conc) for reaction in reactions])
+            self.assertAlmostEqual(production[spec.index - 1] / rate, 1.0, 10)
+        
+        # The analytical Jacobian should agree with finite differences
+        C = numpy.array([2.0, 5.0, 0.5], numpy.float64)
+        jacobian = model.getJacobian(T, P, C).toarray()
+        for i in range(len(C)):
+            dC = numpy.zeros_like(C); dC[i] = 1.0e-6 * C[i]
+            dfdC = (model.getNetProductionRates(T, P, C + dC) - model.getNetProductionRates(T, P, C - dC)) / (2 * dC[i])
+            for j in range(len(C)):
+                self.assertAlmostEqual(jacobian[j,i] / dfdC[j], 1.0, 5)
+
+        # Adding a falloff reaction and regenerating the reaction indices
+        # should also regenerate the Jacobian sparsity pattern; the derivative
+        # of the falloff rate coefficient with respect to the third-body
+        # concentration is evaluated by finite difference
+        reaction = Reaction(index=4, reactants=[acetylperoxy], products=[acetyl, oxygen], kinetics=TroeModel(
+            arrheniusHigh=ArrheniusModel(A=1.0e13, n=0.0, Ea=150000.0, T0=1.0),
+            arrheniusLow=ArrheniusModel(A=1.0e12, n=0.0, Ea=150000.0, T0=1.0),
+            alpha=0.5, T3=100.0, T1=1000.0, efficiencies={oxygen: 2.0},
+        ))
+        reactions.append(reaction)
+        model.generateReactionIndices()
+        self.assertTrue(model.jacobianMap is None)
+        rates = model.getReactionRates(T, P, conc)
+        self.assertAlmostEqual(rates[reaction.index - 1] / reaction.getRate(T, P, conc), 1.0, 10)
+        jacobian = model.getJacobian(T, P, C).toarray()
+        for i in range(len(C)):
+            dC = numpy.zeros_like(C); dC[i] = 1.0e-6 * C[i]
+            dfdC = (model.getNetProductionRates(T, P, C + dC) - model.getNetProductionRates(T, P, C - dC)) / (2 * dC[i])
+            for j in range(len(C)):
+                self.assertAlmostEqual(jacobian[j,i] / dfdC[j], 1.0, 5)
+
+        # A compact copy of the model, without the reactions and with new
+        # species, should survive pickling and give the same rates and Jacobian
+        import cPickle
+        compact = cPickle.loads(cPickle.dumps(model.generateCompactModel(), 2))
+        self.assertEqual(compact.reactions, [])
+        self.assertEqual([spec.label for spec in compact.species], [spec.label for spec in model.species])
+        self.assertFalse(any([spec in model.species for spec in compact.species]))
+        self.assertTrue(numpy.allclose(compact.getNetProductionRates(T, P, C), model.getNetProductionRates(T, P, C), rtol=1e-12))
+        self.assertTrue(numpy.allclose(compact.getJacobian(T, P, C).toarray(), jacobian, rtol=1e-12))
+
     def testTSTCalculation(self):
         """
         A test of the transition state theory k(T) calculation function,
@@ -112,6 +261,20 @@ class ReactionTest(unittest.TestCase):
         arrhenius = ArrheniusModel().fitToData(Tlist, klist)
         klist2 = arrhenius.getRateCoefficients(Tlist)
 
+        # Check that evaluating the forward and reverse reactions together
+        # agrees with evaluating them one at a time
+        reaction.index = 1
+        reverse = Reaction(index=2, reactants=[ethyl], products=[hydrogen, ethylene], transitionState=TS)
+        model = ReactionModel(species=[hydrogen, ethylene, ethyl], reactions=[reverse, reaction])
+        for tunneling in ['', 'Wigner', 'Eckart']:
+            kmatrix = model.calculateTSTRateCoefficients(Tlist, tunneling)
+            self.assertEqual(kmatrix.shape, (2, len(Tlist)))
+            for rxn in model.reactions:
+                for i in range(0, len(Tlist), 10):
+                    self.assertAlmostEqual(kmatrix[rxn.index - 1,i] / rxn.calculateTSTRateCoefficient(Tlist[i], tunneling), 1.0, 10)
+            # Lists of temperatures are also accepted
+            self.assertTrue(numpy.allclose(reaction.calculateTSTRateCoefficients(list(Tlist), tunneling), kmatrix[reaction.index - 1], rtol=1e-12))
+
         # Check that the correct Arrhenius parameters are returned
         self.assertAlmostEqual(arrhenius.A/458.87, 1.0, 2)
         self.assertAlmostEqual(arrhenius.n/0.978, 1.0, 2)
@@ -119,6 +282,26 @@ class ReactionTest(unittest.TestCase):
         # Check that the fit is satisfactory
         for i in range(len(Tlist)):
             self.assertTrue(abs(1 - klist2[i] / klist[i]) < 0.01)
+
+    def testEckartTunnelingCorrection(self):
+        """
+        Tests the Eckart tunneling correction for the reaction H + C2H4 ->
+        C2H5, with the actual imaginary frequency of the transition state and
+        with a larger one, against values computed by adaptive quadrature.
+        """
+
+        hydrogen = Species(E0=-1318675.56138)
+        ethylene = Species(E0=-205882860.949)
+        ethyl = Species(E0=-207340036.867)
+
+        Tlist = numpy.array([300.0, 500.0, 1000.0, 2000.0], numpy.float64)
+        for frequency, kappalist0 in [(-309.3437, [1.0961, 1.0337, 1.0084, 1.0022]), (-1500.0, [4.8376, 1.8579, 1.1847, 1.0465])]:
+            TS = TransitionState(E0=-207188826.467, frequency=frequency)
+            reaction = Reaction(reactants=[hydrogen, ethylene], products=[ethyl], transitionState=TS)
+            kappalist = reaction.calculateEckartTunnelingCorrections(Tlist)
+            for i in range(len(Tlist)):
+                self.assertAlmostEqual(kappalist[i] / kappalist0[i], 1.0, 4)
+                self.assertAlmostEqual(reaction.calculateEckartTunnelingCorrection(Tlist[i]) / kappalist[i], 1.0, 12)
         
         
 if __name__ == '__main__':
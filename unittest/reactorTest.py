@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy
+import unittest
+import sys
+sys.path.append('.')
+
+from chempy.species import Species
+from chempy.reaction import Reaction, ReactionModel
+from chempy.reactor import *
+from chempy.kinetics import ArrheniusModel
+from chempy.thermo import WilhoitModel
+import chempy.constants as constants
+
+################################################################################
+
+class ReactorTest(unittest.TestCase):
+    """
+    Contains unit tests for the chempy.reactor module, used for simulating
+    reaction models in time.
+    """
+
+    def setUp(self):
+        """
+        Create a reaction model containing the reversible isomerization
+        A <=> B and the (effectively irreversible) decomposition B -> C + D.
+        """
+        self.species = [
+            Species(index=i+1, label=label, thermo=WilhoitModel(cp0=4.0*constants.R, cpInf=10.0*constants.R, a0=0.0, a1=0.0, a2=0.0, a3=0.0, B=500.0, H0=H0, S0=0.0))
+            for i, (label, H0) in enumerate([('A', 0.0), ('B', -5000.0), ('C', -200000.0), ('D', -200000.0)])
+        ]
+        A, B, C, D = self.species
+        self.isomerization = Reaction(index=1, reactants=[A], products=[B], kinetics=ArrheniusModel(A=10.0, n=0.0, Ea=0.0, T0=1.0))
+        self.decomposition = Reaction(index=2, reactants=[B], products=[C, D], kinetics=ArrheniusModel(A=1.0, n=0.0, Ea=0.0, T0=1.0))
+        self.T = 1000.0; self.P = 1.0e5
+        self.Ctot = self.P / constants.R / self.T
+
+    def testIsomerization(self):
+        """
+        Tests the simulation of the reversible isomerization A <=> B against
+        the analytical solution, including termination on conversion.
+        """
+        model = ReactionModel(species=self.species[0:2], reactions=[self.isomerization])
+        kf = self.isomerization.kinetics.getRateCoefficient(self.T)
+        kr = kf / self.isomerization.getEquilibriumConstant(self.T)
+        C0 = numpy.array([self.Ctot, 0.0], numpy.float64)
+        Aeq = self.Ctot * kr / (kf + kr)
+
+        for method in ['BDF', 'LSODA']:
+            reactor = BatchReactor(model=model, T=self.T, P=self.P, method=method, rtol=1.0e-8, atol=1.0e-14)
+            outputTimes = numpy.linspace(0.0, 0.5, 11)
+            tlist, Clist = reactor.simulate(C0, 0.5, outputTimes)
+            self.assertEqual(list(tlist), list(outputTimes))
+            for t, C in zip(tlist, Clist):
+                self.assertAlmostEqual(C[0] / (Aeq + (self.Ctot - Aeq) * numpy.exp(-(kf + kr) * t)), 1.0, 4)
+                self.assertAlmostEqual(numpy.sum(C) / self.Ctot, 1.0, 6)
+
+            # Terminate at 50% conversion of A
+            tlist, Clist = reactor.simulate(C0, 0.5, outputTimes, terminationConversion={self.species[0]: 0.5})
+            t50 = -numpy.log((0.5 * self.Ctot - Aeq) / (self.Ctot - Aeq)) / (kf + kr)
+            self.assertAlmostEqual(tlist[-1] / t50, 1.0, 4)
+            self.assertAlmostEqual(Clist[-1,0] / (0.5 * self.Ctot), 1.0, 4)
+            self.assertTrue(numpy.all(tlist[:-1] < t50))
+
+    def testIsobaricDecomposition(self):
+        """
+        Tests that an isobaric simulation of A <=> B -> C + D keeps the total
+        concentration constant, and that the snapshot generator advances in
+        time.
+        """
+        model = ReactionModel(species=self.species, reactions=[self.isomerization, self.decomposition])
+        reactor = BatchReactor(model=model, T=self.T, P=self.P)
+        C0 = numpy.array([self.Ctot, 0.0, 0.0, 0.0], numpy.float64)
+
+        times = []
+        for t, C in reactor.generateSnapshots(C0, 5.0, stride=5):
+            times.append(t)
+            self.assertAlmostEqual(numpy.sum(C) / self.Ctot, 1.0, 5)
+        self.assertEqual(times[0], 0.0)
+        self.assertEqual(times[-1], 5.0)
+        self.assertTrue(all([t1 < t2 for t1, t2 in zip(times[:-1], times[1:])]))
+
+        # At the end nearly all of A has decomposed into equal amounts of C and D
+        self.assertTrue(C[0] < 0.01 * self.Ctot)
+        self.assertAlmostEqual(C[2] / C[3], 1.0, 6)
+
+        # The Jacobian should agree with finite differences of the right-hand
+        # side, whose net rates of production it reuses at the same state
+        C = numpy.array([0.4, 0.3, 0.2, 0.1], numpy.float64) * self.Ctot
+        for i in range(len(C)):
+            dC = numpy.zeros_like(C); dC[i] = 1.0e-6 * C[i]
+            dfdC = (reactor.getRightHandSide(0.0, C + dC) - reactor.getRightHandSide(0.0, C - dC)) / (2 * dC[i])
+            jacobian = reactor.getJacobian(0.0, C).toarray()
+            for j in range(len(C)):
+                self.assertAlmostEqual(jacobian[j,i], dfdC[j], 6)
+
+    def testSimulateConditions(self):
+        """
+        Tests that a parallel sweep over temperature and pressure returns each
+        condition once, with the same results as simulating it directly.
+        """
+        model = ReactionModel(species=self.species, reactions=[self.isomerization, self.decomposition])
+        outputTimes = numpy.linspace(0.0, 1.0, 6)
+        conditions = []
+        for T in [800.0, 1000.0, 1200.0]:
+            for P in [1.0e5, 1.0e6]:
+                Ctot = P / constants.R / T
+                conditions.append((T, P, [Ctot, 0.0, 0.0, 0.0]))
+
+        for processes in [1, 2]:
+            indices = []
+            for index, tlist, Clist, elapsed in simulateConditions(model, conditions, 1.0, outputTimes, processes=processes, rtol=1.0e-8, atol=1.0e-14):
+                indices.append(index)
+                self.assertTrue(elapsed >= 0.0)
+                T, P, C0 = conditions[index]
+                reactor = BatchReactor(model=model, T=T, P=P, rtol=1.0e-8, atol=1.0e-14)
+                tlist0, Clist0 = reactor.simulate(numpy.array(C0), 1.0, outputTimes)
+                self.assertEqual(list(tlist), list(tlist0))
+                for C, C0 in zip(Clist.flat, Clist0.flat):
+                    self.assertAlmostEqual(C, C0, 8)
+            self.assertEqual(sorted(indices), range(len(conditions)))
+
+        # The species in the termination conversions are mapped onto the
+        # compact copy of the model sent to the workers
+        A = self.species[0]
+        for index, tlist, Clist, elapsed in simulateConditions(model, conditions[:2], 1.0, outputTimes, terminationConversion={A: 0.5}, processes=2):
+            T, P, C0 = conditions[index]
+            self.assertTrue(tlist[-1] < 1.0)
+            self.assertAlmostEqual(Clist[-1,0] / C0[0], 0.5, 6)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main( testRunner = unittest.TextTestRunner(verbosity=2) )
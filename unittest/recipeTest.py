@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import sys
+sys.path.append('.')
+
+from chempy.molecule import Molecule
+from chempy.exception import ChemPyError
+from chempy.recipe import ReactionRecipe
+
+################################################################################
+
+class RecipeCheck(unittest.TestCase):
+
+    def testChangeBond(self):
+        """
+        Check the application of a recipe that shifts the radical center of
+        an allyl radical, and that the reactant is unchanged afterwards.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 *1 C 1 {2,S}
+        2 *2 C 0 {1,S} {3,D}
+        3 *3 C 0 {2,D}
+        """)
+        recipe = ReactionRecipe([
+            ['CHANGE_BOND', '*1', 1, '*2'],
+            ['CHANGE_BOND', '*2', -1, '*3'],
+            ['LOSE_RADICAL', '*1', 1],
+            ['GAIN_RADICAL', '*3', 1],
+        ])
+        product = recipe.generateProduct(molecule)
+        atom1, atom2, atom3 = product.atoms
+        self.assertEqual(product.getBond(atom1, atom2).order, 'D')
+        self.assertEqual(product.getBond(atom2, atom3).order, 'S')
+        self.assertEqual([atom.radicalElectrons for atom in product.atoms], [0, 0, 1])
+        self.assertEqual([atom.atomType.label for atom in product.atoms], ['Cd', 'Cd', 'Cs'])
+
+        atom1, atom2, atom3 = molecule.atoms
+        self.assertEqual(molecule.getBond(atom1, atom2).order, 'S')
+        self.assertEqual(molecule.getBond(atom2, atom3).order, 'D')
+        self.assertEqual([atom.radicalElectrons for atom in molecule.atoms], [1, 0, 0])
+        self.assertEqual([atom.atomType.label for atom in molecule.atoms], ['Cs', 'Cd', 'Cd'])
+
+    def testIntermediateAtomTypes(self):
+        """
+        Check the application of a recipe that converts a propargyl radical to
+        an allenyl radical, which passes through an intermediate state whose
+        central atom has no atom type.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 *1 C 1 {2,S}
+        2 *2 C 0 {1,S} {3,T}
+        3 *3 C 0 {2,T}
+        """)
+        recipe = ReactionRecipe([
+            ['CHANGE_BOND', '*1', 1, '*2'],
+            ['CHANGE_BOND', '*2', -1, '*3'],
+            ['LOSE_RADICAL', '*1', 1],
+            ['GAIN_RADICAL', '*3', 1],
+        ])
+        product = recipe.generateProduct(molecule)
+        atom1, atom2, atom3 = product.atoms
+        self.assertEqual(product.getBond(atom1, atom2).order, 'D')
+        self.assertEqual(product.getBond(atom2, atom3).order, 'D')
+        self.assertEqual([atom.radicalElectrons for atom in product.atoms], [0, 0, 1])
+        self.assertEqual([atom.atomType.label for atom in product.atoms], ['Cd', 'Cdd', 'Cd'])
+        self.assertEqual([atom.atomType.label for atom in molecule.atoms], ['Cs', 'Ct', 'Ct'])
+
+    def testFormAndBreakBond(self):
+        """
+        Check the in-place application and undo of a ring-closing recipe on a
+        biradical, using an explicit mapping of labels to atoms.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 C 1 {2,S}
+        2 C 0 {1,S} {3,S}
+        3 C 0 {2,S} {4,S}
+        4 C 1 {3,S}
+        """)
+        atom1, atom2, atom3, atom4 = molecule.atoms
+        recipe = ReactionRecipe([
+            ['FORM_BOND', '*1', 'S', '*2'],
+            ['LOSE_RADICAL', '*1', 1],
+            ['LOSE_RADICAL', '*2', 1],
+        ])
+        log = recipe.applyForward(molecule, {'*1': atom1, '*2': atom4})
+        self.assertTrue(molecule.hasBond(atom1, atom4))
+        self.assertTrue(molecule.isCyclic())
+        self.assertEqual(atom1.radicalElectrons, 0)
+        self.assertEqual(atom4.radicalElectrons, 0)
+        recipe.undo(molecule, log)
+        self.assertFalse(molecule.hasBond(atom1, atom4))
+        self.assertEqual(atom1.radicalElectrons, 1)
+        self.assertEqual(atom4.radicalElectrons, 1)
+
+    def testInvalidAction(self):
+        """
+        Check that a failed recipe leaves the molecule unchanged.
+        """
+        molecule = Molecule().fromAdjacencyList("""
+        1 *1 C 0 {2,S}
+        2 *2 C 0 {1,S}
+        """)
+        recipe = ReactionRecipe([
+            ['CHANGE_BOND', '*1', 1, '*2'],
+            ['LOSE_RADICAL', '*1', 1],
+        ])
+        self.assertRaises(ChemPyError, recipe.applyForward, molecule)
+        atom1, atom2 = molecule.atoms
+        self.assertEqual(molecule.getBond(atom1, atom2).order, 'S')
+        self.assertEqual([atom.atomType.label for atom in molecule.atoms], ['Cs', 'Cs'])
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main( testRunner = unittest.TextTestRunner(verbosity=2) )
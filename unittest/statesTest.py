@@ -170,6 +170,44 @@ class StatesTest(unittest.TestCase):
         #pylab.plot(Tlist, S1, '-r', Tlist, S2, '-b')
         #pylab.show()
 
+    def testPartitionFunctions(self):
+        """
+        Test that evaluating the partition functions of each mode and of a
+        states model, and their logarithms, at many temperatures at once
+        agrees with evaluating them one temperature at a time.
+        """
+        fourier = numpy.array([ [-4.683e-01, 8.767e-05], [-2.827e+00, 1.048e-03], [ 1.751e-01,-9.278e-05], [-1.355e-02, 1.916e-06], [-1.128e-01, 1.025e-04] ], numpy.float64) * 4184
+        modes = [
+            Translation(mass=0.02803),
+            RigidRotor(linear=False, inertia=[5.6952e-47, 2.7758e-46, 3.3454e-46], symmetry=1),
+            RigidRotor(linear=True, inertia=[1.9271e-46], symmetry=2),
+            HarmonicOscillator(frequencies=[834.50, 973.31, 975.37, 1067.1, 1238.5, 1379.5, 1472.3, 1691.3, 3121.6, 3136.7, 3192.5, 3221.0]),
+            HinderedRotor(inertia=7.38359/6.022e46, barrier=2139.3*11.96, symmetry=2),
+            HinderedRotor(inertia=7.38359/6.022e46, barrier=3.20429*4184, symmetry=1, fourier=fourier),
+        ]
+        statesList = [
+            StatesModel(modes=[modes[0], modes[1], modes[3], modes[4]], spinMultiplicity=2),
+            StatesModel(modes=[modes[3], modes[5]], spinMultiplicity=1),
+        ]
+
+        Tlist = numpy.arange(100.0, 3001.0, 100.0, numpy.float64)
+        for model in modes + statesList:
+            Qlist = model.getPartitionFunctions(Tlist)
+            logQlist = model.getLogPartitionFunctions(Tlist)
+            for i in range(len(Tlist)):
+                self.assertAlmostEqual(Qlist[i] / model.getPartitionFunction(Tlist[i]), 1.0, 6)
+                self.assertAlmostEqual(logQlist[i], numpy.log(Qlist[i]), 6)
+                self.assertAlmostEqual(model.getLogPartitionFunction(Tlist[i]), logQlist[i], 6)
+            # Lists of temperatures are also accepted
+            self.assertTrue(numpy.allclose(model.getPartitionFunctions(list(Tlist)), Qlist, rtol=1e-12))
+            self.assertTrue(numpy.allclose(model.getLogPartitionFunctions(list(Tlist)), logQlist, rtol=1e-12))
+
+        # The logarithm of the partition function remains finite even when the
+        # partition function itself overflows
+        vib = HarmonicOscillator(frequencies=[50.0 for i in range(300)])
+        self.assertAlmostEqual(vib.getLogPartitionFunction(3000.0) / (-300 * numpy.log(1 - numpy.exp(-50.0 / 0.695039 / 3000.0))), 1.0, 10)
+        self.assertTrue(numpy.isfinite(StatesModel(modes=[vib]).getLogPartitionFunctions(Tlist)).all())
+
     def testDensityOfStatesILT(self):
         """
         Test that the density of states as obtained via inverse Laplace
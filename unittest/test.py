@@ -6,8 +6,11 @@ import unittest
 from gaussianTest import *
 from geometryTest import *
 from graphTest import *
+from kineticsTest import *
 from moleculeTest import *
 from reactionTest import *
+from reactorTest import *
+from recipeTest import *
 from statesTest import *
 from thermoTest import *
 
@@ -41,6 +41,44 @@ class ThermoTest(unittest.TestCase):
             self.assertAlmostEqual( Hlist[i] /  Hlist0[i], 1.0, 4)
             self.assertAlmostEqual( Slist[i] /  Slist0[i], 1.0, 4)
             self.assertAlmostEqual( Glist[i] /  Glist0[i], 1.0, 4)
+            self.assertAlmostEqual(Cplist[i] / wilhoit.getHeatCapacity(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Hlist[i] /  wilhoit.getEnthalpy(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Slist[i] /  wilhoit.getEntropy(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Glist[i] /  wilhoit.getFreeEnergy(Tlist[i]), 1.0, 12)
+
+        # A list of temperatures should give the same results as an array
+        for method, values in [(wilhoit.getHeatCapacities, Cplist), (wilhoit.getEnthalpies, Hlist), (wilhoit.getEntropies, Slist), (wilhoit.getFreeEnergies, Glist)]:
+            self.assertTrue(numpy.allclose(method(list(Tlist)), values, rtol=1e-12))
+
+    def testNASA(self):
+        """
+        Tests that evaluating the NASA thermodynamics model functions at many
+        temperatures at once agrees with evaluating them one at a time, using
+        the GRI-Mech 3.0 polynomials for methane.
+        """
+
+        nasa = NASAModel(Tmin=200.0, Tmax=3500.0, polynomials=[
+            NASAPolynomial(Tmin=200.0, Tmax=1000.0, coeffs=[5.14987613E+00, -1.36709788E-02, 4.91800599E-05, -4.84743026E-08, 1.66693956E-11, -1.02466476E+04, -4.64130376E+00]),
+            NASAPolynomial(Tmin=1000.0, Tmax=3500.0, coeffs=[7.48514950E-02, 1.33909467E-02, -5.73285809E-06, 1.22292535E-09, -1.01815230E-13, -9.46834459E+03, 1.84373180E+01]),
+        ])
+
+        Tlist = numpy.arange(200.0, 3501.0, 100.0, numpy.float64)
+        Cplist = nasa.getHeatCapacities(Tlist)
+        Hlist = nasa.getEnthalpies(Tlist)
+        Slist = nasa.getEntropies(Tlist)
+        Glist = nasa.getFreeEnergies(Tlist)
+
+        for i in range(len(Tlist)):
+            self.assertAlmostEqual(Cplist[i] / nasa.getHeatCapacity(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Hlist[i] /  nasa.getEnthalpy(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Slist[i] /  nasa.getEntropy(Tlist[i]), 1.0, 12)
+            self.assertAlmostEqual( Glist[i] /  nasa.getFreeEnergy(Tlist[i]), 1.0, 12)
+
+        # A list of temperatures should give the same results as an array
+        for method, values in [(nasa.getHeatCapacities, Cplist), (nasa.getEnthalpies, Hlist), (nasa.getEntropies, Slist), (nasa.getFreeEnergies, Glist)]:
+            self.assertTrue(numpy.allclose(method(list(Tlist)), values, rtol=1e-12))
+
+        self.assertRaises(ThermoError, nasa.getEnthalpies, numpy.array([300.0, 4000.0], numpy.float64))
 
 if __name__ == '__main__':
     unittest.main( testRunner = unittest.TextTestRunner(verbosity=2) )